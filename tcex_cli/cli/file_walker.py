@@ -0,0 +1,82 @@
+"""TcEx Framework Module"""
+
+# standard library
+import fnmatch
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+
+class PathMatcher:
+    """Match relative paths against glob patterns using a single precompiled regex."""
+
+    def __init__(self, patterns: Iterable[str | Path]):
+        """Initialize instance properties."""
+        patterns_ = [str(p) for p in patterns]
+        self.regex = (
+            re.compile('|'.join(fnmatch.translate(p) for p in patterns_)) if patterns_ else None
+        )
+
+    def match(self, path: str) -> bool:
+        """Return True if the path matches any of the patterns."""
+        return self.regex is not None and self.regex.match(path) is not None
+
+
+def walk_files(
+    root: Path,
+    patterns: Iterable[str] = ('*',),
+    skip_dirs: Iterable[str] = (),
+    skip_files: Iterable[str] = (),
+    exclude: PathMatcher | None = None,
+    max_depth: int | None = None,
+) -> Iterator[Path]:
+    """Yield the files under root in sorted, depth-first order.
+
+    Unlike Path.rglob, excluded directories (e.g., .venv, deps) are pruned before they are
+    descended into, so vendored dependencies are never listed.
+
+    Args:
+        root: The directory to walk.
+        patterns: The file name glob patterns to yield (e.g., "*.py").
+        skip_dirs: Directory names to prune at any depth.
+        skip_files: File names to skip.
+        exclude: A matcher for relative paths (directories are also tried with a trailing "/")
+            to prune or skip.
+        max_depth: The maximum directory depth to descend into (0 is the root only).
+    """
+    file_matcher = PathMatcher(patterns)
+    skip_dirs_ = set(skip_dirs)
+    skip_files_ = set(skip_files)
+    root_prefix = len(str(root).rstrip(os.sep)) + 1
+
+    stack = [(str(root), 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            relative = entry.path[root_prefix:]
+            if entry.is_dir(follow_symlinks=False):
+                if (
+                    entry.name in skip_dirs_
+                    or (max_depth is not None and depth >= max_depth)
+                    or (exclude is not None and exclude.match(f'{relative}/'))
+                    or (exclude is not None and exclude.match(relative))
+                ):
+                    continue
+                subdirs.append((entry.path, depth + 1))
+            elif (
+                entry.name not in skip_files_
+                and file_matcher.match(entry.name)
+                and not (exclude is not None and exclude.match(relative))
+            ):
+                yield Path(entry.path)
+
+        # reversed so the directories are walked in sorted order
+        stack.extend(reversed(subdirs))
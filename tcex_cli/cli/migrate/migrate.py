@@ -1,6 +1,7 @@
 """TcEx Framework Module"""
 
 # standard library
+from pathlib import Path
 from typing import Optional
 
 # third-party
@@ -13,6 +14,7 @@ from tcex_cli.render.render import Render
 # typer does not yet support PEP 604, but pyupgrade will enforce
 # PEP 604. this is a temporary workaround until support is added.
 IntOrNone = Optional[int]  # noqa: UP007
+PathOrNone = Optional[Path]  # noqa: UP007
 StrOrNone = Optional[str]  # noqa: UP007
 
 
@@ -21,14 +23,38 @@ def command(
         default=True, help='If true, show typing forward lookup reference that require updates.'
     ),
     update_code: bool = typer.Option(default=True, help='If true, apply code replacements.'),
+    batch: bool = typer.Option(
+        default=False,
+        help=(
+            'If true, compute all replacements without prompting and report the hits per rule. '
+            'Exits with code 1 if changes are required and not applied (e.g., for CI).'
+        ),
+    ),
+    apply: bool = typer.Option(
+        default=False, help='If true (with --batch), write all replacements atomically.'
+    ),
+    patch: PathOrNone = typer.Option(
+        None, help='The file to write a unified diff of all replacements to (with --batch).'
+    ),
+    jobs: IntOrNone = typer.Option(
+        None, help='The number of processes used to scan the code (defaults to the cpu count).'
+    ),
 ):
     """Migrate App to TcEx 4 from TcEx 2/3."""
     cli = MigrateCli(
         forward_ref,
         update_code,
+        batch=batch or apply or patch is not None,
+        apply=apply,
+        patch_file=patch,
+        jobs=jobs,
     )
     try:
         cli.walk_code()
+        if cli.exit_code != 0:
+            raise typer.Exit(code=cli.exit_code)  # noqa: TRY301
+    except typer.Exit:
+        raise
     except Exception as ex:
         cli.log.exception('Failed to run "tcex deps" command.')
         Render.panel.failure(f'Exception: {ex}')
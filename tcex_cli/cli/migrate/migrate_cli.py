@@ -1,14 +1,19 @@
 """TcEx Framework Module"""
 
 # standard library
-import ast
+import difflib
 import logging
-import re
+import os
+import tempfile
+from collections import Counter
 from functools import cached_property
 from pathlib import Path
 
 # first-party
 from tcex_cli.cli.cli_abc import CliABC
+from tcex_cli.cli.file_walker import walk_files
+from tcex_cli.cli.migrate.migrate_engine import MigrateEngine
+from tcex_cli.cli.migrate.model.migrate_file_model import MigrateFileModel
 from tcex_cli.render.render import Render
 
 # get logger
@@ -22,39 +27,68 @@ class MigrateCli(CliABC):
         self,
         forward_ref: bool,
         update_code: bool,
+        batch: bool = False,
+        apply: bool = False,
+        patch_file: Path | None = None,
+        jobs: int | None = None,
     ):
         """Initialize instance properties."""
         super().__init__()
         self.forward_ref = forward_ref
         self.update_code = update_code
-
-    def _replace_string(self, filename: Path, string: str, replacement: str):
-        """Replace string in file."""
-        file_changed = False
-        new_file = []
-        for line_no, line in enumerate(filename.open(mode='r', encoding='utf-8'), start=1):
-            line_ = line.rstrip('\n')
-            if string in line_:
-                Render.table.key_value(
-                    'Replace Code',
-                    {
-                        'File Link': f'{filename}:{line_no}',
-                        'Current Line': f'{line_}',
-                        'New Line': f'{line_.replace(string, replacement)}',
-                    },
-                )
-                response = Render.prompt.input(
-                    'Replace line:',
-                    prompt_default=f' (Default: [{self.accent}]yes[/{self.accent}])',
+        self.batch = batch
+        self.apply = apply
+        self.patch_file = patch_file
+        self.jobs = jobs
+
+    def _prompt_replace(self, link: str, line: str, new_line: str) -> bool:
+        """Return True if the user accepts the replacement."""
+        Render.table.key_value(
+            'Replace Code',
+            {
+                'File Link': link,
+                'Current Line': f'{line}',
+                'New Line': f'{new_line}',
+            },
+        )
+        response = Render.prompt.input(
+            'Replace line:',
+            prompt_default=f' (Default: [{self.accent}]yes[/{self.accent}])',
+        )
+        return response in ('', 'y', 'yes')
+
+    @staticmethod
+    def _write_atomic(results: list[MigrateFileModel]):
+        """Write all files to temp files first, then replace the originals (all or nothing)."""
+        temp_files: list[tuple[Path, Path]] = []
+        try:
+            for result in results:
+                fd, temp_name = tempfile.mkstemp(
+                    dir=result.path.parent, prefix=f'.{result.path.name}.', suffix='.tmp'
                 )
-                if response in ('', 'y', 'yes'):
-                    line_ = line_.replace(string, replacement)
+                temp_file = Path(temp_name)
+                temp_files.append((temp_file, result.path))
+                with os.fdopen(fd, mode='w', encoding='utf-8') as fh:
+                    fh.write(result.new_text or '')
+                temp_file.chmod(result.path.stat().st_mode)
+        except Exception:
+            for temp_file, _ in temp_files:
+                temp_file.unlink(missing_ok=True)
+            raise
+
+        for temp_file, path in temp_files:
+            temp_file.replace(path)
+
+    def _replace_string(self, filename: Path, lines: list[str], string: str, replacement: str):
+        """Replace string in lines, returning True if any line changed."""
+        file_changed = False
+        for index, line in enumerate(lines):
+            if string in line:
+                new_line = line.replace(string, replacement)
+                if self._prompt_replace(f'{filename}:{index + 1}', line, new_line):
+                    lines[index] = new_line
                     file_changed = True
-            new_file.append(line_)
-
-        if file_changed is True:
-            with filename.open(mode='w', encoding='utf-8') as fh:
-                fh.write('\n'.join(new_file) + '\n')
+        return file_changed
 
     @cached_property
     def _skip_directories(self):
@@ -269,172 +303,105 @@ class MigrateCli(CliABC):
             },
         }
 
-    def _handle_constant_annotation(
-        self,
-        filename: Path,
-        annotation: ast.Constant,
-        imported_packages: dict[str, list[str]],
-    ):
-        """."""
-        # handle Forward Ref
-        if annotation.value:
-            package = annotation.value.split('.')[0]  # type: ignore
-            if package in imported_packages['standard']:
-                # _logger.debug(f'Forward Ref: {arg.annotation.value}')
-                self._replace_string(
-                    filename,
-                    f"'{annotation.value}'",
-                    annotation.value,  # type: ignore
-                )
-
-    def parse_ast_body(
-        self,
-        filename: Path,
-        body: list,
-        imports_: dict[str, list[str]],
-        in_typing_imports: bool = False,
-    ):
-        """."""
-        for item in body:
-            match item:
-                case ast.Import() | ast.ImportFrom():
-                    import_type = 'typing' if in_typing_imports else 'standard'
-                    imports_[import_type].extend([n.name for n in item.names])
-
-                case ast.AnnAssign():
-                    match item.annotation:
-                        case ast.Constant():
-                            self._handle_constant_annotation(filename, item.annotation, imports_)
-
-                case ast.Assign():
-                    pass
-
-                case ast.ClassDef():
-                    # _logger.debug('Found Class')
-                    self.parse_ast_body(filename, item.body, imports_)
-
-                case ast.Expr():
-                    # _logger.debug(f'Found Expr: {type(item.value)}')
-                    pass
-
-                case ast.For():
-                    pass
-
-                case ast.If():
-                    # _logger.debug('Found If')
-                    if isinstance(item.test, ast.Name) and item.test.id == 'TYPE_CHECKING':
-                        self.parse_ast_body(filename, item.body, imports_, in_typing_imports=True)
-
-                case ast.Name():
-                    pass
-
-                case ast.FunctionDef():
-                    # _logger.debug(f'Found function: {item.name}')
-                    for arg in item.args.args:
-                        # _logger.debug(f'ARG: Name={arg.arg}')
-                        match arg.annotation:
-                            case ast.Constant():
-                                self._handle_constant_annotation(filename, arg.annotation, imports_)
-
-                            case ast.BinOp():
-                                # _logger.debug(f'ARG: BinOp -> {arg.annotation.op}')
-                                pass
-
-                            case _:
-                                # _logger.debug(f'ARG: other type -> {type(arg.annotation)}')
-                                pass
-
-                    match item.returns:
-                        case ast.Constant():
-                            self._handle_constant_annotation(filename, item.returns, imports_)
-                            ## # handle Forward Ref
-                            ## if item.returns.value in imports_['standard']:
-                            ##     # _logger.debug(f'Forward Ref: {item.returns.value}')
-                            ##     # _logger.debug(f'{filename}:{item.lineno}')
-
-                        case ast.Name():
-                            # _logger.debug(f'Found Return: {item.returns.id}')
-                            pass
-
-                    # parse nested data
-                    self.parse_ast_body(filename, item.body, imports_, in_typing_imports=True)
-
-                case ast.Try():
-                    pass
-
-                case ast.Return():
-                    pass
-
-                case ast.While():
-                    pass
-
-                # case _:
-                #     _logger.debug(f'Unknown Type: {type(item)}')
-
-    def run_update_code(self, filename: Path):
-        """Run replace code logic."""
+    def run_update_code(
+        self, engine: MigrateEngine, filename: Path, lines: list[str], candidates: list[int]
+    ) -> bool:
+        """Run replace code logic on the candidate lines, returning True if any line changed."""
         file_changed = False
-        new_file = []
-        for line_no, line in enumerate(filename.open(mode='r', encoding='utf-8'), start=1):
-            line_ = line.rstrip('\n')
-
-            for pattern, data in self._code_replacements.items():
-                match_pattern = re.compile(pattern)
-                match_data = list(match_pattern.finditer(line_))
-                in_file = data.get('in_file') or []
-                if match_data and (not in_file or filename.name in in_file):
-                    match_data = next(iter(match_data))
-                    new_line = re.sub(pattern, data['replacement'], line_)
-
-                    Render.table.key_value(
-                        'Replace Code',
-                        {
-                            'File Link': f'{filename}:{line_no}:{match_data.start() + 1}',
-                            'Current Line': f'{line_}',
-                            'New Line': f'{new_line}',
-                        },
-                    )
-                    response = Render.prompt.input(
-                        'Replace line:',
-                        prompt_default=f' (Default: [{self.accent}]yes[/{self.accent}])',
-                    )
-                    if response in ('', 'y', 'yes'):
-                        line_ = re.sub(pattern, data['replacement'], line_)
-                        file_changed = True
-
-            new_file.append(line_)
+        rules = engine.rules_for(filename.name)
+        for index in candidates:
+            line_ = lines[index]
+            for rule in rules:
+                match_data = rule.pattern.search(line_)
+                if match_data is None:
+                    continue
 
-        if file_changed is True:
-            with filename.open(mode='w', encoding='utf-8') as fh:
-                fh.write('\n'.join(new_file) + '\n')
+                new_line = rule.sub(line_)
+                link = f'{filename}:{index + 1}:{match_data.start() + 1}'
+                if self._prompt_replace(link, line_, new_line):
+                    line_ = new_line
+                    file_changed = True
+            lines[index] = line_
+        return file_changed
+
+    def run_batch(self, results: list[MigrateFileModel]):
+        """Report, write a patch for, and optionally apply all replacements without prompting.
+
+        The exit code is set to 1 if any file still requires changes, so the command can be used
+        in CI to check that a migration is complete.
+        """
+        cwd = Path.cwd()
+        modified = [r for r in results if r.is_modified]
+
+        hits: Counter[str] = Counter()
+        for result in results:
+            hits.update(result.hits)
+
+        if hits:
+            Render.table.key_value(
+                'Migration Rule Hits', {rule: str(count) for rule, count in hits.most_common()}
+            )
+
+        if self.patch_file is not None:
+            patch = []
+            for result in modified:
+                relative = result.path.relative_to(cwd).as_posix()
+                patch.extend(
+                    difflib.unified_diff(
+                        result.text.splitlines(keepends=True),
+                        (result.new_text or '').splitlines(keepends=True),
+                        fromfile=f'a/{relative}',
+                        tofile=f'b/{relative}',
+                    )
+                )
+            self.patch_file.write_text(''.join(patch), encoding='utf-8')
+            Render.panel.info(f'Patch written to {self.patch_file}.')
+
+        if not modified:
+            Render.panel.success('No migration changes required.')
+        elif self.apply:
+            self._write_atomic(modified)
+            Render.panel.success(f'Applied migration changes to {len(modified)} file(s).')
+        else:
+            Render.panel.list(
+                'Files Requiring Migration',
+                [str(r.path.relative_to(cwd)) for r in modified],
+                'bold yellow',
+            )
+            self.exit_code = 1
 
     def walk_code(self):
-        """."""
-        for item in Path.cwd().rglob('*.py'):
-            # skip directories
-            parents = item.relative_to(Path.cwd()).parents
-            if len(parents) > 1:
-                parent_name = parents[-2].name
-                if parent_name in self._skip_directories:
-                    continue
-
-            # skip files
-            if item.name in self._skip_files:
+        """Scan the App code and prompt for each replacement (or apply them in batch mode)."""
+        files = walk_files(
+            Path.cwd(),
+            patterns=['*.py'],
+            skip_dirs=self._skip_directories,
+            skip_files=self._skip_files,
+        )
+
+        # scan all files first (in parallel for large code bases), then prompt for the changes
+        engine = MigrateEngine(self._code_replacements, jobs=self.jobs)
+        results = engine.scan(
+            files, forward_ref=self.forward_ref, update_code=self.update_code, batch=self.batch
+        )
+        for result in results:
+            if result.error is not None:
+                Render.panel.warning(f'Could not scan {result.path}: {result.error}')
+
+        if self.batch:
+            self.run_batch(results)
+            return
+
+        for result in results:
+            if not result.has_changes:
                 continue
 
-            Render.panel.info(f'FILE: {item}')
-
-            # run simple regex replacements
-            if self.update_code is True:
-                self.run_update_code(item)
-
-            if self.forward_ref is True:
-                with item.open(mode='r', encoding='utf-8') as fh:
-                    code = fh.read()
+            Render.panel.info(f'FILE: {result.path}')
+            lines = result.text.splitlines()
+            file_changed = self.run_update_code(engine, result.path, lines, result.candidates)
+            for string, replacement in result.forward_refs:
+                file_changed |= self._replace_string(result.path, lines, string, replacement)
 
-                imports = {
-                    'standard': [],
-                    'typing': [],
-                }
-                parsed_code = ast.parse(code)
-                self.parse_ast_body(item, parsed_code.body, imports)
+            if file_changed is True:
+                with result.path.open(mode='w', encoding='utf-8') as fh:
+                    fh.write('\n'.join(lines) + '\n')
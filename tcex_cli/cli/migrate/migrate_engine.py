@@ -0,0 +1,235 @@
+"""TcEx Framework Module"""
+
+# standard library
+import ast
+import logging
+import os
+import re
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# first-party
+from tcex_cli.cli.migrate.model.migrate_file_model import MigrateFileModel
+
+# get logger
+_logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
+
+# the hit count key for unquoted forward references
+FORWARD_REF_RULE = 'forward-ref'
+
+# the engine used by the process pool workers (set once per worker by the initializer)
+_worker_engine: 'MigrateEngine | None' = None
+
+
+def _worker_init(engine: 'MigrateEngine'):
+    """Set the engine for a process pool worker."""
+    global _worker_engine  # noqa: PLW0603
+    _worker_engine = engine
+
+
+def _worker_scan_file(args: tuple[Path, bool, bool, bool]) -> MigrateFileModel:
+    """Scan a file in a process pool worker."""
+    return _worker_engine.scan_file(*args)  # type: ignore
+
+
+class MigrateRule:
+    """A precompiled code replacement rule."""
+
+    def __init__(self, pattern: str, replacement: str, in_file: list[str] | None = None, **_):
+        """Initialize instance properties.
+
+        Args:
+            pattern: The regex pattern to replace.
+            replacement: The replacement (may contain regex group references).
+            in_file: The file names the rule applies to (all files if not set).
+        """
+        self.in_file = in_file or []
+        self.name = pattern
+        self.pattern = re.compile(pattern)
+        self.replacement = replacement
+
+    def applies_to(self, filename: str) -> bool:
+        """Return True if the rule applies to the file."""
+        return not self.in_file or filename in self.in_file
+
+    def sub(self, line: str) -> str:
+        """Return the line with the replacement applied."""
+        return self.pattern.sub(self.replacement, line)
+
+
+class MigrateEngine:
+    """Scan App code for migration replacements.
+
+    All rule patterns are compiled once and combined into a single alternation that is used
+    as a prefilter, so only lines that match at least one rule are checked rule by rule. Each
+    file is read once and the same contents are used for the forward reference scan.
+    """
+
+    # below this number of files a process pool costs more than it saves
+    pool_threshold = 64
+
+    def __init__(self, code_replacements: dict[str, dict], jobs: int | None = None):
+        """Initialize instance properties.
+
+        Args:
+            code_replacements: A mapping of regex pattern to replacement data.
+            jobs: The number of worker processes (defaults to the cpu count).
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+        self.log = _logger
+        self.rules = [MigrateRule(pattern, **data) for pattern, data in code_replacements.items()]
+        self.prefilter = re.compile('|'.join(f'(?:{r.pattern.pattern})' for r in self.rules))
+
+    @staticmethod
+    def _forward_refs(code: str) -> list[tuple[str, str]]:
+        """Return the quoted forward references that can be unquoted."""
+        forward_refs: list[tuple[str, str]] = []
+        parse_ast_body(ast.parse(code).body, {'standard': [], 'typing': []}, forward_refs)
+        return forward_refs
+
+    def replace_all(
+        self,
+        filename: str,
+        lines: list[str],
+        candidates: list[int],
+        forward_refs: list[tuple[str, str]],
+    ) -> Counter[str]:
+        """Apply every replacement to the lines (in place), returning the hits per rule.
+
+        The rules are applied in the same order as the interactive mode, with every prompt
+        accepted.
+        """
+        hits: Counter[str] = Counter()
+        rules = self.rules_for(filename)
+        for index in candidates:
+            line = lines[index]
+            for rule in rules:
+                line, count = rule.pattern.subn(rule.replacement, line)
+                if count:
+                    hits[rule.name] += count
+            lines[index] = line
+
+        for string, replacement in forward_refs:
+            for index, line in enumerate(lines):
+                if string in line:
+                    hits[FORWARD_REF_RULE] += line.count(string)
+                    lines[index] = line.replace(string, replacement)
+        return hits
+
+    def rules_for(self, filename: str) -> list[MigrateRule]:
+        """Return the rules that apply to the file."""
+        return [r for r in self.rules if r.applies_to(filename)]
+
+    def scan(
+        self,
+        files: Iterable[Path],
+        forward_ref: bool = True,
+        update_code: bool = True,
+        batch: bool = False,
+    ) -> list[MigrateFileModel]:
+        """Scan the files, using a process pool for large code bases.
+
+        In batch mode the replacements are also applied (in the workers) and returned as the
+        new file contents.
+        """
+        tasks = [(f, forward_ref, update_code, batch) for f in files]
+        if len(tasks) < self.pool_threshold or self.jobs == 1:
+            return [self.scan_file(*task) for task in tasks]
+
+        self.log.debug(f'feature=migrate, event=scan, files={len(tasks)}, jobs={self.jobs}')
+        with ProcessPoolExecutor(
+            max_workers=self.jobs, initializer=_worker_init, initargs=(self,)
+        ) as executor:
+            return list(executor.map(_worker_scan_file, tasks, chunksize=16))
+
+    def scan_file(
+        self, path: Path, forward_ref: bool = True, update_code: bool = True, batch: bool = False
+    ) -> MigrateFileModel:
+        """Return the replacement candidates for a single file."""
+        try:
+            text = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as ex:
+            return MigrateFileModel(path=path, error=str(ex))
+
+        candidates = []
+        if update_code and self.prefilter.search(text):
+            rules = self.rules_for(path.name)
+            candidates = [
+                index
+                for index, line in enumerate(text.splitlines())
+                if self.prefilter.search(line) and any(r.pattern.search(line) for r in rules)
+            ]
+
+        # a file that can not be parsed has no forward references, but the code rules (which are
+        # line based) are still applied and the error is reported with the result
+        error = None
+        forward_refs = []
+        if forward_ref:
+            try:
+                forward_refs = self._forward_refs(text)
+            except SyntaxError as ex:
+                error = str(ex)
+
+        # the contents are only needed (and sent back from a worker) if there are changes
+        result = MigrateFileModel(
+            path=path,
+            text=text if candidates or forward_refs else '',
+            candidates=candidates,
+            forward_refs=forward_refs,
+            error=error,
+        )
+        if batch and result.has_changes:
+            lines = text.splitlines()
+            result.hits = dict(self.replace_all(path.name, lines, candidates, forward_refs))
+            result.new_text = '\n'.join(lines) + '\n'
+        return result
+
+
+def _handle_constant_annotation(
+    annotation: ast.Constant,
+    imported_packages: dict[str, list[str]],
+    forward_refs: list[tuple[str, str]],
+):
+    """Add a forward reference to a standard imported package."""
+    if annotation.value:
+        package = annotation.value.split('.')[0]  # type: ignore
+        if package in imported_packages['standard']:
+            forward_refs.append((f"'{annotation.value}'", annotation.value))  # type: ignore
+
+
+def parse_ast_body(
+    body: list,
+    imports_: dict[str, list[str]],
+    forward_refs: list[tuple[str, str]],
+    in_typing_imports: bool = False,
+):
+    """Collect the forward references in the body that can be unquoted."""
+    for item in body:
+        match item:
+            case ast.Import() | ast.ImportFrom():
+                import_type = 'typing' if in_typing_imports else 'standard'
+                imports_[import_type].extend([n.name for n in item.names])
+
+            case ast.AnnAssign():
+                if isinstance(item.annotation, ast.Constant):
+                    _handle_constant_annotation(item.annotation, imports_, forward_refs)
+
+            case ast.ClassDef():
+                parse_ast_body(item.body, imports_, forward_refs)
+
+            case ast.If():
+                if isinstance(item.test, ast.Name) and item.test.id == 'TYPE_CHECKING':
+                    parse_ast_body(item.body, imports_, forward_refs, in_typing_imports=True)
+
+            case ast.FunctionDef():
+                for arg in item.args.args:
+                    if isinstance(arg.annotation, ast.Constant):
+                        _handle_constant_annotation(arg.annotation, imports_, forward_refs)
+
+                if isinstance(item.returns, ast.Constant):
+                    _handle_constant_annotation(item.returns, imports_, forward_refs)
+
+                # parse nested data
+                parse_ast_body(item.body, imports_, forward_refs, in_typing_imports=True)
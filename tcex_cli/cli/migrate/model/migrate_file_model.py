@@ -0,0 +1,35 @@
+"""TcEx Framework Module"""
+
+# standard library
+from pathlib import Path
+
+# third-party
+from pydantic import BaseModel, Field
+
+
+class MigrateFileModel(BaseModel):
+    """Model Definition"""
+
+    path: Path = Field(..., description='The path of the scanned file.')
+    text: str = Field('', description='The contents of the file.')
+    candidates: list[int] = Field(
+        [], description='The (zero-based) index of lines matched by at least one code rule.'
+    )
+    forward_refs: list[tuple[str, str]] = Field(
+        [], description='The quoted forward reference and its unquoted replacement.'
+    )
+    error: str | None = Field(None, description='The error, if the file could not be scanned.')
+    hits: dict[str, int] = Field({}, description='The number of replacements made by each rule.')
+    new_text: str | None = Field(
+        None, description='The contents with all replacements applied (batch mode only).'
+    )
+
+    @property
+    def has_changes(self) -> bool:
+        """Return True if the file has replacement candidates."""
+        return bool(self.candidates or self.forward_refs)
+
+    @property
+    def is_modified(self) -> bool:
+        """Return True if applying the replacements changes the file (batch mode only)."""
+        return self.new_text is not None and self.new_text != self.text
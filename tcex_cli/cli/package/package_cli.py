@@ -1,7 +1,6 @@
 """TcEx Framework Module"""
 
 # standard library
-import fnmatch
 import json
 import os
 import shutil
@@ -11,6 +10,7 @@ from pathlib import Path
 # first-party
 from tcex_cli.app.config.install_json import InstallJson
 from tcex_cli.cli.cli_abc import CliABC
+from tcex_cli.cli.file_walker import PathMatcher
 from tcex_cli.cli.model.app_metadata_model import AppMetadataModel
 from tcex_cli.cli.model.validation_data_model import ValidationDataModel
 from tcex_cli.pleb.cached_property import cached_property
@@ -111,22 +111,20 @@ class PackageCli(CliABC):
         build_fqpn.mkdir(exist_ok=True, parents=True)
         return build_fqpn
 
+    @cached_property
+    def _build_excludes_matcher(self) -> PathMatcher:
+        """Return a matcher for all files and folders excluded during the build process."""
+        return PathMatcher(self._build_excludes_glob + self._build_excludes_base)
+
     def exclude_files(self, src: str, names: list):
         """Ignore exclude files in shutil.copytree (callback)."""
-        exclude_list = self._build_excludes_glob + self._build_excludes_base
-
         cwd = str(Path.cwd()) + os.sep
         ignored_names = set()
         for name in names:
-            for pattern in exclude_list:
-                n = os.path.join(src, name)  # noqa: PTH118
-                n = n.replace(cwd, '')
-                if fnmatch.fnmatch(n, pattern):
-                    ignored_names.add(name)
-                    break
-                if fnmatch.fnmatch(n + '/', pattern):
-                    ignored_names.add(name)
-                    break
+            n = os.path.join(src, name)  # noqa: PTH118
+            n = n.replace(cwd, '')
+            if self._build_excludes_matcher.match(n) or self._build_excludes_matcher.match(n + '/'):
+                ignored_names.add(name)
         return ignored_names
 
     def interactive_output(self):
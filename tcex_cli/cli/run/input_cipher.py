@@ -0,0 +1,101 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import secrets
+import string
+import time
+
+# third-party
+import pyaes
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+try:
+    # third-party
+    from cryptography.hazmat.primitives import padding
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:  # pragma: no cover
+    Cipher = None
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+# the App reads the inputs file with a zero IV, see tcex.input
+DEFAULT_IV = b'\0' * 16
+
+
+def _to_bytes(value: bytes | str) -> bytes:
+    """Return the value as bytes."""
+    return value.encode() if isinstance(value, str) else value
+
+
+def encrypt_aes_cbc_cryptography(
+    key: bytes | str, plaintext: bytes | str, iv: bytes | str | None = None
+) -> bytes:
+    """Return AES CBC (PKCS7 padded) encrypted data using the cryptography package."""
+    if Cipher is None:
+        ex_msg = 'The cryptography package is not installed (pip install tcex-cli[crypto]).'
+        raise RuntimeError(ex_msg)
+
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(_to_bytes(plaintext)) + padder.finalize()
+    encryptor = Cipher(
+        algorithms.AES(_to_bytes(key)), modes.CBC(_to_bytes(iv or DEFAULT_IV))
+    ).encryptor()
+    return encryptor.update(padded) + encryptor.finalize()
+
+
+def encrypt_aes_cbc_pyaes(
+    key: bytes | str, plaintext: bytes | str, iv: bytes | str | None = None
+) -> bytes:
+    """Return AES CBC (PKCS7 padded) encrypted data using the pure python pyaes package."""
+    encrypter = pyaes.Encrypter(
+        pyaes.AESModeOfOperationCBC(_to_bytes(key), iv=_to_bytes(iv or DEFAULT_IV))
+    )
+    return encrypter.feed(_to_bytes(plaintext)) + encrypter.feed()
+
+
+def encrypt_aes_cbc(
+    key: bytes | str, plaintext: bytes | str, iv: bytes | str | None = None
+) -> bytes:
+    """Return AES CBC encrypted data, using cryptography when installed or pyaes otherwise.
+
+    Both backends produce identical ciphertext (PKCS7 padding, zero IV by default), the same
+    format as Util.encrypt_aes_cbc.
+    """
+    if Cipher is not None:
+        return encrypt_aes_cbc_cryptography(key, plaintext, iv)
+    return encrypt_aes_cbc_pyaes(key, plaintext, iv)
+
+
+def generate_key(length: int = 16) -> str:
+    """Return a random key for the inputs file (16 characters for AES-128)."""
+    return ''.join(secrets.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def benchmark(sizes: tuple[int, ...] = (1_024, 102_400, 1_048_576), rounds: int = 3) -> list[dict]:
+    """Return the encryption time of each backend for inputs of the given sizes."""
+    key = generate_key()
+    backends = {'pyaes': encrypt_aes_cbc_pyaes}
+    if Cipher is not None:
+        backends['cryptography'] = encrypt_aes_cbc_cryptography
+
+    results = []
+    for size in sizes:
+        plaintext = json.dumps({'data': 'x' * size})
+        ciphertexts = set()
+        for name, encrypt in backends.items():
+            elapsed = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                ciphertexts.add(encrypt(key, plaintext))
+                elapsed.append(time.perf_counter() - started)
+            results.append({'backend': name, 'bytes': len(plaintext), 'seconds': min(elapsed)})
+
+        if len(ciphertexts) != 1:
+            ex_msg = 'The cipher backends produced different ciphertext.'
+            raise RuntimeError(ex_msg)
+    return results
@@ -0,0 +1,103 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+# matches ${namespace.name} (e.g., ${env.API_KEY}, ${file.secrets/key.pem})
+VARIABLE_PATTERN = re.compile(r'\$\{(?P<namespace>\w+)\.(?P<name>[^}]+)\}')
+
+
+class InputResolver:
+    """Substitute ${namespace.name} references in the App inputs in a single pass.
+
+    Built-in namespaces:
+    - env: the environment variable value (e.g., ${env.API_KEY}).
+    - file: the contents of the file, relative to the App directory (e.g., ${file.key.pem}).
+    - keychain: the password from the system keychain (e.g., ${keychain.service/username}),
+        this requires the optional "keyring" package.
+
+    Additional namespaces can be added with register(). References to an unknown namespace
+    (e.g., ${trigger.id}) or that do not resolve are left unchanged.
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.log = _logger
+        self.resolvers: dict[str, Callable[[str], str | None]] = {
+            'env': self.resolve_env,
+            'file': self.resolve_file,
+            'keychain': self.resolve_keychain,
+        }
+
+        # the dependencies of the last substitution, used to validate cached results
+        self.cacheable = True
+        self.files: dict[Path, int | None] = {}
+
+    @staticmethod
+    def file_mtime(file: Path) -> int | None:
+        """Return the modified time of the file, or None if it does not exist."""
+        try:
+            return file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def register(self, namespace: str, resolver: Callable[[str], str | None]):
+        """Register a resolver, which returns the value for a name or None if not found."""
+        self.resolvers[namespace] = resolver
+
+    def resolve_env(self, name: str) -> str | None:
+        """Return the environment variable value."""
+        return os.getenv(name)
+
+    def resolve_file(self, name: str) -> str | None:
+        """Return the file contents, escaped for use in a JSON string."""
+        file = Path(name).expanduser()
+        self.files[file] = self.file_mtime(file)
+        if self.files[file] is None:
+            return None
+
+        # strip the trailing newline and escape quotes/newlines (e.g., in a PEM file)
+        return json.dumps(file.read_text(encoding='utf-8').rstrip('\r\n'))[1:-1]
+
+    def resolve_keychain(self, name: str) -> str | None:
+        """Return the password for "service/username" from the system keychain."""
+        # keychain values can change without notice, never cache them
+        self.cacheable = False
+        try:
+            # third-party
+            import keyring  # type: ignore
+        except ImportError:
+            self.log.warning(
+                'feature=input-resolver, event=keyring-not-installed, '
+                'message="install keyring to resolve ${keychain.*} inputs"'
+            )
+            return None
+
+        service, _, username = name.rpartition('/')
+        return keyring.get_password(service or name, username)
+
+    def substitute(self, data: str) -> str:
+        """Return the data with all resolvable references replaced."""
+        self.cacheable = True
+        self.files = {}
+
+        def _replace(match: re.Match) -> str:
+            resolver = self.resolvers.get(match.group('namespace'))
+            if resolver is None:
+                return match.group(0)
+
+            value = resolver(match.group('name'))
+            return match.group(0) if value is None else value
+
+        return VARIABLE_PATTERN.sub(_replace, data)
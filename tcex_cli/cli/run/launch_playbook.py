@@ -30,16 +30,26 @@ class LaunchPlaybook(LaunchABC):
 
         return model
 
+    def reload(self, inputs_changed: bool = False):
+        """Reset the App state between runs, removing the previous staged and output data."""
+        self.redis_client.delete(self.model.inputs.tc_playbook_kvstore_context)
+        self.staged_keys.clear()
+
+        super().reload(inputs_changed)
+        if inputs_changed:
+            self.playbook = PlaybookCreate(
+                self.redis_client, self.model.inputs.tc_playbook_kvstore_context
+            )
+
     def stage(self):
         """Stage the variables in redis."""
-        # capture the stages keys?
-        for key, value in self.model.stage.kvstore.items():
-            self.staged_keys.append(key)
-            self.playbook.any(key, value)
+        # capture the staged keys so they can be excluded from the output data
+        self.staged_keys.update(self.model.stage.kvstore)
+        self.playbook.bulk(self.model.stage.kvstore)
 
-    def print_output_data(self):
+    def print_output_data(self, output_pattern: str | None = None):
         """Log the playbook output data."""
         output_data = self.live_format_dict(
-            self.output_data(self.model.inputs.tc_playbook_kvstore_context)
+            self.output_data(self.model.inputs.tc_playbook_kvstore_context, output_pattern)
         ).strip()
         Render.panel.info(f'{output_data}', f'[{self.panel_title}]Output Data[/]')
@@ -3,6 +3,7 @@
 # standard library
 import datetime
 import json
+from collections import deque
 from pathlib import Path
 from threading import Thread
 
@@ -29,8 +30,8 @@ class LaunchServiceApi(LaunchServiceCommonABC):
         super().__init__(config_json)
 
         # properties
-        self.request_data = []
-        self.response_data = []
+        self.request_data: deque[dict] = deque(maxlen=self.live_data_history)
+        self.response_data: deque[dict] = deque(maxlen=self.live_data_history)
 
     def _format_key_value(self, key_value: list[dict]) -> str:
         """Return a formatted key value pair."""
@@ -76,18 +77,15 @@ class LaunchServiceApi(LaunchServiceCommonABC):
             screen=True,
             vertical_overflow='ellipsis',
         ) as _:
-            while True:
-                # if self.stop_server is True:
-                #     # console.clear()
-                #     break
-
-                self.event.wait()
-                self.log.trace('Updating live data table.')
-                layout['header'].update(self.live_data_header())
-                layout['request'].update(self.live_data_request())
-                layout['response'].update(self.live_data_response())
-                layout['commands'].update(self.live_data_commands())
-                self.event.clear()
+            self.live_data_render(
+                layout,
+                {
+                    'header': self.live_data_header,
+                    'request': self.live_data_request,
+                    'response': self.live_data_response,
+                    'commands': self.live_data_commands,
+                },
+            )
 
     def live_data_header(self) -> Panel:
         """Display live header."""
@@ -112,7 +110,7 @@ class LaunchServiceApi(LaunchServiceCommonABC):
         table.add_column('Request Key')
 
         try:
-            for request in self.request_data[::-1]:
+            for request in self.live_data_rows(self.request_data):
                 table.add_row(
                     request.get('request_time'),
                     request.get('method'),
@@ -141,7 +139,7 @@ class LaunchServiceApi(LaunchServiceCommonABC):
         table.add_column('Request Key')
 
         try:
-            for request in self.response_data[::-1]:
+            for request in self.live_data_rows(self.response_data):
                 table.add_row(
                     request.get('response_time'),
                     request.get('status'),
@@ -167,6 +165,8 @@ class LaunchServiceApi(LaunchServiceCommonABC):
             ex_msg = f'Could not parse API service response JSON. ({message})'
             raise RuntimeError(ex_msg) from ex
 
+        self.metrics_record('client', msg, len(message.payload))
+
         command = msg.get('command').lower()
         self.message_data.append(
             {
@@ -177,8 +177,10 @@ class LaunchServiceApi(LaunchServiceCommonABC):
             }
         )
 
+        sections = ['commands']
         match command:
             case 'acknowledged':
+                sections.append('response')
                 self.response_data.append(
                     {
                         'headers': msg.get('headers'),
@@ -189,7 +191,7 @@ class LaunchServiceApi(LaunchServiceCommonABC):
                     }
                 )
 
-        self.event.set()
+        self.live_data_changed(*sections)
 
     def process_server_channel(self, _client, _userdata, message):
         """Handle message broker on_message shutdown command events."""
@@ -199,6 +201,8 @@ class LaunchServiceApi(LaunchServiceCommonABC):
             ex_msg = f'Could not parse API service response JSON. ({message})'
             raise RuntimeError(ex_msg) from ex
 
+        self.metrics_record('server', msg, len(message.payload))
+
         command = msg.get('command').lower()
         self.message_data.append(
             {
@@ -209,8 +213,10 @@ class LaunchServiceApi(LaunchServiceCommonABC):
             }
         )
 
+        sections = ['commands']
         match command:
             case 'runservice':
+                sections.append('request')
                 self.request_data.append(
                     {
                         'headers': msg.get('headers'),
@@ -225,7 +231,7 @@ class LaunchServiceApi(LaunchServiceCommonABC):
             case 'shutdown':
                 self.stop_server = True
 
-        self.event.set()
+        self.live_data_changed(*sections)
 
     def setup(self, debug: bool = False):
         """Configure the API Web Server."""
@@ -255,3 +261,7 @@ class LaunchServiceApi(LaunchServiceCommonABC):
                 target=self.live_data_display, name='LiveDataDisplay', daemon=True
             )
             self.display_thread.start()
+
+    def traffic_replay_register(self, request_key: str):
+        """Register a replayed request so that its acknowledgement is not reported as late."""
+        self.api_web_server.request_register_replay(request_key)
@@ -1,24 +1,41 @@
 """TcEx Framework Module"""
 
 # standard library
+import atexit
+import json
+import shutil
+import time
 from abc import ABC
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
-from threading import Event, Thread
+from queue import Queue
+from threading import Event, Lock, Thread
 
 # third-party
 import paho.mqtt.client as mqtt
+from rich.layout import Layout
 from rich.panel import Panel
 from rich.table import Table
 
 # first-party
 from tcex_cli.cli.run.launch_abc import LaunchABC
+from tcex_cli.cli.run.service_metrics import ServiceMetrics
+from tcex_cli.cli.run.service_traffic import TrafficRecorder, TrafficReplay
+from tcex_cli.message_broker.mqtt_local_broker import MqttLocalBroker
 from tcex_cli.message_broker.mqtt_message_broker import MqttMessageBroker
 from tcex_cli.pleb.cached_property import cached_property
+from tcex_cli.render.render import Render
 
 
 class LaunchServiceCommonABC(LaunchABC, ABC):
     """Launch Class for all Service type Apps."""
 
+    # the number of messages/requests/responses to keep for the live display
+    live_data_history = 250
+    # the maximum number of times per second the live display is updated
+    live_data_max_fps = 4
+
     def __init__(self, config_json: Path):
         """Initialize instance properties."""
         super().__init__(config_json)
@@ -26,9 +43,19 @@ class LaunchServiceCommonABC(LaunchABC, ABC):
         # properties
         self.event = Event()
         self.display_thread: Thread
-        self.message_data: list[dict[str, str]] = []
+        self.live_data_dirty: set[str] = set()
+        self.live_data_lock = Lock()
+        self.message_data: deque[dict[str, str]] = deque(maxlen=self.live_data_history)
+        self.metrics: ServiceMetrics | None = None
+        self.metrics_queue: Queue[tuple[str, dict, float]] = Queue()
+        self.recorder: TrafficRecorder | None = None
+        self.replay: TrafficReplay | None = None
+        self.replay_thread: Thread | None = None
         self.stop_server = False
 
+        # ensure a message broker is available
+        self.message_broker_server()
+
     def live_data_commands(self):
         """Display live data."""
 
@@ -39,7 +66,7 @@ class LaunchServiceCommonABC(LaunchABC, ABC):
         table.add_column('Type')
 
         try:
-            for md in self.message_data[::-1]:
+            for md in self.live_data_rows(self.message_data):
                 table.add_row(
                     md['msg_time'],
                     md['channel'],
@@ -56,6 +83,40 @@ class LaunchServiceCommonABC(LaunchABC, ABC):
             title_align='left',
         )
 
+    def live_data_changed(self, *sections: str):
+        """Mark live display layout sections as changed and wake the display thread."""
+        with self.live_data_lock:
+            self.live_data_dirty.update(sections)
+        self.event.set()
+
+    def live_data_render(self, layout: Layout, sections: dict[str, Callable[[], Panel]]):
+        """Update changed layout sections, coalescing events into at most max fps frames.
+
+        Args:
+            layout: The live display layout.
+            sections: A mapping of layout section name to the method that renders it.
+        """
+        frame_interval = 1 / self.live_data_max_fps
+        while True:
+            self.event.wait()
+            self.event.clear()
+            with self.live_data_lock:
+                dirty, self.live_data_dirty = self.live_data_dirty, set()
+
+            self.log.trace(f'Updating live data sections: {sorted(dirty)}.')  # type: ignore
+            for name in dirty & sections.keys():
+                layout[name].update(sections[name]())
+
+            # events received while sleeping are rendered together in the next frame
+            time.sleep(frame_interval)
+
+    @staticmethod
+    def live_data_rows(data: deque) -> list:
+        """Return the newest items of data that fit on the screen, newest first."""
+        # the deque is copied first as it may be appended to by the message broker thread
+        rows = max(shutil.get_terminal_size().lines, 1)
+        return list(data)[-rows:][::-1]
+
     @cached_property
     def message_broker(self):
         """Return an instance of the Message Broker."""
@@ -65,14 +126,134 @@ class LaunchServiceCommonABC(LaunchABC, ABC):
             self.model.inputs.tc_svc_broker_timeout,  # type: ignore
         )
         broker.register_callbacks()
+        atexit.register(broker.close)
         return broker
 
+    def message_broker_server(self):
+        """Validate a message broker is running or start a local message broker."""
+        server_address = self.model.inputs.tc_svc_broker_host  # type: ignore
+        server_port = self.model.inputs.tc_svc_broker_port  # type: ignore
+
+        if self.is_port_in_use(server_address, server_port):
+            Render.panel.info(
+                message=f'Running on {server_address}:{server_port}.',
+                title=f'[{self.panel_title}]Message Broker[/]',
+            )
+        else:
+            Render.panel.info(
+                message=f'Running local message broker on {server_address}:{server_port}.',
+                title=f'[{self.panel_title}]Message Broker[/]',
+            )
+            local_broker = MqttLocalBroker((server_address, server_port))
+            t = Thread(target=local_broker.serve_forever, name='LocalMessageBroker', daemon=True)
+            t.start()
+
     def message_broker_listen(self):
         """List for message coming from broker."""
         self.message_broker.add_on_connect_callback(self.on_connect)
 
-        t = Thread(name='broker-listener', target=self.message_broker.connect, args=(), daemon=True)
-        t.start()
+        # paho runs the network loop in its own thread, only block until connected
+        if not self.message_broker.connect(
+            self.model.inputs.tc_svc_broker_conn_timeout  # type: ignore
+        ):
+            Render.panel.failure(
+                'Failed to connect to message broker on '
+                f'{self.model.inputs.tc_svc_broker_host}:{self.model.inputs.tc_svc_broker_port}.'
+            )
+        self.log.info(
+            f'step=setup, event=message-broker-connected, metrics={self.message_broker.metrics}'
+        )
+
+        # record and/or replay the message broker traffic
+        if self.recorder is not None or self.replay is not None:
+            self.message_broker.add_on_message_callback(
+                callback=self.traffic_on_message,
+                topics=[
+                    self.model.inputs.tc_svc_client_topic,  # type: ignore
+                    self.model.inputs.tc_svc_server_topic,  # type: ignore
+                ],
+            )
+
+    def metrics_enable(self, metrics_file: Path | None = None, metrics_port: int | None = None):
+        """Enable recording of request and trigger event metrics."""
+        if metrics_file is None and metrics_port is None:
+            return
+
+        self.metrics = ServiceMetrics(metrics_file, metrics_port)
+        self.metrics.add_gauge(
+            'tcex_run_broker_connected', lambda: int(self.message_broker.connected)
+        )
+        self.metrics.add_gauge(
+            'tcex_run_broker_connect_latency_ms',
+            lambda: self.message_broker.metrics['connect_latency_ms'],  # type: ignore
+        )
+        self.metrics.serve()
+        atexit.register(self.metrics.close)
+        # atexit handlers run last-in first-out, the queued records are written before close
+        atexit.register(self.metrics_queue.join)
+        Thread(target=self.metrics_worker, name='MetricsWorker', daemon=True).start()
+
+        if metrics_port is not None:
+            Render.panel.info(
+                f'Serving metrics on http://localhost:{metrics_port}/metrics',
+                f'[{self.panel_title}]Metrics[/]',
+            )
+
+    def metrics_record(self, channel: str, msg: dict, size: int):
+        """Record metrics for a message broker message.
+
+        The request and response body sizes are read from redis by the metrics worker, so the
+        message broker callback thread is not delayed by the extra redis calls.
+        """
+        if self.metrics is None:
+            return
+
+        command = (msg.get('command') or '').lower()
+        self.metrics.record_message(channel, command, size)
+        if not msg.get('requestKey'):
+            return
+
+        if (channel == 'server' and command in ('runservice', 'webhookevent')) or (
+            channel == 'client' and command == 'acknowledged'
+        ):
+            self.metrics_queue.put((channel, msg, time.perf_counter()))
+
+    def metrics_worker(self):
+        """Record the requests and responses queued by metrics_record."""
+        while True:
+            channel, msg, timestamp = self.metrics_queue.get()
+            try:
+                self.metrics_worker_record(channel, msg, timestamp)
+            except Exception:
+                self.log.exception('feature=service-metrics, event=record-failed')
+            finally:
+                self.metrics_queue.task_done()
+
+    def metrics_worker_record(self, channel: str, msg: dict, timestamp: float):
+        """Record a request (server channel) or response (client channel) with its body size."""
+        if self.metrics is None:
+            return
+
+        request_key = msg['requestKey']
+        if channel == 'server':
+            field = msg.get('bodyVariable') or 'request.body'
+            self.metrics.request_start(
+                request_key,
+                (msg.get('command') or '').lower(),
+                self.redis_client.hstrlen(request_key, field),  # type: ignore
+                timestamp=timestamp,
+                method=msg.get('method'),
+                path=msg.get('path'),
+                trigger_id=msg.get('triggerId'),
+            )
+        else:
+            field = msg.get('bodyVariable') or 'response.body'
+            self.metrics.request_end(
+                request_key,
+                msg.get('statusCode'),
+                self.redis_client.hstrlen(request_key, field),  # type: ignore
+                timestamp=timestamp,
+            )
 
     def on_connect(self, _client: mqtt.Client, _userdata, _flags, _rc: int, _properties):
         """Handle message broker on_connect events."""
@@ -84,3 +265,85 @@ class LaunchServiceCommonABC(LaunchABC, ABC):
     def publish(self, message: str, topic: str):
         """Publish message on server channel."""
         self.message_broker.publish(message, topic)
+
+    def traffic_enable(
+        self,
+        record_file: Path | None = None,
+        replay_file: Path | None = None,
+        replay_speed: float = 1.0,
+    ):
+        """Enable recording and/or replaying of the message broker traffic."""
+        if record_file is not None:
+            self.recorder = TrafficRecorder(record_file)
+            atexit.register(self.recorder.close)
+            Render.panel.info(
+                f'Recording traffic to {record_file}', f'[{self.panel_title}]Record[/]'
+            )
+
+        if replay_file is not None:
+            self.replay = TrafficReplay(replay_file, replay_speed)
+            Render.panel.info(
+                f'Replaying {len(self.replay.records)} messages from {replay_file} '
+                f'(speed: {replay_speed or "no delay"}) once the App is ready.',
+                f'[{self.panel_title}]Replay[/]',
+            )
+
+    def traffic_on_message(self, _client, _userdata, message):
+        """Record the message and start the replay once the App is ready."""
+        channel = 'client' if message.topic == self.model.inputs.tc_svc_client_topic else 'server'
+        try:
+            msg = json.loads(message.payload)
+        except ValueError:
+            msg = {}
+        command = (msg.get('command') or '').lower()
+        request_key = msg.get('requestKey')
+
+        if self.recorder is not None:
+            # the bodies are stored in redis by the request key, capture them with the message
+            bodies = {}
+            if request_key and channel == 'server' and command in ('runservice', 'webhookevent'):
+                field = msg.get('bodyVariable') or 'request.body'
+                bodies[field] = self.redis_client.hget(request_key, field)
+            elif request_key and channel == 'client' and command == 'acknowledged':
+                bodies['response.body'] = self.redis_client.hget(request_key, 'response.body')
+            self.recorder.record(
+                channel, message.payload, {k: v for k, v in bodies.items() if v is not None}
+            )
+
+        if (
+            self.replay is not None
+            and self.replay_thread is None
+            and channel == 'client'
+            and command == 'ready'
+        ):
+            self.replay_thread = Thread(target=self.traffic_replay, name='Replay', daemon=True)
+            self.replay_thread.start()
+
+    def traffic_replay(self):
+        """Publish the recorded server channel messages to the App."""
+        if self.replay is None:
+            return
+
+        count = 0
+        token = self.tc_token()
+        for record in self.replay:
+            # the App's own messages are generated by the App during the replay
+            if record['c'] != 'server':
+                continue
+
+            msg = json.loads(record['p'])
+            if 'apiToken' in msg:
+                # the recorded token has most likely expired
+                msg['apiToken'] = token
+            for field, body in record['b'].items():
+                self.redis_client.hset(msg['requestKey'], field, body)
+            if msg.get('requestKey') and msg.get('command') in ('RunService', 'WebhookEvent'):
+                self.traffic_replay_register(msg['requestKey'])
+
+            self.publish(json.dumps(msg), self.model.inputs.tc_svc_server_topic)  # type: ignore
+            count += 1
+
+        self.log.info(f'feature=traffic-replay, event=completed, count={count}')
+
+    def traffic_replay_register(self, request_key: str):
+        """Register a replayed request before it is published (Apps with a web server)."""
@@ -4,8 +4,11 @@
 import datetime
 import json
 import random
+import shutil
+import time
 from abc import ABC
 from pathlib import Path
+from threading import Thread
 
 # third-party
 from rich.panel import Panel
@@ -14,16 +17,22 @@ from rich.table import Table
 # first-party
 from tcex_cli.app.config.install_json import InstallJson
 from tcex_cli.cli.run.launch_service_common_abc import LaunchServiceCommonABC
+from tcex_cli.cli.run.trigger_simulation import TriggerSimulation
+from tcex_cli.render.render import Render
 
 
 class LaunchServiceCommonTriggersABC(LaunchServiceCommonABC, ABC):
     """Launch Class for all Service type Apps."""
 
+    # trigger types that can send events to the App override simulate_fire_events
+    simulate_events_supported = False
+
     def __init__(self, config_json: Path):
         """Initialize instance properties."""
         super().__init__(config_json)
 
         # properties
+        self.simulation: TriggerSimulation | None = None
         self.stop_server = False
         self.trigger_outputs: dict = {}
 
@@ -36,7 +45,8 @@ class LaunchServiceCommonTriggersABC(LaunchServiceCommonABC, ABC):
         table.add_column('Output')
 
         try:
-            for trigger_id, inputs in enumerate(self.model.trigger_inputs):
+            rows = shutil.get_terminal_size().lines
+            for trigger_id, inputs in enumerate(self.model.trigger_inputs[:rows]):
                 inputs_modified = inputs.copy()
                 # remove tc_playbook_out_variables as it is not helpful in this context
                 if 'tc_playbook_out_variables' in inputs_modified:
@@ -67,6 +77,8 @@ class LaunchServiceCommonTriggersABC(LaunchServiceCommonABC, ABC):
             ex_msg = f'Could not parse API service response JSON. ({message})'
             raise RuntimeError(ex_msg) from ex
 
+        self.metrics_record('client', msg, len(message.payload))
+
         command = msg.get('command').lower()
         self.message_data.append(
             {
@@ -78,16 +90,48 @@ class LaunchServiceCommonTriggersABC(LaunchServiceCommonABC, ABC):
             }
         )
 
+        sections = ['commands']
         match command:
             case 'fireevent':
+                sections.append('main')
                 trigger_id = str(msg['triggerId'])
                 session_id = msg['sessionId']
+                readback_started = time.perf_counter()
                 self.trigger_outputs[trigger_id] = self.output_data(session_id)
+                readback_latency = time.perf_counter() - readback_started
+
+                latency = None
+                if self.simulation is not None:
+                    latency = self.simulation.fire_event(trigger_id, readback_latency)
+
+                if self.metrics is not None:
+                    self.metrics.trigger_event(
+                        trigger_id,
+                        session_id,
+                        latency_ms=None if latency is None else round(latency * 1000, 3),
+                        output_bytes=self.trigger_outputs[trigger_id].nbytes,
+                        output_count=len(self.trigger_outputs[trigger_id]),
+                        readback_ms=round(readback_latency * 1000, 3),
+                    )
+
+            case 'acknowledged':
+                if (
+                    self.simulation is not None
+                    and self.simulation.event_count
+                    and msg.get('type') == 'CreateConfig'
+                    and self.simulation.config_acknowledged()
+                ):
+                    # all trigger configs have been created, start sending events
+                    Thread(
+                        target=self.simulate_fire_events, name='SimulateEvents', daemon=True
+                    ).start()
 
             case 'ready':
-                self.publish_create_config()
+                # on replay the recorded CreateConfig messages are sent instead
+                if self.replay is None:
+                    self.publish_create_config()
 
-        self.event.set()
+        self.live_data_changed(*sections)
 
     def process_server_channel(self, _client, _userdata, message):
         """Handle message broker on_message shutdown command events."""
@@ -97,6 +141,8 @@ class LaunchServiceCommonTriggersABC(LaunchServiceCommonABC, ABC):
             ex_msg = f'Could not parse API service response JSON. ({message})'
             raise RuntimeError(ex_msg) from ex
 
+        self.metrics_record('server', msg, len(message.payload))
+
         command = msg.get('command').lower()
         self.message_data.append(
             {
@@ -112,16 +158,28 @@ class LaunchServiceCommonTriggersABC(LaunchServiceCommonABC, ABC):
             case 'shutdown':
                 self.stop_server = True
 
-        self.event.set()
+        self.live_data_changed('commands')
+
+    def print_simulation_summary(self):
+        """Print the per-trigger results of the simulation."""
+        if self.simulation is None:
+            return
+
+        Render.table_trigger_simulation(
+            f'[{self.panel_title}]Trigger Simulation[/]', self.simulation.summary()
+        )
 
     def publish_create_config(self):
         """Publish create config message."""
+        # the token and output variables are the same for every trigger config
+        tc_playbook_out_variables = ','.join(InstallJson().tc_playbook_out_variables)
+        token = self.tc_token()
         for trigger_id, t_input in enumerate(self.model.trigger_inputs):
-            t_input['tc_playbook_out_variables'] = ','.join(InstallJson().tc_playbook_out_variables)
+            t_input['tc_playbook_out_variables'] = tc_playbook_out_variables
             self.publish(
                 json.dumps(
                     {
-                        'apiToken': self.tc_token(),
+                        'apiToken': token,
                         'expireSeconds': 9999999999,
                         'appId': random.randint(1, 300),  # nosec
                         'command': 'CreateConfig',
@@ -131,3 +189,32 @@ class LaunchServiceCommonTriggersABC(LaunchServiceCommonABC, ABC):
                 ),
                 self.model.inputs.tc_svc_server_topic,  # type: ignore
             )
+
+    def simulate(self, trigger_count: int, event_count: int = 0):
+        """Replace the trigger inputs with trigger_count configs generated from the first one.
+
+        Any "${trigger.id}" in the first trigger input is replaced with the generated
+        trigger id.
+        """
+        if not self.model.trigger_inputs:
+            Render.panel.failure('A trigger input is required as the simulation template.')
+
+        if event_count and not self.simulate_events_supported:
+            Render.panel.failure(
+                'The --simulate-events option is only supported for webhook trigger service Apps.'
+            )
+
+        self.simulation = TriggerSimulation(trigger_count, event_count)
+        self.model.trigger_inputs = self.simulation.configs(self.model.trigger_inputs[0])
+        self.log.info(
+            f'feature=trigger-simulation, event=configs-generated, '
+            f'trigger-count={trigger_count}, event-count={event_count}'
+        )
+
+    def simulate_fire_events(self):
+        """Send simulated events to the App once all trigger configs are created."""
+        # simulate() rejects simulated events for trigger types that can not send them
+        self.log.warning(
+            f'feature=trigger-simulation, event=events-not-supported, '
+            f'launcher={self.__class__.__name__}'
+        )
@@ -40,12 +40,13 @@ class LaunchServiceCustomTrigger(LaunchServiceCommonTriggersABC):
             screen=True,
             vertical_overflow='ellipsis',
         ) as _:
-            while True:
-                self.event.wait()
-                self.log.trace('Updating live data table.')
-                layout['main'].update(self.live_data_table())
-                layout['commands'].update(self.live_data_commands())
-                self.event.clear()
+            self.live_data_render(
+                layout,
+                {
+                    'main': self.live_data_table,
+                    'commands': self.live_data_commands,
+                },
+            )
 
     def setup(self, debug: bool = False):
         """Configure the API Web Server."""
@@ -1,9 +1,12 @@
 """TcEx Framework Module"""
 
 # standard library
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread
 
 # third-party
+from requests import Session
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.layout import Layout
 from rich.live import Live
@@ -20,6 +23,8 @@ from tcex_cli.pleb.cached_property import cached_property
 class LaunchServiceWebhookTrigger(LaunchServiceCommonTriggersABC):
     """Launch an App"""
 
+    simulate_events_supported = True
+
     @cached_property
     def api_web_server(self) -> WebServer:
         """Return an instance of the API Web Server."""
@@ -57,13 +62,14 @@ class LaunchServiceWebhookTrigger(LaunchServiceCommonTriggersABC):
             screen=True,
             vertical_overflow='ellipsis',
         ) as _:
-            while True:
-                self.event.wait()
-                self.log.trace('Updating live data table.')
-                layout['header'].update(self.live_data_header())
-                layout['main'].update(self.live_data_table())
-                layout['commands'].update(self.live_data_commands())
-                self.event.clear()
+            self.live_data_render(
+                layout,
+                {
+                    'header': self.live_data_header,
+                    'main': self.live_data_table,
+                    'commands': self.live_data_commands,
+                },
+            )
 
     def live_data_header(self) -> Panel:
         """Display live header."""
@@ -116,3 +122,45 @@ class LaunchServiceWebhookTrigger(LaunchServiceCommonTriggersABC):
                 target=self.live_data_display, name='LiveDataDisplay', daemon=True
             )
             self.display_thread.start()
+
+    def simulate_fire_events(self):
+        """Send concurrent webhook events for each simulated trigger."""
+        if self.simulation is None:
+            return
+
+        server_url = (
+            f'http://{self.model.inputs.api_service_host}:{self.model.inputs.api_service_port}'
+        )
+        session = Session()
+        # the pool size matches the worker threads, which share this session
+        session.mount('http://', HTTPAdapter(pool_maxsize=self.simulation.concurrency))
+
+        def send_event(trigger_id: str):
+            self.simulation.event_sent(trigger_id)  # type: ignore
+            try:
+                session.post(
+                    f'{server_url}/{trigger_id}',
+                    json={'triggerId': trigger_id, 'simulated': True},
+                    timeout=60,
+                )
+            except Exception:
+                self.log.exception(
+                    f'feature=trigger-simulation, event=send-failed, trigger-id={trigger_id}'
+                )
+
+        trigger_ids = [
+            str(trigger_id)
+            for _ in range(self.simulation.event_count)
+            for trigger_id in range(self.simulation.trigger_count)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self.simulation.concurrency, thread_name_prefix='SimulateEvent'
+        ) as executor:
+            # wait for all events to be sent
+            list(executor.map(send_event, trigger_ids))
+        session.close()
+        self.log.info(f'feature=trigger-simulation, event=events-sent, count={len(trigger_ids)}')
+
+    def traffic_replay_register(self, request_key: str):
+        """Register a replayed request so that its acknowledgement is not reported as late."""
+        self.api_web_server.request_register_replay(request_key)
@@ -24,6 +24,12 @@ class AppApiServiceModel(CommonModel, PlaybookCommonModel, ServiceModel):
     # HTTP Server model
     api_service_host: str = 'localhost'
     api_service_port: int = 8042
+    # the max number of requests waiting on the App, extra requests get a 503 (0 = no limit)
+    api_service_max_in_flight: int = 100
+    # the number of seconds to wait for the App to respond to a request
+    api_service_request_timeout: int = 300
+    # the Retry-After header value (in seconds) sent with a 503 response
+    api_service_retry_after: int = 5
 
     class Config:
         """DataModel Config"""
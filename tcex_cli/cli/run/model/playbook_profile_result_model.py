@@ -0,0 +1,37 @@
+"""TcEx Framework Module"""
+
+# third-party
+from pydantic import BaseModel, Field
+
+
+class PlaybookProfileResultModel(BaseModel):
+    """Model Definition"""
+
+    name: str = Field(..., description='The name of the profile.')
+    exit_code: int = Field(..., description='The exit code of the App.')
+    elapsed: float = Field(..., description='The runtime of the App in seconds.')
+    output_count: int = Field(0, description='The number of output variables.')
+    added: list[str] = Field([], description='Output variables not in the baseline.')
+    changed: list[str] = Field([], description='Output variables that differ from the baseline.')
+    missing: list[str] = Field([], description='Baseline output variables not in the output.')
+    has_baseline: bool = Field(default=False, description='True if the profile has a baseline.')
+    log_file: str = Field(..., description='The file the run output was written to.')
+
+    @property
+    def diff_value(self) -> str:
+        """Return a summary of the output difference from the baseline."""
+        if self.has_baseline is False:
+            return 'no baseline'
+        if not (self.added or self.changed or self.missing):
+            return 'match'
+        return f'+{len(self.added)} -{len(self.missing)} ~{len(self.changed)}'
+
+    @property
+    def status(self) -> bool:
+        """Return True if the App succeeded and the output matches the baseline."""
+        return self.exit_code == 0 and self.diff_value in ('match', 'no baseline')
+
+    @property
+    def status_color(self) -> str:
+        """Return the color for the status."""
+        return 'green' if self.status is True else 'red'
@@ -4,7 +4,9 @@
 import base64
 import json
 import logging
-from pathlib import PosixPath
+import re
+from pathlib import Path, PosixPath
+from typing import ClassVar
 
 # third-party
 from redis.client import Redis
@@ -16,6 +18,47 @@ from tcex_cli.input.field_type.sensitive import Sensitive
 logger = logging.getLogger('tcex')
 TC_ENTITY_KEYS = ['type', 'value', 'id']
 KEY_VALUE_KEYS = ['key', 'value']
+BASE64_PATTERN = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+BINARY_FILE_PREFIX = 'file:'
+BINARY_FILE_CHUNK_SIZE = 3 * 2**16  # must be a multiple of 3 to encode without padding
+
+
+def _binary_file_b64(path: Path) -> str:
+    """Return the base64 encoded contents of a file, read from disk in chunks."""
+    chunks = []
+    with path.open(mode='rb') as fh:
+        while chunk := fh.read(BINARY_FILE_CHUNK_SIZE):
+            chunks.append(base64.b64encode(chunk).decode('ascii'))
+    return ''.join(chunks)
+
+
+def _binary_value_b64(value: Path | str, ex_msg: str) -> str:
+    """Return a canonical base64 string for a Binary value.
+
+    Values that are already canonical base64 are validated with a regex and passed through
+    without being decoded. A Path or a string starting with "file:" is read from disk and
+    encoded. Any other string falls back to a decode/encode round trip, which also normalizes
+    values containing whitespace or other characters that b64decode discards.
+    """
+    if isinstance(value, Path) or (isinstance(value, str) and value.startswith(BINARY_FILE_PREFIX)):
+        path = value if isinstance(value, Path) else Path(value[len(BINARY_FILE_PREFIX) :])
+        try:
+            return _binary_file_b64(path)
+        except OSError as ex:
+            ex_msg += f' Could not read binary file ({ex}).'
+            raise RuntimeError(ex_msg) from ex
+
+    if not isinstance(value, str):
+        raise RuntimeError(ex_msg)  # noqa: TRY004
+
+    if len(value) % 4 == 0 and BASE64_PATTERN.fullmatch(value) is not None:
+        return value
+
+    try:
+        return base64.b64encode(base64.b64decode(value)).decode('utf-8')
+    except Exception as ex:
+        ex_msg += ' Please ensure data is base64 encoded.'
+        raise RuntimeError(ex_msg) from ex
 
 
 class BaseStagger:
@@ -71,13 +114,20 @@ class BaseStagger:
         ex_msg = f'Invalid data provided, failed to coerce value for key {self.key} ({value}).'
         raise RuntimeError(ex_msg)
 
+    def dump(self) -> str | None:
+        """Return the transformed and serialized value, or None if there is nothing to stage.
+
+        Validation is handled in __init__, so the value is not re-validated here.
+        """
+        if not self.value:
+            return None
+        return self.serialize(self.transform())
+
     def stage(self, kv_store, context):
         """Stage the provided value in the kvstore."""
-        self.validate()
-        if not self.value:
+        value = self.dump()
+        if value is None:
             return None
-        value = self.transform()
-        value = self.serialize(value)
         return kv_store.hset(context, self.key, value)
 
 
@@ -117,19 +167,11 @@ class BinaryStagger(BaseStagger):
     def validate_value(self):
         """Raise a RuntimeError if provided data is not bytes."""
         ex_msg = f'Invalid data provided for Binary ({self.key} -> {str(self.value)[:10]}...).'
-        if not isinstance(self.value, str):
-            raise RuntimeError(ex_msg)  # noqa: TRY004
-
-        try:
-            base64.b64decode(self.value)
-        except Exception as ex:
-            ex_msg += ' Please ensure data is base64 encoded.'
-            raise RuntimeError(ex_msg) from ex
+        self._value_b64 = _binary_value_b64(self.value, ex_msg)
 
     def transform(self) -> str:
-        """Return a string value from bytes."""
-        value = base64.b64decode(self.value)  # type: ignore
-        return base64.b64encode(value).decode('utf-8')
+        """Return the base64 encoded string value."""
+        return self._value_b64
 
 
 class BinaryArrayStagger(BaseStagger):
@@ -141,23 +183,11 @@ class BinaryArrayStagger(BaseStagger):
         if not isinstance(self.value, list):
             raise RuntimeError(ex_msg)  # noqa: TRY004
 
-        for value in self.value:
-            if not isinstance(value, str):
-                raise RuntimeError(ex_msg)  # noqa: TRY004
-            try:
-                base64.b64decode(value)
-            except Exception as ex:
-                ex_msg += ' Please ensure data is base64 encoded.'
-                raise RuntimeError(ex_msg) from ex
+        self._values_b64 = [_binary_value_b64(value, ex_msg) for value in self.value]
 
     def transform(self) -> list[str]:
-        """Return a list of string values from a list bytes."""
-        values = []
-        for v in self.value:
-            v_ = base64.b64decode(v)  # type: ignore
-            values.append(base64.b64encode(v_).decode('utf-8'))
-
-        return values
+        """Return a list of base64 encoded string values."""
+        return self._values_b64
 
 
 class KeyValueStagger(BaseStagger):
@@ -241,6 +271,18 @@ class TCBatchStagger(BaseStagger):
 class PlaybookCreate:
     """Playbook Write ABC"""
 
+    variable_type_map: ClassVar[dict[str, type[BaseStagger]]] = {
+        'binary': BinaryStagger,
+        'binaryarray': BinaryArrayStagger,
+        'keyvalue': KeyValueStagger,
+        'keyvaluearray': KeyValueArrayStagger,
+        'string': StringStagger,
+        'stringarray': StringArrayStagger,
+        'tcentity': TCEntityStagger,
+        'tcentityarray': TCEntityArrayStagger,
+        'tcbatch': TCBatchStagger,
+    }
+
     def __init__(self, key_value_store: Redis, context: str):
         """Initialize the class properties."""
         self.context = context
@@ -260,18 +302,41 @@ class PlaybookCreate:
 
     def any(self, key: str, value: str | dict | list[str | dict]):
         """Write the value to the keystore for all types."""
+        return self.stagger(key, value).stage(self.key_value_store, self.context)
+
+    def bulk(self, data: dict[str, str | dict | list[str | dict]]) -> int:
+        """Write all values to the keystore with a single HSET call.
+
+        All values are validated and serialized before anything is written, so an invalid
+        value will not leave the context partially staged.
 
-        variable_type_map = {
-            'binary': BinaryStagger,
-            'binaryarray': BinaryArrayStagger,
-            'keyvalue': KeyValueStagger,
-            'keyvaluearray': KeyValueArrayStagger,
-            'string': StringStagger,
-            'stringarray': StringArrayStagger,
-            'tcentity': TCEntityStagger,
-            'tcentityarray': TCEntityArrayStagger,
-            'tcbatch': TCBatchStagger,
-        }
-        data_type = self.get_data_type(key).lower()
-        stagger = variable_type_map[data_type](key, value)
-        return stagger.stage(self.key_value_store, self.context)
+        Args:
+            data: A mapping of playbook variable keys to the value to stage.
+
+        Returns:
+            int: The number of fields that were added to the context.
+        """
+        mapping = {}
+        for key, value in data.items():
+            value_ = self.stagger(key, value).dump()
+            if value_ is not None:
+                mapping[key] = value_
+
+        if not mapping:
+            return 0
+
+        self.log.debug(
+            f'feature=playbook-create, event=bulk-stage, context={self.context}, '
+            f'count={len(mapping)}'
+        )
+        return self.key_value_store.hset(self.context, mapping=mapping)  # type: ignore
+
+    def stagger(self, key: str, value: str | dict | list[str | dict]) -> BaseStagger:
+        """Return a validated stagger instance for the provided key."""
+        data_type = self.get_data_type(key)
+        try:
+            stagger_class = self.variable_type_map[data_type]
+        except KeyError as ex:
+            ex_msg = f'Invalid variable type: {data_type} provided for key {key}.'
+            raise RuntimeError(ex_msg) from ex
+        return stagger_class(key, value)
@@ -0,0 +1,149 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import os
+import subprocess  # nosec
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from uuid import uuid4
+
+# third-party
+import redis
+
+# first-party
+from tcex_cli.cli.run.model.playbook_profile_result_model import PlaybookProfileResultModel
+from tcex_cli.cli.run.playbook_read import PlaybookRead
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class PlaybookProfiles:
+    """Run playbook App input profiles concurrently, each in its own "tcex run" subprocess.
+
+    Every run gets its own kvstore context (and in/out/log paths) on the shared Redis server,
+    so the runs do not interfere with each other. When a "<profile>.outputs.json" baseline
+    exists next to the profile the output data is compared to it.
+    """
+
+    baseline_suffix = '.outputs.json'
+
+    def __init__(
+        self,
+        profiles_dir: Path,
+        redis_client: redis.Redis,
+        jobs: int | None = None,
+        out_path: Path = Path('log') / 'profiles',
+    ):
+        """Initialize instance properties.
+
+        Args:
+            profiles_dir: The directory containing the profile (app_inputs) JSON files.
+            redis_client: A client for the shared Redis server.
+            jobs: The number of profiles to run concurrently (defaults to the cpu count).
+            out_path: The directory for the per-profile inputs, logs and outputs.
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+        self.out_path = out_path
+        self.profiles_dir = profiles_dir
+        self.redis_client = redis_client
+
+        # properties
+        self.log = _logger
+
+    def _diff(self, profile: Path, outputs: dict) -> dict:
+        """Return the difference of the outputs from the profile baseline."""
+        baseline_file = profile.with_name(f'{profile.stem}{self.baseline_suffix}')
+        if not baseline_file.is_file():
+            return {'has_baseline': False}
+
+        baseline = json.loads(baseline_file.read_text(encoding='utf-8'))
+        return {
+            'added': sorted(outputs.keys() - baseline.keys()),
+            'changed': sorted(
+                k for k in outputs.keys() & baseline.keys() if outputs[k] != baseline[k]
+            ),
+            'has_baseline': True,
+            'missing': sorted(baseline.keys() - outputs.keys()),
+        }
+
+    def _prepare(self, profile: Path) -> tuple[Path, str, set[str]]:
+        """Write the run inputs for the profile, returning the file, context and staged keys."""
+        data = json.loads(profile.read_text(encoding='utf-8'))
+        run_path = (self.out_path / profile.stem).resolve()
+        run_path.mkdir(parents=True, exist_ok=True)
+
+        # each run writes to its own context and paths on the shared redis server
+        connection_kwargs = self.redis_client.connection_pool.connection_kwargs
+        context = f'{profile.stem}-{uuid4()}'
+        data.setdefault('inputs', {}).update(
+            {
+                'tc_in_path': str(run_path),
+                'tc_kvstore_host': connection_kwargs.get('host', 'localhost'),
+                'tc_kvstore_port': connection_kwargs.get('port', 6379),
+                'tc_log_path': str(run_path),
+                'tc_out_path': str(run_path),
+                'tc_playbook_kvstore_context': context,
+                'tc_playbook_kvstore_id': connection_kwargs.get('db', 0),
+                'tc_temp_path': str(run_path),
+            }
+        )
+
+        config_json = run_path / 'app_inputs.json'
+        config_json.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        return config_json, context, set(data.get('stage', {}).get('kvstore', {}))
+
+    @property
+    def profiles(self) -> list[Path]:
+        """Return the profile files."""
+        return sorted(
+            p for p in self.profiles_dir.glob('*.json') if not p.name.endswith(self.baseline_suffix)
+        )
+
+    def run(self) -> list[PlaybookProfileResultModel]:
+        """Run all profiles, returning the results in profile order."""
+        self.log.info(
+            f'feature=playbook-profiles, event=run, count={len(self.profiles)}, jobs={self.jobs}'
+        )
+        with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix='Profile') as executor:
+            return list(executor.map(self.run_profile, self.profiles))
+
+    def run_profile(self, profile: Path) -> PlaybookProfileResultModel:
+        """Run a single profile in a subprocess."""
+        config_json, context, staged_keys = self._prepare(profile)
+        log_file = config_json.with_name('run.log')
+
+        started = time.perf_counter()
+        with log_file.open(mode='wb') as fh:
+            result = subprocess.run(  # nosec
+                [sys.executable, '-m', 'tcex_cli.cli.cli', 'run', '--config-json', config_json],
+                check=False,
+                stderr=subprocess.STDOUT,
+                stdout=fh,
+            )
+        elapsed = time.perf_counter() - started
+
+        # read the outputs from the shared redis server, then remove the run context
+        outputs = dict(PlaybookRead(self.redis_client, context).output_data(exclude=staged_keys))
+        self.redis_client.delete(context)
+        config_json.with_name('outputs.json').write_text(
+            json.dumps(outputs, indent=2, sort_keys=True), encoding='utf-8'
+        )
+
+        self.log.info(
+            f'feature=playbook-profiles, event=profile-complete, profile={profile.name}, '
+            f'exit-code={result.returncode}, elapsed={elapsed:.3f}'
+        )
+        return PlaybookProfileResultModel(
+            name=profile.stem,
+            exit_code=result.returncode,
+            elapsed=elapsed,
+            output_count=len(outputs),
+            log_file=str(log_file),
+            **self._diff(profile, outputs),
+        )
@@ -0,0 +1,102 @@
+"""Playbook Read"""
+
+# standard library
+import json
+import logging
+from collections.abc import Iterator, Mapping
+
+# third-party
+from redis.client import Redis
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class OutputData(Mapping):
+    """Read-only mapping of output variables that JSON decodes values on first access."""
+
+    def __init__(self, raw_data: dict[str, bytes]):
+        """Initialize the class properties."""
+        self._cache: dict[str, dict | list | str | None] = {}
+        self._raw_data = raw_data
+
+    def __getitem__(self, key: str) -> dict | list | str | None:
+        """Return the decoded value for the provided key."""
+        if key not in self._cache:
+            raw_value = self._raw_data[key]
+            try:
+                self._cache[key] = json.loads(raw_value)
+            except ValueError:
+                # values not written by tcex may not be JSON, return them as a string
+                self._cache[key] = raw_value.decode('utf-8', errors='replace')
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Return an iterator over the output variable keys."""
+        return iter(self._raw_data)
+
+    def __len__(self) -> int:
+        """Return the number of output variables."""
+        return len(self._raw_data)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the total size of the raw (encoded) values."""
+        return sum(len(v) for v in self._raw_data.values())
+
+    def __repr__(self) -> str:
+        """Return the keys of the output data."""
+        return f'{self.__class__.__name__}({list(self._raw_data)})'
+
+
+class PlaybookRead:
+    """Playbook Read"""
+
+    # contexts with more fields than this are read incrementally with HSCAN
+    scan_threshold = 1_000
+    # the number of fields the server should return per HSCAN call
+    scan_count = 1_000
+
+    def __init__(self, key_value_store: Redis, context: str):
+        """Initialize the class properties."""
+        self.context = context
+        self.key_value_store = key_value_store
+
+        # properties
+        self.log = logger
+
+    def _items(self, pattern: str | None) -> Iterator[tuple[bytes, bytes]]:
+        """Yield the raw key/value pairs for the context."""
+        if pattern is None and self.key_value_store.hlen(self.context) <= self.scan_threshold:
+            yield from self.key_value_store.hgetall(self.context).items()  # type: ignore
+            return
+
+        # the MATCH filter is applied by redis, so non-matching values are never transferred
+        yield from self.key_value_store.hscan_iter(
+            self.context, match=pattern, count=self.scan_count
+        )
+
+    def output_data(
+        self, pattern: str | None = None, exclude: set[str] | frozenset[str] = frozenset()
+    ) -> OutputData:
+        """Return the output data for the context.
+
+        Args:
+            pattern: An optional redis glob-style pattern (e.g. "#App:*:*!String") to select
+                the output variables to return.
+            exclude: Variable keys to exclude from the output data (e.g. staged keys).
+
+        Returns:
+            OutputData: A mapping of variable key to the (lazily) decoded value.
+        """
+        raw_data = {}
+        for key, value in self._items(pattern):
+            key_ = key.decode('utf-8')
+            if key_ not in exclude:
+                raw_data[key_] = value
+
+        self.log.debug(
+            f'feature=playbook-read, event=output-data, context={self.context}, '
+            f'count={len(raw_data)}'
+        )
+        return OutputData(raw_data)
@@ -0,0 +1,27 @@
+"""TcEx Framework Module"""
+
+# standard library
+import http.server
+from abc import ABC
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # first-party
+    from tcex_cli.cli.run.web_server import WebServer  # CIRCULAR IMPORT
+
+
+class RequestHandlerABC(http.server.BaseHTTPRequestHandler, ABC):
+    """Base request handler for the API and webhook trigger service web servers."""
+
+    server: 'WebServer'
+
+    def _build_response_busy(self) -> None:
+        """Build the response sent when the max in-flight request limit is reached."""
+        self.server.log.warning(
+            'feature=web-server, event=max-in-flight-reached, '
+            f'max-in-flight={self.server.inputs.api_service_max_in_flight}'
+        )
+        self.send_response(503)
+        self.send_header('Retry-After', str(self.server.inputs.api_service_retry_after))
+        self.send_header('Content-Length', '0')
+        self.end_headers()
@@ -1,20 +1,21 @@
 """TcEx Framework Module"""
 
 # standard library
-import http.server
 import json
 import time
-from threading import Event
 from typing import TYPE_CHECKING
 from urllib.parse import parse_qs, urlparse
 from uuid import uuid4
 
+# first-party
+from tcex_cli.cli.run.request_handler_abc import RequestHandlerABC
+
 if TYPE_CHECKING:
     # first-party
     from tcex_cli.cli.run.web_server import WebServer  # CIRCULAR IMPORT
 
 
-class RequestHandlerApi(http.server.BaseHTTPRequestHandler):
+class RequestHandlerApi(RequestHandlerABC):
     """Request handler to forward request to API service.
 
     Required the following in WebServer class:
@@ -133,7 +134,13 @@ class RequestHandlerApi(http.server.BaseHTTPRequestHandler):
             response: The response data from API service.
         """
         if response is None:
-            self.send_error(500, message='No response sent on message broker client channel.')
+            self.send_error(
+                504,
+                message=(
+                    'No response sent on message broker client channel within '
+                    f'{self.server.inputs.api_service_request_timeout} seconds.'
+                ),
+            )
             return
 
         # status code
@@ -155,25 +162,30 @@ class RequestHandlerApi(http.server.BaseHTTPRequestHandler):
         Args:
             method: The HTTP method.
         """
-        request = self._build_request(method)
-        request_key = request['requestKey']
+        # reject the request if the App already has the max number of requests in flight
+        if not self.server.request_acquire():
+            self._build_response_busy()
+            return
 
-        # create lock and sve request
-        event = Event()
-        self.server.active_requests[request_key] = event
+        request_key = None
+        try:
+            request = self._build_request(method)
+            request_key = request['requestKey']
 
-        # publish run service
-        self.server.publish(
-            message=json.dumps(request), topic=self.server.inputs.tc_svc_server_topic
-        )
+            # create lock and save request
+            event = self.server.request_register(request_key)
 
-        # block for x seconds
-        event.wait(300)
-        response: dict = self.server.active_responses.pop(request_key, None)
+            # publish run service
+            self.server.publish(
+                message=json.dumps(request), topic=self.server.inputs.tc_svc_server_topic
+            )
 
-        self._build_response(response=response)
+            # block until the App responds or the request times out
+            event.wait(self.server.inputs.api_service_request_timeout)
+        finally:
+            response = self.server.request_release(request_key)
 
-        return  # noqa: PLR1711
+        self._build_response(response=response)
 
     def do_DELETE(self):  # noqa: N802
         """Handle DELETE method."""
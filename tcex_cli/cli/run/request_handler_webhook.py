@@ -1,19 +1,20 @@
 """TcEx Framework Module"""
 
 # standard library
-import http.server
 import json
-from threading import Event
 from typing import TYPE_CHECKING
 from urllib.parse import parse_qs, urlparse
 from uuid import uuid4
 
+# first-party
+from tcex_cli.cli.run.request_handler_abc import RequestHandlerABC
+
 if TYPE_CHECKING:
     # first-party
     from tcex_cli.cli.run.web_server import WebServer  # CIRCULAR IMPORT
 
 
-class RequestHandlerWebhook(http.server.BaseHTTPRequestHandler):
+class RequestHandlerWebhook(RequestHandlerABC):
     """Request handler to forward request to API service."""
 
     server: 'WebServer'
@@ -80,29 +81,34 @@ class RequestHandlerWebhook(http.server.BaseHTTPRequestHandler):
         Args:
             method: The HTTP method.
         """
-        request = self._build_request(method)
-        request_key = request['requestKey']
+        # reject the request if the App already has the max number of requests in flight
+        if not self.server.request_acquire():
+            self._build_response_busy()
+            return
+
+        request_key = None
+        try:
+            request = self._build_request(method)
+            request_key = request['requestKey']
 
-        # create lock and sve request
-        event = Event()
-        self.server.active_requests[request_key] = event
+            # create lock and save request
+            event = self.server.request_register(request_key)
 
-        # publish run service
-        self.server.publish(
-            message=json.dumps(request), topic=self.server.inputs.tc_svc_server_topic
-        )
+            # publish run service
+            self.server.publish(
+                message=json.dumps(request), topic=self.server.inputs.tc_svc_server_topic
+            )
 
-        # block for x seconds
-        event.wait(60)
-        response: dict = self.server.active_responses.pop(request_key, None)
+            # block until the App responds or the request times out
+            event.wait(self.server.inputs.api_service_request_timeout)
+        finally:
+            response = self.server.request_release(request_key)
 
         if response is None or response.get('statusCode') is None:
             self._build_response()
         else:
             self._build_response_marshall(response=response)
 
-        return  # noqa: PLR1711
-
     def do_DELETE(self):  # noqa: N802
         """Handle DELETE method."""
         return self.call_service('DELETE')
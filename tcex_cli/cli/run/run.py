@@ -2,6 +2,7 @@
 
 # standard library
 from pathlib import Path
+from typing import Optional
 
 # third-party
 import typer
@@ -10,6 +11,12 @@ import typer
 from tcex_cli.cli.run.run_cli import RunCli
 from tcex_cli.render.render import Render
 
+# typer does not yet support PEP 604, but pyupgrade will enforce
+# PEP 604. this is a temporary workaround until support is added.
+IntOrNone = Optional[int]  # noqa: UP007
+PathOrNone = Optional[Path]  # noqa: UP007
+StrOrNone = Optional[str]  # noqa: UP007
+
 
 def command(
     config_json: Path = typer.Option(
@@ -19,6 +26,79 @@ def command(
     debug_port: int = typer.Option(
         5678, help='The port to use for the debug server. This must match the launch.json file.'
     ),
+    headless: bool = typer.Option(
+        default=False, help='Run service Apps without the live display (e.g. in CI).'
+    ),
+    jobs: IntOrNone = typer.Option(
+        None, help='The number of profiles to run concurrently (defaults to the cpu count).'
+    ),
+    metrics_file: PathOrNone = typer.Option(
+        None,
+        help=(
+            'An OPTIONAL file to write service App request and trigger event metrics to. '
+            'Records are written as JSONL, or in the Prometheus text format for a .prom file.'
+        ),
+    ),
+    metrics_port: IntOrNone = typer.Option(
+        None,
+        help='An OPTIONAL port to serve service App metrics on (http://localhost:<port>/metrics).',
+    ),
+    output_pattern: StrOrNone = typer.Option(
+        None,
+        help=(
+            'An OPTIONAL glob-style pattern (e.g. "#App:*:*!String") to select the output '
+            'variables to display for Playbook Apps.'
+        ),
+    ),
+    profiles: PathOrNone = typer.Option(
+        None,
+        help=(
+            'An OPTIONAL directory of playbook App input profiles (JSON) to run concurrently '
+            'in subprocesses, comparing outputs to any "<profile>.outputs.json" baseline.'
+        ),
+    ),
+    record: PathOrNone = typer.Option(
+        None,
+        help=(
+            'An OPTIONAL file to record the service App message broker traffic and '
+            'request/response bodies to (gzip JSONL).'
+        ),
+    ),
+    repeat: IntOrNone = typer.Option(
+        None,
+        help=(
+            'An OPTIONAL number of times to run a job or playbook App, keeping the harness '
+            '(Redis, session, imported dependencies) alive between runs.'
+        ),
+    ),
+    replay: PathOrNone = typer.Option(
+        None, help='An OPTIONAL traffic file (from --record) to replay to the service App.'
+    ),
+    replay_speed: float = typer.Option(
+        1.0,
+        help='The replay speed multiplier (e.g., 2.0 is twice as fast, 0 sends with no delay).',
+    ),
+    simulate_events: int = typer.Option(
+        0,
+        help=(
+            'The number of concurrent events to send to each simulated webhook trigger '
+            '(requires --simulate-triggers).'
+        ),
+    ),
+    simulate_triggers: IntOrNone = typer.Option(
+        None,
+        help=(
+            'An OPTIONAL number of trigger configs to generate from the first trigger input for '
+            'trigger service Apps. Any "${trigger.id}" in the input is replaced with the id.'
+        ),
+    ),
+    watch: bool = typer.Option(
+        default=False,
+        help=(
+            'Run a job or playbook App again each time the App inputs or source change, '
+            'keeping the harness alive between runs.'
+        ),
+    ),
 ):
     """Run the App."""
     cli = RunCli()
@@ -29,12 +109,36 @@ def command(
         if not config_json.is_file():
             Render.panel.failure(f'Config file not found [{config_json}]')
 
+        # simulated events are sent to the simulated triggers
+        if simulate_events and simulate_triggers is None:
+            Render.panel.failure('The --simulate-events option requires --simulate-triggers.')
+
         # run in debug mode
         if debug is True:
             cli.debug(debug_port)
 
+        # run the App input profiles concurrently
+        if profiles is not None:
+            cli.run_profiles(config_json, profiles, jobs)
+
+        # run the App repeatedly with a warm harness
+        if watch is True or repeat is not None:
+            cli.run_watch(config_json, output_pattern, repeat=repeat, watch=watch)
+
         # run the App
-        cli.run(config_json, debug)
+        cli.run(
+            config_json,
+            debug,
+            output_pattern,
+            headless=headless,
+            metrics_file=metrics_file,
+            metrics_port=metrics_port,
+            record_file=record,
+            replay_file=replay,
+            replay_speed=replay_speed,
+            simulate_events=simulate_events,
+            simulate_triggers=simulate_triggers,
+        )
 
     except Exception as ex:
         cli.log.exception('Failed to run "tcex run" command.')
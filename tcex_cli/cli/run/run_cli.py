@@ -3,6 +3,7 @@
 # standard library
 import os
 import sys
+import time
 from pathlib import Path
 
 # first-party
@@ -15,6 +16,8 @@ from tcex_cli.cli.run.launch_service_custom_trigger import LaunchServiceCustomTr
 from tcex_cli.cli.run.launch_service_webhook_trigger import LaunchServiceWebhookTrigger
 from tcex_cli.cli.run.model.app_api_service_model import AppApiServiceModel
 from tcex_cli.cli.run.model.app_webhook_trigger_service_model import AppWebhookTriggerServiceModel
+from tcex_cli.cli.run.playbook_profiles import PlaybookProfiles
+from tcex_cli.cli.run.run_watcher import RunWatcher
 from tcex_cli.render.render import Render
 
 
@@ -49,6 +52,22 @@ class RunCli(CliABC):
             'API Settings',
         )
 
+    @staticmethod
+    def _launch_service(
+        launch_app: LaunchServiceApi | LaunchServiceCustomTrigger | LaunchServiceWebhookTrigger,
+        no_display: bool,
+        metrics_file: Path | None = None,
+        metrics_port: int | None = None,
+        record_file: Path | None = None,
+        replay_file: Path | None = None,
+        replay_speed: float = 1.0,
+    ) -> int:
+        """Setup and launch a service App, returning the exit code."""
+        launch_app.metrics_enable(metrics_file, metrics_port)
+        launch_app.traffic_enable(record_file, replay_file, replay_speed)
+        launch_app.setup(no_display)
+        return launch_app.launch()
+
     def _validate_in_app_directory(self):
         """Return True if in App directory."""
         if not Path('app.py').is_file() or not Path('run.py').is_file():
@@ -72,23 +91,44 @@ class RunCli(CliABC):
         Render.panel.info(f'{exit_code}', f'[{self.panel_title}]Exit Code[/]')
         sys.exit(exit_code)
 
-    def run(self, config_json: Path, debug: bool = False):
+    def run(
+        self,
+        config_json: Path,
+        debug: bool = False,
+        output_pattern: str | None = None,
+        headless: bool = False,
+        metrics_file: Path | None = None,
+        metrics_port: int | None = None,
+        record_file: Path | None = None,
+        replay_file: Path | None = None,
+        replay_speed: float = 1.0,
+        simulate_events: int = 0,
+        simulate_triggers: int | None = None,
+    ):
         """Run the App"""
+        # the live display is not started in debug or headless mode
+        no_display = debug or headless
+        service_options = {
+            'metrics_file': metrics_file,
+            'metrics_port': metrics_port,
+            'record_file': record_file,
+            'replay_file': replay_file,
+            'replay_speed': replay_speed,
+        }
+
         match self.ij.model.runtime_level.lower():
             case 'apiservice':
                 Render.panel.info('Launching API Service', f'[{self.panel_title}]Running App[/]')
                 launch_app = LaunchServiceApi(config_json)
                 self._display_api_settings(launch_app.model.inputs)
-                launch_app.setup(debug)
-                exit_code = launch_app.launch()
+                exit_code = self._launch_service(launch_app, no_display, **service_options)
 
             case 'feedapiservice':
                 Render.panel.info(
                     'Launching Feed API Service', f'[{self.panel_title}]Running App[/]'
                 )
                 launch_app = LaunchServiceApi(config_json)
-                launch_app.setup(debug)
-                exit_code = launch_app.launch()
+                exit_code = self._launch_service(launch_app, no_display, **service_options)
 
             case 'organization' | 'system':
                 Render.panel.info('Launching Job App', f'[{self.panel_title}]Running App[/]')
@@ -101,15 +141,17 @@ class RunCli(CliABC):
                 launch_app.stage()
                 exit_code = launch_app.launch()
                 launch_app.print_input_data()
-                launch_app.print_output_data()
+                launch_app.print_output_data(output_pattern)
 
             case 'triggerservice':
                 Render.panel.info(
                     'Launching Trigger Service', f'[{self.panel_title}]Running App[/]'
                 )
                 launch_app = LaunchServiceCustomTrigger(config_json)
-                launch_app.setup(debug)
-                exit_code = launch_app.launch()
+                if simulate_triggers is not None:
+                    launch_app.simulate(simulate_triggers, simulate_events)
+                exit_code = self._launch_service(launch_app, no_display, **service_options)
+                launch_app.print_simulation_summary()
 
             case 'webhooktriggerservice':
                 Render.panel.info(
@@ -117,11 +159,110 @@ class RunCli(CliABC):
                 )
                 launch_app = LaunchServiceWebhookTrigger(config_json)
                 self._display_api_settings(launch_app.model.inputs)
-                launch_app.setup(debug)
-                exit_code = launch_app.launch()
+                if simulate_triggers is not None:
+                    launch_app.simulate(simulate_triggers, simulate_events)
+                exit_code = self._launch_service(launch_app, no_display, **service_options)
+                launch_app.print_simulation_summary()
 
             case _:
                 Render.panel.failure(f'Invalid runtime level: {self.ij.model.runtime_level}')
 
         # exit execution
         self.exit_cli(exit_code)
+
+    def run_profiles(self, config_json: Path, profiles_dir: Path, jobs: int | None = None):
+        """Run the playbook App input profiles concurrently and summarize the results.
+
+        Args:
+            config_json: The App inputs file used to locate (or start) the shared Redis server.
+            profiles_dir: The directory containing the profile JSON files.
+            jobs: The number of profiles to run concurrently.
+        """
+        if self.ij.model.runtime_level.lower() != 'playbook':
+            Render.panel.failure('Profiles are only supported for playbook Apps.')
+
+        if not profiles_dir.is_dir():
+            Render.panel.failure(f'Profiles directory not found [{profiles_dir}]')
+
+        # the harness keeps the (fake) redis server running for the subprocesses
+        launch_app = LaunchPlaybook(config_json)
+        playbook_profiles = PlaybookProfiles(profiles_dir, launch_app.redis_client, jobs)
+        if not playbook_profiles.profiles:
+            Render.panel.failure(f'No profiles found in [{profiles_dir}]')
+
+        Render.panel.info(
+            f'Running {len(playbook_profiles.profiles)} profiles with '
+            f'{playbook_profiles.jobs} jobs.',
+            f'[{self.panel_title}]Running Profiles[/]',
+        )
+        results = playbook_profiles.run()
+        Render.table_profile_summary(f'[{self.panel_title}]Profile Summary[/]', results)
+
+        # exit execution
+        self.exit_cli(0 if all(r.status for r in results) else 1)
+
+    def run_watch(
+        self,
+        config_json: Path,
+        output_pattern: str | None = None,
+        repeat: int | None = None,
+        watch: bool = False,
+    ):
+        """Run a job or playbook App repeatedly, keeping the harness alive between runs.
+
+        Args:
+            config_json: The App inputs file.
+            output_pattern: An optional pattern to select the output variables to display.
+            repeat: The number of runs (unlimited if not set in watch mode).
+            watch: If True, wait for the inputs or App source to change before each run.
+        """
+        runtime_level = self.ij.model.runtime_level.lower()
+        match runtime_level:
+            case 'organization' | 'system':
+                launch_app = LaunchOrganization(config_json)
+
+            case 'playbook':
+                launch_app = LaunchPlaybook(config_json)
+
+            case _:
+                Render.panel.failure(
+                    'Watch and repeat mode are only supported for job and playbook Apps.'
+                )
+
+        watcher = RunWatcher(self.app_path, [config_json, Path('.env')])
+        input_files = set(watcher.input_files)
+        iteration = 0
+        while True:
+            iteration += 1
+            started = time.perf_counter()
+            if isinstance(launch_app, LaunchPlaybook):
+                launch_app.stage()
+            exit_code = launch_app.launch()
+            elapsed = time.perf_counter() - started
+
+            launch_app.print_input_data()
+            if isinstance(launch_app, LaunchPlaybook):
+                launch_app.print_output_data(output_pattern)
+            Render.panel.info(
+                f'Exit Code: [{self.accent}]{exit_code}[/{self.accent}], '
+                f'Elapsed: [{self.accent}]{elapsed:.3f}s[/{self.accent}]',
+                f'[{self.panel_title}]Run {iteration}[/]',
+            )
+
+            if repeat is not None and iteration >= repeat:
+                break
+
+            changed = set()
+            if watch:
+                Render.panel.info(
+                    'Waiting for the App inputs or source to change.',
+                    f'[{self.panel_title}]Watching[/]',
+                )
+                changed = watcher.wait_for_change()
+
+            if changed - input_files:
+                watcher.purge_app_modules()
+            launch_app.reload(inputs_changed=bool(changed & input_files))
+
+        # exit execution
+        self.exit_cli(exit_code)
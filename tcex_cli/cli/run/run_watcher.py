@@ -0,0 +1,120 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class RunWatcher:
+    """Watch the App inputs and source files for changes between runs."""
+
+    # directories that never contain App source (dependencies, build output, caches)
+    excluded_dirs = frozenset(
+        {
+            '.git',
+            '.mypy_cache',
+            '.pytest_cache',
+            '.ruff_cache',
+            '.venv',
+            '__pycache__',
+            'deps',
+            'deps_tests',
+            'lib_latest',
+            'log',
+            'out',
+            'target',
+            'tests',
+        }
+    )
+
+    def __init__(self, app_path: Path, input_files: list[Path], poll_interval: float = 0.5):
+        """Initialize instance properties.
+
+        Args:
+            app_path: The App directory.
+            input_files: The input files (e.g., app_inputs.json, .env) to watch.
+            poll_interval: The number of seconds between checks for changes.
+        """
+        self.app_path = app_path.resolve()
+        self.input_files = [f.resolve() for f in input_files]
+        self.poll_interval = poll_interval
+
+        # properties
+        self.log = _logger
+        self.mtimes = self.snapshot()
+
+    def _source_files(self, path: Path):
+        """Yield the App python files, pruning excluded directories."""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.excluded_dirs and not entry.name.startswith('lib_'):
+                        yield from self._source_files(Path(entry.path))
+                elif entry.name.endswith('.py'):
+                    yield Path(entry.path)
+
+    def is_app_module(self, file: str | None) -> bool:
+        """Return True if the module file is App source (not a dependency)."""
+        if not file:
+            return False
+
+        path = Path(file).resolve()
+        try:
+            parts = path.relative_to(self.app_path).parts
+        except ValueError:
+            return False
+        return not any(p in self.excluded_dirs or p.startswith('lib_') for p in parts[:-1])
+
+    def purge_app_modules(self) -> list[str]:
+        """Remove the App modules from sys.modules so they are imported fresh on the next run.
+
+        All App modules are removed (not just the changed ones), since modules that imported
+        names from a changed module would otherwise keep references to the old objects.
+        Dependencies (e.g., tcex) stay imported, which is where most of the import time is.
+        """
+        purged = [
+            name
+            for name, module in list(sys.modules.items())
+            if self.is_app_module(getattr(module, '__file__', None))
+        ]
+        for name in purged:
+            del sys.modules[name]
+        self.log.debug(f'feature=run-watcher, event=purge-app-modules, count={len(purged)}')
+        return purged
+
+    def snapshot(self) -> dict[Path, int]:
+        """Return the modified time of each watched file."""
+        mtimes = {}
+        for file in [*self.input_files, *self._source_files(self.app_path)]:
+            try:
+                mtimes[file] = file.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return mtimes
+
+    def wait_for_change(self) -> set[Path]:
+        """Block until a watched file is added, changed, or removed, returning the files."""
+        while True:
+            time.sleep(self.poll_interval)
+            mtimes = self.snapshot()
+            changed = {
+                file
+                for file in mtimes.keys() | self.mtimes.keys()
+                if mtimes.get(file) != self.mtimes.get(file)
+            }
+            if changed:
+                self.mtimes = mtimes
+                self.log.info(
+                    f'feature=run-watcher, event=change-detected, '
+                    f'files={sorted(str(f) for f in changed)}'
+                )
+                return changed
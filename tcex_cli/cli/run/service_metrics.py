@@ -0,0 +1,308 @@
+"""TcEx Framework Module"""
+
+# standard library
+import http.server
+import json
+import logging
+import statistics
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock, Thread
+from typing import TextIO
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+# metric family name -> (type, help)
+METRIC_DEFINITIONS = {
+    'tcex_run_messages_total': ('counter', 'Message broker messages by channel and command.'),
+    'tcex_run_message_bytes_total': ('counter', 'Message broker payload bytes by channel.'),
+    'tcex_run_requests_total': ('counter', 'Completed requests by command and status code.'),
+    'tcex_run_request_bytes_total': ('counter', 'Request and response body bytes.'),
+    'tcex_run_request_latency_seconds': ('summary', 'Request latency in seconds by command.'),
+    'tcex_run_requests_in_flight': ('gauge', 'Requests sent to the App without a response.'),
+    'tcex_run_trigger_events_total': ('counter', 'Trigger fire events by trigger id.'),
+    'tcex_run_trigger_output_bytes_total': ('counter', 'Trigger output variable bytes.'),
+}
+
+
+class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the metrics in the Prometheus text format."""
+
+    server: 'MetricsServer'
+
+    def do_GET(self):
+        """Handle GET method."""
+        if self.path.split('?', 1)[0] != '/metrics':
+            self.send_error(404)
+            return
+
+        body = self.server.service_metrics.prometheus_text().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Do not write access logs to stderr, it would corrupt the console output."""
+
+
+class MetricsServer(http.server.ThreadingHTTPServer):
+    """HTTP Server for the /metrics endpoint."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, server_address: tuple[str, int], service_metrics: 'ServiceMetrics'):
+        """Initialize instance properties"""
+        super().__init__(server_address, MetricsRequestHandler)
+        self.service_metrics = service_metrics
+
+
+class ServiceMetrics:
+    """Record per-request and per-trigger-event metrics for service Apps.
+
+    Records are appended to a JSONL file (or the aggregates are written in the Prometheus
+    text format when the file name ends in .prom) and can be served on a /metrics endpoint.
+    """
+
+    # the minimum number of seconds between rewrites of a Prometheus text file
+    prometheus_write_interval = 1.0
+    # the request latency quantiles and the number of recent requests they are computed from
+    latency_quantiles = (0.5, 0.9, 0.99)
+    latency_window = 1024
+
+    def __init__(
+        self,
+        metrics_file: Path | None = None,
+        metrics_port: int | None = None,
+        metrics_host: str = 'localhost',
+    ):
+        """Initialize instance properties."""
+        self.metrics_file = metrics_file
+        self.metrics_host = metrics_host
+        self.metrics_port = metrics_port
+
+        # properties
+        self._fh: TextIO | None = None
+        self._gauges: dict[str, Callable[[], float | None]] = {}
+        self._latencies: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.latency_window)
+        )
+        self._lock = Lock()
+        self._pending: dict[str, dict] = {}
+        self._prometheus_written = 0.0
+        self._values: defaultdict[tuple[str, tuple[tuple[str, str], ...]], float] = defaultdict(
+            float
+        )
+        self.log = _logger
+
+        if self.metrics_file is not None:
+            self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        if self.metrics_file is not None and not self.prometheus_file:
+            self._fh = self.metrics_file.open(mode='a', encoding='utf-8', buffering=1)
+
+    @staticmethod
+    def _now() -> str:
+        """Return the current time as an ISO 8601 string."""
+        return datetime.now(UTC).isoformat()
+
+    def _inc(self, name: str, value: float = 1, **labels: str):
+        """Increment a metric value (caller must hold the lock)."""
+        self._values[(name, tuple(sorted(labels.items())))] += value
+
+    @staticmethod
+    def _metric_family(name: str) -> str:
+        """Return the metric family of a sample name (e.g., the _sum sample of a summary)."""
+        for suffix in ('_sum', '_count'):
+            family = name.removesuffix(suffix)
+            if family != name and METRIC_DEFINITIONS.get(family, ('',))[0] == 'summary':
+                return family
+        return name
+
+    def _latency_quantiles(self) -> list[tuple[tuple[str, tuple[tuple[str, str], ...]], float]]:
+        """Return the request latency quantile samples (caller must hold the lock)."""
+        samples = []
+        for command, latencies in self._latencies.items():
+            values = sorted(latencies)
+            cut_points = (
+                statistics.quantiles(values, n=100, method='inclusive')
+                if len(values) > 1
+                else values * 99
+            )
+            for quantile in self.latency_quantiles:
+                labels = (('command', command), ('quantile', f'{quantile:g}'))
+                samples.append(
+                    (
+                        ('tcex_run_request_latency_seconds', labels),
+                        cut_points[round(quantile * 100) - 1],
+                    )
+                )
+        return samples
+
+    def add_gauge(self, name: str, callback: Callable[[], float | None]):
+        """Add a gauge whose value is read from callback when the metrics are exported."""
+        self._gauges[name] = callback
+
+    def close(self):
+        """Flush and close the metrics file."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+        if self.prometheus_file:
+            self.write_prometheus_file()
+
+    @property
+    def prometheus_file(self) -> bool:
+        """Return True if the metrics file should be written in the Prometheus text format."""
+        return self.metrics_file is not None and self.metrics_file.suffix == '.prom'
+
+    def prometheus_text(self) -> str:
+        """Return the aggregated metrics in the Prometheus text exposition format."""
+        with self._lock:
+            values = sorted([*self._values.items(), *self._latency_quantiles()])
+            in_flight = len(self._pending)
+
+        lines = []
+        names_written = set()
+        for (name, labels), value in [
+            *values,
+            (('tcex_run_requests_in_flight', ()), in_flight),
+        ]:
+            family = self._metric_family(name)
+            if family not in names_written:
+                metric_type, metric_help = METRIC_DEFINITIONS[family]
+                lines.append(f'# HELP {family} {metric_help}')
+                lines.append(f'# TYPE {family} {metric_type}')
+                names_written.add(family)
+            labels_ = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f'{name}{{{labels_}}} {value:g}' if labels_ else f'{name} {value:g}')
+
+        for name, callback in sorted(self._gauges.items()):
+            value = callback()
+            if value is not None:
+                lines.append(f'# TYPE {name} gauge')
+                lines.append(f'{name} {value:g}')
+
+        return '\n'.join(lines) + '\n'
+
+    def record(self, record: dict):
+        """Write a record to the metrics file."""
+        record.setdefault('timestamp', self._now())
+        if self._fh is not None:
+            line = json.dumps(record, default=str)
+            with self._lock:
+                if self._fh is not None:
+                    self._fh.write(f'{line}\n')
+        elif self.prometheus_file:
+            now = time.monotonic()
+            with self._lock:
+                write = now - self._prometheus_written >= self.prometheus_write_interval
+                if write:
+                    self._prometheus_written = now
+            if write:
+                self.write_prometheus_file()
+
+    def record_message(self, channel: str, command: str, size: int):
+        """Record a message broker message."""
+        with self._lock:
+            self._inc('tcex_run_messages_total', channel=channel, command=command)
+            self._inc('tcex_run_message_bytes_total', size, channel=channel)
+
+    def request_end(
+        self,
+        request_key: str,
+        status_code: str | int | None,
+        body_size: int = 0,
+        timestamp: float | None = None,
+    ):
+        """Record the response for a request (timestamp is the time.perf_counter() received)."""
+        end = time.perf_counter() if timestamp is None else timestamp
+        with self._lock:
+            start = self._pending.pop(request_key, None)
+            if start is None:
+                return
+
+            latency = end - start.pop('_started')
+            command = start['command']
+            self._inc('tcex_run_requests_total', command=command, status_code=str(status_code))
+            self._inc('tcex_run_request_bytes_total', body_size, direction='response')
+            self._inc('tcex_run_request_latency_seconds_sum', latency, command=command)
+            self._inc('tcex_run_request_latency_seconds_count', command=command)
+            self._latencies[command].append(latency)
+
+        self.record(
+            {
+                **start,
+                'type': 'request',
+                'response_bytes': body_size,
+                'response_time': self._now(),
+                'latency_ms': round(latency * 1000, 3),
+                'status_code': status_code,
+            }
+        )
+
+    def request_start(
+        self,
+        request_key: str,
+        command: str,
+        body_size: int = 0,
+        timestamp: float | None = None,
+        **fields,
+    ):
+        """Record a request sent to the App (timestamp is the time.perf_counter() sent)."""
+        with self._lock:
+            self._inc('tcex_run_request_bytes_total', body_size, direction='request')
+            self._pending[request_key] = {
+                '_started': time.perf_counter() if timestamp is None else timestamp,
+                'command': command,
+                'request_bytes': body_size,
+                'request_key': request_key,
+                'request_time': self._now(),
+                **fields,
+            }
+
+    def serve(self):
+        """Start the /metrics endpoint."""
+        if self.metrics_port is None:
+            return
+
+        server = MetricsServer((self.metrics_host, self.metrics_port), self)
+        t = Thread(target=server.serve_forever, name='MetricsServer', daemon=True)
+        t.start()
+        self.log.info(
+            f'feature=service-metrics, event=serve, '
+            f'url=http://{self.metrics_host}:{self.metrics_port}/metrics'
+        )
+
+    def trigger_event(self, trigger_id: str, session_id: str, **fields):
+        """Record a trigger fire event."""
+        with self._lock:
+            self._inc('tcex_run_trigger_events_total', trigger_id=trigger_id)
+            self._inc(
+                'tcex_run_trigger_output_bytes_total',
+                fields.get('output_bytes', 0),
+                trigger_id=trigger_id,
+            )
+
+        self.record(
+            {'type': 'trigger_event', 'trigger_id': trigger_id, 'session_id': session_id, **fields}
+        )
+
+    def write_prometheus_file(self):
+        """Write the aggregated metrics to the Prometheus text file."""
+        if self.metrics_file is None:
+            return
+
+        # write to a temp file and rename so readers never see a partial file
+        temp_file = self.metrics_file.with_suffix('.prom.tmp')
+        temp_file.write_text(self.prometheus_text(), encoding='utf-8')
+        temp_file.replace(self.metrics_file)
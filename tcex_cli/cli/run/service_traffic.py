@@ -0,0 +1,126 @@
+"""TcEx Framework Module"""
+
+# standard library
+import base64
+import gzip
+import json
+import logging
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from threading import Lock
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class TrafficRecorder:
+    """Record message broker traffic and request/response bodies to a gzip JSONL log.
+
+    Each line is a record with the following compact keys:
+    - t: the number of seconds since the recording started.
+    - c: the channel ("client" or "server").
+    - p: the message payload.
+    - b: an optional mapping of Redis body field to the base64 encoded body.
+    """
+
+    def __init__(self, record_file: Path):
+        """Initialize instance properties."""
+        self.record_file = record_file
+
+        # properties
+        self._lock = Lock()
+        self._started = time.monotonic()
+        self.count = 0
+        self.log = _logger
+
+        self.record_file.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = gzip.open(self.record_file, mode='wt', encoding='utf-8')  # noqa: SIM115
+
+    def close(self):
+        """Close the log file."""
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+                self.log.info(
+                    f'feature=traffic-recorder, event=closed, file={self.record_file}, '
+                    f'count={self.count}'
+                )
+
+    def record(self, channel: str, payload: bytes, bodies: dict[str, bytes] | None = None):
+        """Write a message (and its bodies) to the log."""
+        record: dict = {
+            't': round(time.monotonic() - self._started, 6),
+            'c': channel,
+            'p': payload.decode('utf-8'),
+        }
+        if bodies:
+            record['b'] = {k: base64.b64encode(v).decode('ascii') for k, v in bodies.items()}
+
+        line = json.dumps(record, separators=(',', ':'))
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.write(f'{line}\n')
+                self.count += 1
+
+
+class TrafficReplay:
+    """Iterate the records of a traffic log, sleeping to match the recorded timing.
+
+    The timeline starts after the App's first "Ready" message in the log, since that is
+    when the replay is started.
+    """
+
+    def __init__(self, replay_file: Path, speed: float = 1.0):
+        """Initialize instance properties.
+
+        Args:
+            replay_file: The traffic log written by TrafficRecorder.
+            speed: The replay speed multiplier (e.g., 2.0 is twice as fast, 0 is no delay).
+        """
+        self.replay_file = replay_file
+        self.speed = speed
+
+        # properties
+        self.log = _logger
+        self.records = self._load()
+
+    @staticmethod
+    def _is_ready(record: dict) -> bool:
+        """Return True if the record is the App's Ready message."""
+        if record['c'] != 'client':
+            return False
+        try:
+            return (json.loads(record['p']).get('command') or '').lower() == 'ready'
+        except ValueError:
+            return False
+
+    def _load(self) -> list[dict]:
+        """Return the records after the first Ready message with the time relative to it."""
+        with gzip.open(self.replay_file, mode='rt', encoding='utf-8') as fh:
+            records = [json.loads(line) for line in fh if line.strip()]
+
+        origin = next((i for i, r in enumerate(records) if self._is_ready(r)), -1)
+        origin_time = records[origin]['t'] if origin >= 0 else 0.0
+        records = records[origin + 1 :]
+        for record in records:
+            record['t'] = max(round(record['t'] - origin_time, 6), 0.0)
+            record['b'] = {k: base64.b64decode(v) for k, v in record.get('b', {}).items()}
+
+        self.log.info(
+            f'feature=traffic-replay, event=loaded, file={self.replay_file}, count={len(records)}'
+        )
+        return records
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yield each record when it is due."""
+        started = time.monotonic()
+        for record in self.records:
+            if self.speed > 0:
+                delay = record['t'] / self.speed - (time.monotonic() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            yield record
@@ -0,0 +1,112 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import statistics
+import time
+from collections import defaultdict, deque
+from threading import Lock
+
+# the placeholder in the trigger input template that is replaced with the trigger id
+TRIGGER_ID_PLACEHOLDER = '${trigger.id}'
+
+
+class TriggerSimulation:
+    """Generate synthetic trigger configs and record fire event latency.
+
+    For webhook triggers the latency is measured from the time a simulated webhook event is
+    sent to the time its fire event output data has been read. Events are matched to fire
+    events in the order they were sent for each trigger.
+    """
+
+    def __init__(self, trigger_count: int, event_count: int = 0, concurrency: int = 16):
+        """Initialize instance properties.
+
+        Args:
+            trigger_count: The number of trigger configs to generate.
+            event_count: The number of webhook events to send per trigger.
+            concurrency: The maximum number of webhook events in flight at once.
+        """
+        self.concurrency = concurrency
+        self.event_count = event_count
+        self.trigger_count = trigger_count
+
+        # properties
+        self._lock = Lock()
+        self._pending: defaultdict[str, deque[float]] = defaultdict(deque)
+        self.configs_acknowledged = 0
+        self.events_sent: defaultdict[str, int] = defaultdict(int)
+        self.fire_latency: defaultdict[str, list[float]] = defaultdict(list)
+        self.readback_latency: defaultdict[str, list[float]] = defaultdict(list)
+
+    def configs(self, template: dict) -> list[dict]:
+        """Return trigger_count trigger configs generated from the template."""
+        template_ = json.dumps(template)
+        return [
+            json.loads(template_.replace(TRIGGER_ID_PLACEHOLDER, str(trigger_id)))
+            for trigger_id in range(self.trigger_count)
+        ]
+
+    def config_acknowledged(self) -> bool:
+        """Record a CreateConfig acknowledgement, returning True once all are acknowledged."""
+        with self._lock:
+            self.configs_acknowledged += 1
+            return self.configs_acknowledged == self.trigger_count
+
+    def event_sent(self, trigger_id: str):
+        """Record that a webhook event was sent for the trigger."""
+        with self._lock:
+            self.events_sent[trigger_id] += 1
+            self._pending[trigger_id].append(time.perf_counter())
+
+    def fire_event(self, trigger_id: str, readback_latency: float) -> float | None:
+        """Record a fire event, returning the latency from the matching webhook event."""
+        end = time.perf_counter()
+        with self._lock:
+            self.readback_latency[trigger_id].append(readback_latency)
+            pending = self._pending.get(trigger_id)
+            if not pending:
+                return None
+            latency = end - pending.popleft()
+            self.fire_latency[trigger_id].append(latency)
+            return latency
+
+    @staticmethod
+    def _ms(values: list[float], stat: str) -> str:
+        """Return a latency statistic in milliseconds."""
+        if not values:
+            return '-'
+        match stat:
+            case 'avg':
+                value = statistics.fmean(values)
+            case 'max':
+                value = max(values)
+            case 'p95':
+                value = (
+                    statistics.quantiles(values, n=20, method='inclusive')[-1]
+                    if len(values) > 1
+                    else values[0]
+                )
+            case _:
+                value = min(values)
+        return f'{value * 1000:.1f}'
+
+    def summary(self) -> list[dict[str, str]]:
+        """Return the per-trigger summary rows."""
+        with self._lock:
+            trigger_ids = sorted(
+                set(self.events_sent) | set(self.readback_latency), key=lambda x: int(x)
+            )
+            return [
+                {
+                    'trigger_id': trigger_id,
+                    'events_sent': str(self.events_sent.get(trigger_id, 0)),
+                    'fire_events': str(len(self.readback_latency.get(trigger_id, []))),
+                    'latency_min': self._ms(self.fire_latency.get(trigger_id, []), 'min'),
+                    'latency_avg': self._ms(self.fire_latency.get(trigger_id, []), 'avg'),
+                    'latency_p95': self._ms(self.fire_latency.get(trigger_id, []), 'p95'),
+                    'latency_max': self._ms(self.fire_latency.get(trigger_id, []), 'max'),
+                    'readback_avg': self._ms(self.readback_latency.get(trigger_id, []), 'avg'),
+                }
+                for trigger_id in trigger_ids
+            ]
@@ -6,7 +6,7 @@ import json
 import logging
 import socketserver
 from collections.abc import Callable
-from threading import Thread
+from threading import BoundedSemaphore, Event, Lock, Thread
 
 # third-party
 import paho.mqtt.client as mqtt
@@ -50,9 +50,16 @@ class WebServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
         self.tc_token = tc_token
 
         # properties
-        self.active_requests = {}
-        self.active_responses = {}
+        self.active_lock = Lock()
+        self.active_requests: dict[str, Event] = {}
+        self.active_responses: dict[str, dict] = {}
+        self.in_flight = (
+            BoundedSemaphore(inputs.api_service_max_in_flight)
+            if inputs.api_service_max_in_flight > 0
+            else None
+        )
         self.log = _logger
+        self.replay_requests: set[str] = set()
 
         # start server thread
         service = Thread(group=None, target=self.run, name='SimpleServerThread', daemon=True)
@@ -70,10 +77,56 @@ class WebServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
         ack_type = (msg.get('type') or '').lower()
         command = msg.get('command').lower()
         if command == 'acknowledged' and ack_type in ['runservice', 'webhookevent']:
-            self.active_responses[msg['requestKey']] = msg
+            request_key = msg.get('requestKey')
+            with self.active_lock:
+                event = self.active_requests.get(request_key)
+                if event is None and request_key in self.replay_requests:
+                    # a replayed request has no client waiting for the response
+                    self.replay_requests.discard(request_key)
+                    self.log.debug(
+                        f'feature=web-server, event=replay-ack, request-key={request_key}'
+                    )
+                    return
+                if event is None:
+                    # the request already timed out and the client received a response
+                    self.log.warning(
+                        f'feature=web-server, event=late-acknowledgement, request-key={request_key}'
+                    )
+                    return
+                self.active_responses[request_key] = msg
+
+            # release Event created in request_register
+            event.set()
+
+    def request_acquire(self) -> bool:
+        """Return True if the request can be sent to the App without exceeding the limit."""
+        if self.in_flight is None:
+            return True
+        return self.in_flight.acquire(blocking=False)
+
+    def request_register(self, request_key: str) -> Event:
+        """Return the Event that is set when the App acknowledges the request."""
+        event = Event()
+        with self.active_lock:
+            self.active_requests[request_key] = event
+        return event
+
+    def request_register_replay(self, request_key: str):
+        """Register a replayed request, which is acknowledged by the App without a client."""
+        with self.active_lock:
+            self.replay_requests.add(request_key)
+
+    def request_release(self, request_key: str | None = None) -> dict | None:
+        """Release an in-flight request, returning the App response if one was received."""
+        response = None
+        if request_key is not None:
+            with self.active_lock:
+                self.active_requests.pop(request_key, None)
+                response = self.active_responses.pop(request_key, None)
 
-            # release Event create in run_service_api_request_handler->call_service
-            self.active_requests.pop(msg.get('requestKey')).set()
+        if self.in_flight is not None:
+            self.in_flight.release()
+        return response
 
     def run(self):
         """Run the server in threat."""
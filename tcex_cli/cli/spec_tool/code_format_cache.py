@@ -0,0 +1,136 @@
+"""TcEx Framework Module"""
+
+# standard library
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+from functools import cached_property
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+# third-party
+import isort
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class CodeFormatCache:
+    """Cache the black/isort formatted code, keyed by the unformatted code.
+
+    The generated code is the same on most runs, so the formatted result is read from the cache
+    instead of running the formatters again. The key includes the formatter versions and the
+    App isort settings (pyproject.toml), so a change to either formats the code again.
+
+    The generator writes code in the black style, so black is also skipped on a cache miss
+    unless a line is too long for the generator to have laid it out (only isort, which uses
+    the App settings, is run).
+    """
+
+    # the black line length used by CodeOperation.format_code
+    line_length = 100
+
+    def __init__(self, cache_path: Path, max_entries: int = 256):
+        """Initialize instance properties.
+
+        Args:
+            cache_path: The directory for the cached files (e.g., ~/.tcex/format_cache).
+            max_entries: The number of cached files to keep (least recently used are removed).
+        """
+        self.cache_path = cache_path
+        self.log = _logger
+        self.max_entries = max_entries
+
+    @staticmethod
+    def _package_version(package: str) -> str:
+        """Return the installed version of the package."""
+        try:
+            return version(package)
+        except PackageNotFoundError:
+            return 'not-installed'
+
+    @cached_property
+    def formatter_version(self) -> str:
+        """Return the version of the formatters and their App settings."""
+        settings = Path('pyproject.toml')
+        settings_hash = (
+            hashlib.sha256(settings.read_bytes()).hexdigest() if settings.is_file() else ''
+        )
+        return (
+            f'black={self._package_version("black")},'
+            f'isort={self._package_version("isort")},'
+            f'settings={settings_hash}'
+        )
+
+    def _prune(self):
+        """Remove the least recently used entries over the max entries."""
+        try:
+            entries = sorted(self.cache_path.glob('*.py'), key=lambda f: f.stat().st_mtime)
+            for entry in entries[: -self.max_entries]:
+                entry.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _write(self, cache_file: Path, code: str):
+        """Write the cache file atomically (other processes may read it concurrently)."""
+        try:
+            self.cache_path.mkdir(exist_ok=True, parents=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.cache_path, suffix='.tmp')
+            with os.fdopen(fd, mode='w', encoding='utf-8') as fh:
+                fh.write(code)
+            Path(temp_name).replace(cache_file)
+        except OSError:
+            self.log.warning(f'feature=format-cache, event=write-failed, filename={cache_file}')
+
+    @staticmethod
+    def _isort(code: str) -> str:
+        """Return the code with the imports sorted using the App isort settings."""
+        settings = Path('pyproject.toml')
+        isort_args = {'settings_file': str(settings)} if settings.is_file() else {}
+        return isort.code(code, config=isort.Config(**isort_args))
+
+    def is_canonical(self, code: str) -> bool:
+        """Return True if the generated code is already in the black style.
+
+        Long lines are the only part of the generated code that black would lay out
+        differently (e.g., a long type annotation or validator is wrapped).
+        """
+        return all(
+            len(line) <= self.line_length and line == line.rstrip() for line in code.split('\n')
+        )
+
+    def key(self, code: str) -> str:
+        """Return the cache key for the unformatted code."""
+        return hashlib.sha256(f'{self.formatter_version}\n{code}'.encode()).hexdigest()
+
+    def format_code(self, code: str) -> str:
+        """Return the formatted code, from the cache if the same code was formatted before."""
+        cache_file = self.cache_path / f'{self.key(code)}.py'
+        try:
+            formatted = cache_file.read_text(encoding='utf-8')
+        except OSError:
+            formatted = None
+
+        if formatted is not None:
+            # touch the file so that the entry is kept when pruning
+            with contextlib.suppress(OSError):
+                cache_file.touch()
+            self.log.debug(f'feature=format-cache, event=hit, filename={cache_file.name}')
+            return formatted
+
+        if self.is_canonical(code):
+            self.log.debug('feature=format-cache, event=skip-black')
+            formatted = self._isort(code)
+        else:
+            # first-party
+            from tcex_cli.util.code_operation import CodeOperation  # imports black (slow)
+
+            formatted = CodeOperation.format_code(code)
+        self._write(cache_file, formatted)
+        self._prune()
+        return formatted
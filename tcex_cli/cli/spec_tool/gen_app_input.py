@@ -1,6 +1,7 @@
 """TcEx Framework Module"""
 
 # standard library
+import ast
 import logging
 import re
 from pathlib import Path
@@ -12,7 +13,6 @@ from tcex_cli.cli.spec_tool.gen_app_input_static import GenAppInputStatic
 from tcex_cli.pleb.cached_property import cached_property
 from tcex_cli.render.render import Render
 from tcex_cli.util import Util
-from tcex_cli.util.code_operation import CodeOperation
 
 # get logger
 _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
@@ -31,6 +31,7 @@ class GenAppInput(CliABC):
         self.field_type_modules = self._get_current_field_types()
         self.filename = 'app_inputs.py'
         self.input_static = GenAppInputStatic()
+        self.line_length = 100  # the black line length used by CodeOperation.format_code
         self.log = _logger
         self.typing_modules = set()
         self.pydantic_modules = set()
@@ -97,8 +98,7 @@ class GenAppInput(CliABC):
                     _code.append(_comment)
 
                 # add finalized input code line
-                _type_data = f'{self.i1}{input_name}: {self._gen_type(class_name, input_data)}'
-                _code.append(_type_data)
+                _code.extend(self._type_data(input_name, self._gen_type(class_name, input_data)))
 
                 # check if validator are applicable to this input
                 if self._validator_always_array_check(input_data) is True:
@@ -119,9 +119,10 @@ class GenAppInput(CliABC):
                 self.pydantic_modules.add('validator')
                 _code.extend(self._validator_entity_input(_entity_input))
 
-        # append 2 blank lines between classes
-        _code.append('')
-        _code.append('')
+            # append 2 blank lines after each class
+            while _code and _code[-1] == '':
+                _code.pop()
+            _code.extend(['', ''])
         return _code
 
     def _code_app_inputs_data_comments(self, input_data: ParamsModel) -> str | None:
@@ -164,6 +165,36 @@ class GenAppInput(CliABC):
             return current_type.group(1).strip()
         return None
 
+    def _find_line_in_code(
+        self, needle: str, trigger_start: str | None = None, trigger_stop: str | None = None
+    ) -> str | None:
+        """Return the matching line of the current app_inputs.py code.
+
+        This is CodeOperation.find_line_in_code, without importing black (via CodeOperation)
+        and using the code that is parsed once for all inputs.
+
+        Args:
+            needle: The regex pattern to search for.
+            trigger_start: The regex pattern to use to trigger the search.
+            trigger_stop: The regex pattern to use to stop the search.
+        """
+        magnet_on = not trigger_start
+        for line in self.app_inputs_lines:
+            if line.lstrip()[:1] not in ("'", '"'):
+                # find class before looking for needle
+                if trigger_start is not None and re.match(trigger_start, line):
+                    magnet_on = True
+                    continue
+
+                # find needle now that class definition is found
+                if magnet_on is True and re.match(needle, line):
+                    return line.strip()
+
+                # break if needle not found before next class definition
+                if trigger_stop is not None and re.match(trigger_stop, line) and magnet_on is True:
+                    break
+        return None
+
     def _generate_app_inputs_to_action(self):
         """Generate App Input dict from install.json and layout.json."""
         if self.app.ij.model.is_trigger_app is True:
@@ -313,18 +344,15 @@ class GenAppInput(CliABC):
         # first, search for the input name in the class definition, if not found, search for the
         # type definition in the entire file. this is best effort, if we can't find the type
         # definition, we'll just use the calculated type.
-        type_definition = CodeOperation.find_line_in_code(
+        type_definition = self._find_line_in_code(
             needle=rf'\s+{input_name}: ',
-            code=self.app_inputs_contents,
             trigger_start=rf'^class {class_name}',
             trigger_stop=r'^class ',
         )
 
         # if we didn't find the type definition in the class definition, search the entire file
         if type_definition is None:
-            type_definition = CodeOperation.find_line_in_code(
-                needle=rf'\s+{input_name}: ', code=self.app_inputs_contents
-            )
+            type_definition = self._find_line_in_code(needle=rf'\s+{input_name}: ')
 
         # type_definition -> "string_encrypt: Sensitive | None"
         self.log.debug(
@@ -379,10 +407,7 @@ class GenAppInput(CliABC):
         types = []
 
         needle = 'from tcex.input.field_type import'
-        type_definition = CodeOperation.find_line_in_code(
-            needle=rf'^{needle}',
-            code=self.app_inputs_contents,
-        )
+        type_definition = self._find_line_in_code(needle=rf'^{needle}')
         if type_definition is not None:
             types = type_definition.replace(needle, '').strip().split(', ')
         return set(types)
@@ -424,16 +449,58 @@ class GenAppInput(CliABC):
             return []
         return _tc_action.valid_values
 
+    def _type_data(self, input_name: str, type_: str) -> list[str]:
+        """Return the code for an input type definition (e.g., "name: String | None").
+
+        A union that does not fit on a single line is wrapped in parentheses (with one type
+        per line if it still does not fit), the same way black splits it.
+        """
+        code = f'{self.i1}{input_name}: {type_}'
+        if len(code) <= self.line_length or ' = ' in type_ or ' | ' not in type_:
+            return [code]
+
+        types = [type_]
+        if len(f'{self.i2}{type_}') > self.line_length:
+            types = type_.split(' | ')
+        return [
+            f'{self.i1}{input_name}: (',
+            f'{self.i2}{types[0]}',
+            *[f'{self.i2}| {t}' for t in types[1:]],
+            f'{self.i1})',
+        ]
+
+    def _validator(self, assignment: str, validator: str) -> list[str]:
+        """Return the code for a validator assignment (e.g., "_x = validator(...)(func(...))").
+
+        The code is split the same way black splits it when the assignment does not fit on a
+        single line, on the last call or, if the assignment is too long, on the validator args.
+        """
+        code = f'{self.i1}{assignment}({validator})'
+        if len(code) <= self.line_length:
+            return [code]
+
+        if len(f'{self.i1}{assignment}(') <= self.line_length:
+            return [f'{self.i1}{assignment}(', f'{self.i2}{validator}', f'{self.i1})']
+
+        # "_x = validator(args)" -> "_x = validator(" + args + ")(...)"
+        call, args = assignment.removesuffix(')').split('(', 1)
+        args_code = [f'{self.i2}{args}']
+        if len(args_code[0]) > self.line_length:
+            args_code = [f'{self.i2}{arg},' for arg in args.split(', ')]
+        return [f'{self.i1}{call}(', *args_code, f'{self.i1})({validator})']
+
     def _validator_always_array(self, always_array: list[str]) -> list[str]:
         """Return code for always_array_validator."""
         _always_array = ', '.join(always_array)
         return [
             '',
             f'{self.i1}# ensure inputs that take single and array types always return an array',
-            (
-                f'{self.i1}_always_array = validator({_always_array}, allow_reuse=True, pre=True)'
-                '(always_array(allow_empty=True, include_empty=False, '
-                'include_null=False, split_csv=True))'
+            *self._validator(
+                f'_always_array = validator({_always_array}, allow_reuse=True, pre=True)',
+                (
+                    'always_array(allow_empty=True, include_empty=False, '
+                    'include_null=False, split_csv=True)'
+                ),
             ),
         ]
 
@@ -455,9 +522,9 @@ class GenAppInput(CliABC):
         return [
             '',
             f'{self.i1}# add entity_input validator for supported types',
-            (
-                f"""{self.i1}_entity_input = validator({_entity_input}, """
-                """allow_reuse=True)(entity_input(only_field='value'))"""
+            *self._validator(
+                f'_entity_input = validator({_entity_input}, allow_reuse=True)',
+                "entity_input(only_field='value')",
             ),
         ]
 
@@ -478,6 +545,13 @@ class GenAppInput(CliABC):
                 return f.read()
         return ''
 
+    @cached_property
+    def app_inputs_lines(self) -> list[str]:
+        """Return the lines of the current app_inputs.py code, normalized by the ast module."""
+        if not self.app_inputs_contents:
+            return []
+        return ast.unparse(ast.parse(self.app_inputs_contents)).split('\n')
+
     @property
     def app_inputs_data(self) -> dict:
         """Return base App inputs data."""
@@ -511,4 +585,7 @@ class GenAppInput(CliABC):
         else:
             # the App support tc_action and should use the tc_action input class
             code.extend(self.input_static.template_app_inputs_class_tc_action(self.class_model_map))
+
+        # end the file with a single newline
+        code.append('')
         return code
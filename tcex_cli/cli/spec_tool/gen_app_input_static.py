@@ -22,6 +22,7 @@ class GenAppInputStatic:
         self.i3 = ' ' * 12
         self.i4 = ' ' * 16
         self.ij = InstallJson()
+        self.line_length = 100
 
     @cached_property
     def app_base_model_class(self) -> str:
@@ -86,42 +87,55 @@ class GenAppInputStatic:
                 f"""{self.i1}on startup. The inputs that are configured in the Service""",
                 f"""{self.i1}configuration in the Platform with serviceConfig: true""",
                 f'''{self.i1}"""''',
-                '',
-                '',
             ]
         )
 
+    def _import(self, module: str, names: str) -> list[str]:
+        """Return a from import, wrapped with one name per line when it is too long."""
+        code = f'from {module} import {names}'
+        if len(code) <= self.line_length:
+            return [code]
+        return [
+            f'from {module} import (',
+            *[f'{self.i1}{name},' for name in names.split(', ')],
+            ')',
+        ]
+
     def template_app_imports(
         self,
         field_type_modules: set[str],
         pydantic_modules: set[str],
         typing_modules: set[str],
     ) -> list:
-        """Return app_inputs.py import data."""
+        """Return app_inputs.py import data.
+
+        The imports are written in the order and grouping isort uses (standard library,
+        then third-party sorted by module).
+        """
         field_types_modules_ = ', '.join(sorted(field_type_modules))
         pydantic_modules_ = ', '.join(sorted(pydantic_modules))
         typing_modules_ = ', '.join(sorted(typing_modules))
 
         # defined imports
-        _imports = ['"""App Inputs"""']
+        _imports = ['"""App Inputs"""', '']
 
         # add pyright ignore for field_type
-        _imports.append('# pyright: reportGeneralTypeIssues=false\n')
+        _imports.extend(['# pyright: reportGeneralTypeIssues=false', ''])
 
         # add typing imports
         if typing_modules:
-            _imports.append(f'from typing import {typing_modules_}')
+            _imports.extend([*self._import('typing', typing_modules_), ''])
 
         # add pydantic imports
         if pydantic_modules:
-            _imports.append(f'from pydantic import {pydantic_modules_}')
-
-        # add tcex Input
-        _imports.append('from tcex.input.input import Input')
+            _imports.extend(self._import('pydantic', pydantic_modules_))
 
         # add field_type imports
         if field_types_modules_:
-            _imports.append(f'from tcex.input.field_type import {field_types_modules_}')
+            _imports.extend(self._import('tcex.input.field_type', field_types_modules_))
+
+        # add tcex Input
+        _imports.append('from tcex.input.input import Input')
 
         # add base model import
         _imports.append(self.app_base_model_import)
@@ -164,7 +178,6 @@ class GenAppInputStatic:
         # add update_inputs method
         _code.extend(
             [
-                '',
                 f"""{self.i1}def update_inputs(self):""",
                 f'''{self.i2}"""Add custom App model to inputs.''',
                 '',
@@ -175,19 +188,18 @@ class GenAppInputStatic:
                 f"""{self.i2}cause the App to exit with a status code of 1.""",
                 f'''{self.i2}"""''',
                 f"""{self.i2}self.inputs.add_model({app_model})""",
-                '',
-                '',
             ]
         )
         return _code
 
     def template_app_inputs_class_tc_action(self, class_model_map: dict) -> list:
         """Return app_inputs.py AppInput class for App with tc_action."""
-        cmm = ''
+        # one entry per line with a trailing comma, the layout black uses for the map
+        cmm = '{'
         for action, class_name in class_model_map.items():
             action_name = action.lower().replace(' ', '_')
-            cmm += f"'{action_name}': {class_name},"
-        cmm = f'{{{cmm}}}'
+            cmm += f"\n{self.i3}'{action_name}': {class_name},"
+        cmm += f'\n{self.i2}}}' if class_model_map else '}'
 
         _code = [
             """class AppInputs:""",
@@ -249,8 +261,6 @@ class GenAppInputStatic:
                 f"""{self.i2}cause the App to exit with a status code of 1.""",
                 f'''{self.i2}"""''',
                 f"""{self.i2}self.inputs.add_model(self.get_model())""",
-                '',
-                '',
             ]
         )
         return _code
@@ -278,8 +288,6 @@ class GenAppInputStatic:
                 f"""{self.i1}This is the configuration input that gets sent to the service""",
                 f"""{self.i1}when a Playbook is enabled (createConfig).""",
                 f'''{self.i1}"""''',
-                '',
-                '',
             ]
         )
 
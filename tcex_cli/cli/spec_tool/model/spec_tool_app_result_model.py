@@ -0,0 +1,15 @@
+"""TcEx Framework Module"""
+
+# third-party
+from pydantic import BaseModel, Field
+
+
+class SpecToolAppResultModel(BaseModel):
+    """Model Definition"""
+
+    app: str = Field(..., description='The App directory, relative to the search directory.')
+    error: str | None = Field(None, description='The error, if the generators failed.')
+    mismatch: list[dict[str, str]] = Field(
+        [], description='The app_inputs.py type mismatch report for the App.'
+    )
+    summary: dict[str, str] = Field({}, description='The action taken for each generated file.')
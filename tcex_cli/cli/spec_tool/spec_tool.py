@@ -1,12 +1,21 @@
 """TcEx Framework Module"""
 
+# standard library
+from typing import Optional
+
 # third-party
 import typer
 
 # first-party
+from tcex_cli.cli.spec_tool.spec_tool_bulk import SpecToolBulk
 from tcex_cli.cli.spec_tool.spec_tool_cli import SpecToolCli
 from tcex_cli.render.render import Render
 
+# typer does not yet support PEP 604, but pyupgrade will enforce
+# PEP 604. this is a temporary workaround until support is added.
+IntOrNone = Optional[int]  # noqa: UP007
+StrOrNone = Optional[str]  # noqa: UP007
+
 
 def command(
     all_: bool = typer.Option(
@@ -14,6 +23,23 @@ def command(
         '--all',
         help='Generate all configuration files.',
     ),
+    incremental: bool = typer.Option(
+        default=False,
+        help=(
+            'Only regenerate the files whose app_spec.yml sections or input files changed since '
+            'the last run.'
+        ),
+    ),
+    apps: StrOrNone = typer.Option(
+        None,
+        help=(
+            'A glob of App directories (e.g., "apps/*") to generate the files for in parallel, '
+            'existing files are overwritten without prompting.'
+        ),
+    ),
+    jobs: IntOrNone = typer.Option(
+        None, help='The number of Apps to process concurrently (defaults to the cpu count).'
+    ),
     app_input: bool = typer.Option(default=False, help='Generate app_input.py.'),
     app_spec: bool = typer.Option(default=False, help='Generate app_spec.yml.'),
     install_json: bool = typer.Option(default=False, help='Generate install.json.'),
@@ -27,30 +53,46 @@ def command(
 
     Generate one or more configuration files for the App.
     """
+    generators = {
+        'install.json': install_json,
+        'layout.json': layout_json,
+        'job.json': job_json,
+        'tcex.json': tcex_json,
+        'app_inputs.py': app_input,
+        'README.md': readme_md,
+    }
+    selected_generators = [
+        name for name, selected in generators.items() if selected is True or all_ is True
+    ]
+
+    if apps is not None:
+        if not selected_generators:
+            Render.panel.failure(
+                'No files selected to generate, use --all or one or more of the file options '
+                '(e.g., --install-json) with --apps.'
+            )
+
+        bulk = SpecToolBulk(apps, selected_generators, incremental=incremental, jobs=jobs)
+        try:
+            results = bulk.run()
+            if not results:
+                Render.panel.failure(f'No App directories with an app_spec.yml match "{apps}".')
+            bulk.render(results)
+        except Exception as ex:
+            bulk.log.exception('Failed to run "tcex spec-tool" command.')
+            Render.panel.failure(f'Exception: {ex}')
+        return
+
     cli = SpecToolCli(overwrite)
     try:
         if app_spec is True:
             cli.generate_app_spec()
         else:
-            if install_json is True or all_ is True:
-                cli.generate_install_json()
-
-            if layout_json is True or all_ is True:
-                cli.generate_layout_json()
-
-            if job_json is True or all_ is True:
-                cli.generate_job_json()
-
-            if tcex_json is True or all_ is True:
-                cli.generate_tcex_json()
-
-            if app_input is True or all_ is True:
-                cli.generate_app_input()
-
-            if readme_md is True or all_ is True:
-                cli.generate_readme_md()
+            cli.generate(selected_generators, incremental=incremental)
 
         Render.table.key_value('SpecTool Report', cli.summary_data)  # type: ignore
+        if cli.report_mismatch:
+            Render.table_mismatch('Mismatch Report', data=cli.report_mismatch)
     except Exception as ex:
         cli.log.exception('Failed to run "tcex spec-tool" command.')
         Render.panel.failure(f'Exception: {ex}')
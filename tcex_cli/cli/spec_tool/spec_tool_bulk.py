@@ -0,0 +1,117 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+
+# first-party
+from tcex_cli.cli.spec_tool.model.spec_tool_app_result_model import SpecToolAppResultModel
+from tcex_cli.cli.spec_tool.spec_tool_cli import SpecToolCli
+from tcex_cli.logger.trace_logger import TraceLogger
+from tcex_cli.render.render import Render
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+def _generate_app(args: tuple[Path, str, list[str], bool]) -> SpecToolAppResultModel:
+    """Run the generators for a single App in a pool worker."""
+    app_path, app_name, generators, incremental = args
+
+    # SpecToolCli works on the App in the current directory and registers the App globally,
+    # each worker process runs a single App (maxtasksperchild=1) so no state is shared.
+    summary: dict[str, str] = {}
+    try:
+        os.chdir(app_path)
+        cli = SpecToolCli(overwrite=True)
+        summary = cli.summary_data
+        cli.generate(generators, incremental=incremental)
+    except (Exception, SystemExit) as ex:
+        _logger.exception(f'feature=spec-tool, event=bulk-failed, app={app_name}')
+        return SpecToolAppResultModel(app=app_name, error=str(ex) or 'failed', summary=summary)
+    return SpecToolAppResultModel(
+        app=app_name, mismatch=cli.report_mismatch, summary=cli.summary_data
+    )
+
+
+class SpecToolBulk:
+    """Run the spec-tool generators for every App matching a glob (e.g., in a monorepo).
+
+    Each App runs in its own worker process, started with fork where available so that the
+    workers do not pay the import cost again. Bulk runs never prompt, existing files are
+    overwritten (use --incremental to only regenerate changed outputs).
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        generators: list[str],
+        incremental: bool = False,
+        jobs: int | None = None,
+        base_path: Path | None = None,
+    ):
+        """Initialize instance properties.
+
+        Args:
+            pattern: The glob (relative to base_path) of the App directories (e.g., "apps/*").
+            generators: The generators to run (e.g., install.json, README.md).
+            incremental: If true, skip the generators whose inputs are unchanged.
+            jobs: The number of worker processes (defaults to the cpu count).
+            base_path: The directory to search (defaults to the current directory).
+        """
+        self.base_path = (base_path or Path.cwd()).resolve()
+        self.generators = generators
+        self.incremental = incremental
+        self.jobs = jobs or os.cpu_count() or 1
+        self.log = _logger
+        self.pattern = pattern
+
+    @property
+    def _pool_context(self):
+        """Return the multiprocessing context for the worker pool."""
+        methods = multiprocessing.get_all_start_methods()
+        return multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+
+    @property
+    def app_paths(self) -> list[Path]:
+        """Return the App directories (with an app_spec.yml file) that match the pattern."""
+        app_paths = set()
+        for path in self.base_path.glob(self.pattern):
+            # allow a pattern for either the App directory or the app_spec.yml file
+            app_path = path.parent if path.name == 'app_spec.yml' else path
+            if (app_path / 'app_spec.yml').is_file():
+                app_paths.add(app_path)
+        return sorted(app_paths)
+
+    def run(self) -> list[SpecToolAppResultModel]:
+        """Run the generators for all Apps."""
+        tasks = []
+        for app_path in self.app_paths:
+            app_name = app_path.relative_to(self.base_path).as_posix() or app_path.name
+            tasks.append((app_path, app_name, self.generators, self.incremental))
+
+        if not tasks:
+            return []
+
+        jobs = min(self.jobs, len(tasks))
+        self.log.info(f'feature=spec-tool, event=bulk-run, apps={len(tasks)}, jobs={jobs}')
+        with self._pool_context.Pool(processes=jobs, maxtasksperchild=1) as pool:
+            return pool.map(_generate_app, tasks, chunksize=1)
+
+    @staticmethod
+    def render(results: list[SpecToolAppResultModel]):
+        """Render the aggregated summary and mismatch report of all Apps."""
+        summary = {}
+        mismatch = []
+        for result in results:
+            if result.error is not None:
+                summary[result.app] = f'[red]Failed: {result.error}[/red]'
+            for filename, action in result.summary.items():
+                summary[f'{result.app}/{filename}'] = action
+            mismatch.extend({'app': result.app, **item} for item in result.mismatch)
+
+        Render.table.key_value('SpecTool Report', summary)  # type: ignore
+        if mismatch:
+            Render.table_mismatch('Mismatch Report', data=mismatch)
@@ -0,0 +1,130 @@
+"""TcEx Framework Module"""
+
+# standard library
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+# third-party
+from pydantic import BaseModel
+
+# first-party
+from tcex_cli.__metadata__ import __version__
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+# the app_spec.yml model fields and App files each generated output depends on, a spec value
+# of None means the entire app_spec.yml (for outputs that use most of the spec).
+GENERATOR_INPUTS: dict[str, dict[str, list[str] | None]] = {
+    'install.json': {'spec': None, 'files': []},
+    'tcex.json': {'spec': ['package_name'], 'files': ['tcex.json']},
+    'layout.json': {
+        'spec': ['inputs', 'outputs', 'requires_layout'],
+        'files': ['install.json'],
+    },
+    'job.json': {
+        'spec': ['is_feed_app', 'organization', 'program_version'],
+        'files': ['tcex.json'],
+    },
+    'app_inputs.py': {'spec': [], 'files': ['install.json', 'layout.json', 'app_inputs.py']},
+    'README.md': {'spec': None, 'files': ['install.json', 'layout.json']},
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Return a JSON serializable value for the spec model values."""
+    if isinstance(value, BaseModel):
+        return value.dict(by_alias=True)
+    return str(value)
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the sha256 hex digest of the data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(file: Path) -> str | None:
+    """Return the sha256 hex digest of the file contents, or None if it does not exist."""
+    try:
+        return hash_bytes(file.read_bytes())
+    except OSError:
+        return None
+
+
+class SpecToolCache:
+    """Track the inputs of each generated file to skip regenerating outputs that are current.
+
+    The state is stored in the App .cache directory (excluded from the App package) as a
+    mapping of generator to the digest of its inputs and the hash of each file it wrote. An
+    output is current if its inputs are unchanged and the written files were not modified.
+    """
+
+    def __init__(self, app_spec_file: Path, app_path: Path | None = None):
+        """Initialize instance properties."""
+        self.app_path = app_path or Path.cwd()
+        self.app_spec_file = app_spec_file
+        self.log = _logger
+        self.state_file = self.app_path / '.cache' / 'spec_tool.json'
+        self.state: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        """Return the stored state, discarding it if it was written by another version."""
+        try:
+            state = json.loads(self.state_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(state, dict) or state.get('version') != __version__:
+            return {}
+        return state.get('generators', {})
+
+    def _spec_digest(self, model: BaseModel | None, fields: list[str] | None) -> str:
+        """Return the digest of the app_spec.yml fields (or the entire file)."""
+        if fields is None or model is None:
+            return hash_file(self.app_spec_file) or ''
+
+        values = {field: getattr(model, field, None) for field in fields}
+        return hash_bytes(json.dumps(values, default=_json_default, sort_keys=True).encode())
+
+    def input_digest(self, generator: str, model: BaseModel | None = None) -> str:
+        """Return the digest of the current inputs of the generator."""
+        inputs = GENERATOR_INPUTS[generator]
+        digest = hashlib.sha256(self._spec_digest(model, inputs['spec']).encode())
+        for filename in inputs['files'] or []:
+            digest.update(f'{filename}:{hash_file(self.app_path / filename)}'.encode())
+        return digest.hexdigest()
+
+    def is_current(self, generator: str, digest: str) -> bool:
+        """Return True if the generator inputs and outputs are unchanged since the last run."""
+        entry = self.state.get(generator)
+        if entry is None or entry.get('inputs') != digest:
+            return False
+
+        return all(
+            hash_file(self.app_path / filename) == file_hash
+            for filename, file_hash in entry.get('outputs', {}).items()
+        )
+
+    def record(self, generator: str, digest: str, filenames: list[str]):
+        """Record the inputs and the written outputs of the generator."""
+        self.state[generator] = {
+            'inputs': digest,
+            'outputs': {f: hash_file(self.app_path / f) for f in filenames},
+        }
+
+    def save(self):
+        """Write the state file."""
+        try:
+            self.state_file.parent.mkdir(exist_ok=True, parents=True)
+            self.state_file.write_text(
+                json.dumps({'version': __version__, 'generators': self.state}, indent=2),
+                encoding='utf-8',
+            )
+        except OSError:
+            self.log.warning(
+                f'feature=spec-tool, event=cache-save-failed, filename={self.state_file}'
+            )
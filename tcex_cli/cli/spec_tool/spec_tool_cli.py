@@ -3,6 +3,9 @@
 # standard library
 import shutil
 import subprocess  # nosec
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 
 # third-party
@@ -11,6 +14,7 @@ from pydantic import ValidationError
 # first-party
 from tcex_cli.app.config import AppSpecYml
 from tcex_cli.cli.cli_abc import CliABC
+from tcex_cli.cli.spec_tool.code_format_cache import CodeFormatCache
 from tcex_cli.cli.spec_tool.gen_app_input import GenAppInput
 from tcex_cli.cli.spec_tool.gen_app_spec_yml import GenAppSpecYml
 from tcex_cli.cli.spec_tool.gen_install_json import GenInstallJson
@@ -18,8 +22,8 @@ from tcex_cli.cli.spec_tool.gen_job_json import GenJobJson
 from tcex_cli.cli.spec_tool.gen_layout_json import GenLayoutJson
 from tcex_cli.cli.spec_tool.gen_readme_md import GenReadmeMd
 from tcex_cli.cli.spec_tool.gen_tcex_json import GenTcexJson
+from tcex_cli.cli.spec_tool.spec_tool_cache import SpecToolCache
 from tcex_cli.render.render import Render
-from tcex_cli.util.code_operation import CodeOperation
 
 
 class SpecToolCli(CliABC):
@@ -35,8 +39,16 @@ class SpecToolCli(CliABC):
         self.app_spec_filename = 'app_spec.yml'
         self.asy = AppSpecYml()
         self.report_data = {}
+        self.report_mismatch: list[dict[str, str]] = []
         self.summary_data: dict[str, str] = {}
 
+        # generators in the same stage only depend on files written by earlier stages
+        self.generator_stages = [
+            ['install.json', 'tcex.json'],
+            ['layout.json', 'job.json'],
+            ['app_inputs.py', 'README.md'],
+        ]
+
         # rename app.yaml to app_spec.yml
         self.rename_app_file('app.yaml', 'app_spec.yml')
 
@@ -48,6 +60,11 @@ class SpecToolCli(CliABC):
                 f'--app-spec` first to generate the {self.asy.fqfn.name} specification file.'
             )
 
+    @cached_property
+    def format_cache(self) -> CodeFormatCache:
+        """Return the formatted code cache."""
+        return CodeFormatCache(self.cli_out_path / 'format_cache')
+
     @property
     def _git_installed(self) -> bool:
         """Check if git is installed."""
@@ -80,36 +97,13 @@ class SpecToolCli(CliABC):
         )
         return moved
 
-    def generate_app_input(self):
-        """Generate the app_input.py file."""
-        # force migration of app.yaml file
-        _ = self.asy.model.app_id
-
-        gen = GenAppInput()
+    def _build_app_input(self, gen: GenAppInput) -> list[tuple[str, str]]:
+        """Return the app_inputs.py file contents."""
         code = gen.generate()
-        self.write_app_file(gen.filename, CodeOperation.format_code('\n'.join(code)))
-        if gen.report_mismatch:
-            Render.table_mismatch('Mismatch Report', data=gen.report_mismatch)
-
-    def generate_app_spec(self):
-        """Generate the app_spec.yml file."""
-        gen = GenAppSpecYml()
-        try:
-            config = gen.generate()
-        except ValidationError as ex:
-            Render.panel.failure(f'Failed Generating app_spec.yml:\n{ex}')
-
-        self.write_app_file(gen.filename, f'{config}\n')
-
-        # for reload/rewrite/fix of app_spec.yml
-        _ = self.asy.contents
-
-    def generate_install_json(self):
-        """Generate the install.json file."""
-        gen = GenInstallJson(self.asy)
-        # check that app_spec.yml exists
-        self._check_has_spec()
+        return [(gen.filename, self.format_cache.format_code('\n'.join(code)))]
 
+    def _build_install_json(self, gen: GenInstallJson) -> list[tuple[str, str]]:
+        """Return the install.json file contents."""
         try:
             ij = gen.generate()
         except ValidationError as ex:
@@ -127,42 +121,12 @@ class SpecToolCli(CliABC):
             indent=2,
             sort_keys=True,
         )
-        self.write_app_file(gen.filename, f'{config}\n')
-
-    def generate_layout_json(self):
-        """Generate the layout.json file."""
-        gen = GenLayoutJson(self.asy)
-        if any([self.app.ij.model.is_playbook_app, self.app.ij.model.is_trigger_app]):
-            # check that app_spec.yml exists
-            self._check_has_spec()
+        return [(gen.filename, f'{config}\n')]
 
-            if self.asy.model.requires_layout:
-                try:
-                    lj = gen.generate()
-                except ValidationError as ex:
-                    self.log.exception('Failed Generating layout.json')
-                    Render.panel.failure(f'Failed Generating layout.json:\n{ex}')
-
-                # exclude_defaults - if False then all unused fields are added in - not good.
-                # exclude_none - this should be safe to leave as True.
-                # exclude_unset - this should be safe to leave as True.
-                config = lj.json(
-                    by_alias=True,
-                    exclude_defaults=True,
-                    exclude_none=True,
-                    exclude_unset=True,
-                    indent=2,
-                    sort_keys=True,
-                )
-                self.write_app_file(gen.filename, f'{config}\n')
-
-    def generate_job_json(self):
-        """Generate the job.json file."""
-        gen = GenJobJson(self.asy)
+    def _build_job_json(self, gen: GenJobJson) -> list[tuple[str, str]]:
+        """Return the job.json file(s) contents."""
+        files = []
         if self.asy.model.is_feed_app:
-            # check that app_spec.yml exists
-            self._check_has_spec()
-
             try:
                 for filename, job in gen.generate():
                     if job is not None:
@@ -174,26 +138,43 @@ class SpecToolCli(CliABC):
                             indent=2,
                             sort_keys=True,
                         )
-                        self.write_app_file(filename, f'{config}\n')
+                        files.append((filename, f'{config}\n'))
             except ValidationError as ex:
                 self.log.exception('Failed Generating job.json')
                 Render.panel.failure(f'Failed Generating job.json:\n{ex}')
+        return files
 
-    def generate_readme_md(self):
-        """Generate the README.me file."""
-        # check that app_spec.yml exists
-        self._check_has_spec()
+    def _build_layout_json(self, gen: GenLayoutJson) -> list[tuple[str, str]]:
+        """Return the layout.json file contents."""
+        files = []
+        if self._layout_json_required:
+            try:
+                lj = gen.generate()
+            except ValidationError as ex:
+                self.log.exception('Failed Generating layout.json')
+                Render.panel.failure(f'Failed Generating layout.json:\n{ex}')
+
+            # exclude_defaults - if False then all unused fields are added in - not good.
+            # exclude_none - this should be safe to leave as True.
+            # exclude_unset - this should be safe to leave as True.
+            config = lj.json(
+                by_alias=True,
+                exclude_defaults=True,
+                exclude_none=True,
+                exclude_unset=True,
+                indent=2,
+                sort_keys=True,
+            )
+            files.append((gen.filename, f'{config}\n'))
+        return files
 
-        gen = GenReadmeMd(self.asy)
+    def _build_readme_md(self, gen: GenReadmeMd) -> list[tuple[str, str]]:
+        """Return the README.md file contents."""
         readme_md = gen.generate()
-        self.write_app_file(gen.filename, '\n'.join(readme_md))
-
-    def generate_tcex_json(self):
-        """Generate the tcex.json file."""
-        gen = GenTcexJson(self.asy)
-        # check that app_spec.yml exists
-        self._check_has_spec()
+        return [(gen.filename, '\n'.join(readme_md))]
 
+    def _build_tcex_json(self, gen: GenTcexJson) -> list[tuple[str, str]]:
+        """Return the tcex.json file contents."""
         try:
             tj = gen.generate()
         except ValidationError as ex:
@@ -211,8 +192,143 @@ class SpecToolCli(CliABC):
             indent=2,
             sort_keys=True,
         )
+        return [(gen.filename, f'{config}\n')]
+
+    @property
+    def _layout_json_required(self) -> bool:
+        """Return True if the App requires a layout.json file."""
+        return (
+            any([self.app.ij.model.is_playbook_app, self.app.ij.model.is_trigger_app])
+            and self.asy.model.requires_layout
+        )
+
+    def _prepare_builder(self, generator: str) -> tuple[CliABC, Callable]:
+        """Return the generator instance and builder method for a generator.
+
+        The generator classes register the App and update the system path when created, and
+        the shared cached properties (e.g., the app_spec.yml model) are not thread-safe. Both
+        are done here, in the calling thread, so that the builders only read shared state.
+        """
+        match generator:
+            case 'app_inputs.py':
+                # force migration of app.yaml file
+                _ = self.asy.model.app_id
+                _ = self.format_cache.formatter_version
+                return GenAppInput(), self._build_app_input
+
+            case 'install.json':
+                self._check_has_spec()
+                return GenInstallJson(self.asy), self._build_install_json
+
+            case 'job.json':
+                if self.asy.model.is_feed_app:
+                    self._check_has_spec()
+                return GenJobJson(self.asy), self._build_job_json
+
+            case 'layout.json':
+                if any([self.app.ij.model.is_playbook_app, self.app.ij.model.is_trigger_app]):
+                    self._check_has_spec()
+                _ = self._layout_json_required
+                return GenLayoutJson(self.asy), self._build_layout_json
+
+            case 'README.md':
+                self._check_has_spec()
+                return GenReadmeMd(self.asy), self._build_readme_md
+
+            case 'tcex.json':
+                self._check_has_spec()
+                return GenTcexJson(self.asy), self._build_tcex_json
+
+            case _:
+                ex_msg = f'Invalid generator: {generator}'
+                raise RuntimeError(ex_msg)
+
+    def generate(self, generators: list[str], incremental: bool = False):
+        """Generate the App config files, running the independent generators concurrently.
+
+        The generators run in stages, since later generators read the files written by the
+        earlier ones (e.g., app_inputs.py reads install.json). The files are built concurrently
+        within a stage and written (with any overwrite prompts) in order.
+
+        Args:
+            generators: The generators to run (e.g., install.json, README.md).
+            incremental: If true, skip the generators whose inputs are unchanged.
+        """
+        cache = None
+        if incremental is True:
+            self._check_has_spec()
+            cache = SpecToolCache(self.asy.fqfn)
+
+        for stage in self.generator_stages:
+            stale = []
+            for generator in [g for g in stage if g in generators]:
+                if cache is not None and cache.is_current(
+                    generator, cache.input_digest(generator, self.asy.model)
+                ):
+                    self.log.debug(f'feature=spec-tool, event=skip-current, generator={generator}')
+                    for filename in cache.state[generator]['outputs']:
+                        self.summary_data[filename] = '[green]Current[/green]'
+                    continue
+                stale.append(generator)
+
+            if not stale:
+                continue
+
+            # the generators are created (and shared state loaded) before starting the threads
+            builders = {g: self._prepare_builder(g) for g in stale}
+            with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+                futures = {g: executor.submit(build, gen) for g, (gen, build) in builders.items()}
+
+            for generator in stale:
+                files = futures[generator].result()
+                gen = builders[generator][0]
+                if isinstance(gen, GenAppInput):
+                    self.report_mismatch.extend(gen.report_mismatch)
+                written = [f for f, contents in files if self.write_app_file(f, contents)]
+                if cache is not None and len(written) == len(files):
+                    # the digest is taken after writing, since app_inputs.py is also an input
+                    cache.record(generator, cache.input_digest(generator, self.asy.model), written)
+
+        if cache is not None:
+            cache.save()
+
+    def generate_app_input(self):
+        """Generate the app_input.py file."""
+        self.generate(['app_inputs.py'])
+
+    def generate_app_spec(self):
+        """Generate the app_spec.yml file."""
+        gen = GenAppSpecYml()
+        try:
+            config = gen.generate()
+        except ValidationError as ex:
+            Render.panel.failure(f'Failed Generating app_spec.yml:\n{ex}')
+
         self.write_app_file(gen.filename, f'{config}\n')
 
+        # for reload/rewrite/fix of app_spec.yml
+        _ = self.asy.contents
+
+    def generate_install_json(self):
+        """Generate the install.json file."""
+        self.generate(['install.json'])
+
+    def generate_layout_json(self):
+        """Generate the layout.json file."""
+        self.generate(['layout.json'])
+
+    def generate_job_json(self):
+        """Generate the job.json file."""
+        self.generate(['job.json'])
+
+    def generate_readme_md(self):
+        """Generate the README.me file."""
+        self.generate(['README.md'])
+
+    def generate_tcex_json(self):
+        """Generate the tcex.json file."""
+        self.generate(['tcex.json'])
+
     def rename_app_file(self, src_filename: str, dest_filename: str):
         """Rename the app.yaml file to app_spec.yml."""
         src_file = Path(src_filename)
@@ -229,13 +345,18 @@ class SpecToolCli(CliABC):
             if moved is False:
                 shutil.move('app.yaml', 'app_spec.yml')
 
-    def write_app_file(self, file_name: str, contents: str):
-        """Write contents to file."""
+    def write_app_file(self, file_name: str, contents: str) -> bool:
+        """Write contents to file, returning False if the user skipped the file."""
         action = 'Created'
         write_file = True
         filename = Path(file_name)
         if filename.is_file():
             action = 'Updated'
+            if filename.read_bytes() == contents.encode():
+                # identical contents, nothing to write (or prompt for)
+                self.summary_data[file_name] = '[green]Unchanged[/green]'
+                return True
+
             if self.overwrite is False:
                 response = Render.prompt.input(
                     f'Overwrite existing [{self.accent}]{file_name}[/{self.accent}] file?',
@@ -250,3 +371,4 @@ class SpecToolCli(CliABC):
                 f.write(contents)
 
         self.summary_data[file_name] = f'[green]{action}[/green]'
+        return write_file
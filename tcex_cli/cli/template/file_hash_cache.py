@@ -0,0 +1,136 @@
+"""TcEx Framework Module"""
+
+# standard library
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class FileHashCache:
+    """Persistent stat cache of file hashes (path -> size, mtime_ns, hash).
+
+    A file is only hashed again if its size or modified time changed. Files modified within the
+    last few seconds are not cached, since a later write in the same timestamp granularity would
+    not change the modified time (the same approach git uses for its index).
+    """
+
+    # the fields of each cache entry
+    entry_keys = frozenset({'hash', 'mtime_ns', 'size'})
+    # files modified more recently than this (in seconds) are hashed, but not cached
+    racy_window = 2.0
+
+    def __init__(self, cache_file: Path, max_workers: int | None = None):
+        """Initialize instance properties.
+
+        Args:
+            cache_file: The JSON file to store the cache in (e.g., ~/.tcex/file_hash_cache.json).
+            max_workers: The number of threads used to hash files concurrently.
+        """
+        self.cache_file = cache_file
+        self.lock = threading.Lock()
+        self.log = _logger
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.dirty = False
+        self.entries: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        """Return the stored cache entries, an unreadable cache file is treated as empty."""
+        try:
+            entries = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+        # drop malformed entries (e.g., from a cache file edited by hand)
+        return {
+            key: entry
+            for key, entry in entries.items()
+            if ':' in key and isinstance(entry, dict) and self.entry_keys <= entry.keys()
+        }
+
+    @staticmethod
+    def _hash(path: Path, algorithm: str, chunk_size: int = 1024 * 1024) -> str:
+        """Return the hash of the file contents."""
+        h = hashlib.new(algorithm)
+        with path.open('rb') as fh:
+            while chunk := fh.read(chunk_size):
+                h.update(chunk)
+        return h.hexdigest()
+
+    @staticmethod
+    def _key(path: Path, algorithm: str) -> str:
+        """Return the cache key for the file."""
+        return f'{algorithm}:{path.resolve()}'
+
+    def hash(self, path: Path, algorithm: str = 'sha256') -> str | None:
+        """Return the hash of the file, or None if it does not exist."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        key = self._key(path, algorithm)
+        entry = self.entries.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['hash']
+
+        file_hash = self._hash(path, algorithm)
+        if time.time() - stat.st_mtime > self.racy_window:
+            with self.lock:
+                self.entries[key] = {
+                    'hash': file_hash,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                }
+                self.dirty = True
+        return file_hash
+
+    def hash_many(self, paths: Iterable[Path], algorithm: str = 'sha256') -> dict[Path, str | None]:
+        """Return the hash of each file, hashing the uncached files concurrently."""
+        paths = list(paths)
+        if len(paths) < 2:  # noqa: PLR2004
+            return {path: self.hash(path, algorithm) for path in paths}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            hashes = executor.map(lambda p: self.hash(p, algorithm), paths)
+            return dict(zip(paths, hashes, strict=True))
+
+    def save(self):
+        """Write the cache file, dropping the entries of files that no longer exist."""
+        if self.dirty is False:
+            return
+
+        entries = {
+            key: entry
+            for key, entry in self.entries.items()
+            if Path(key.split(':', 1)[1]).is_file()
+        }
+        # write to a temp file and rename so a failed write never leaves a partial cache file
+        temp_name = None
+        try:
+            self.cache_file.parent.mkdir(exist_ok=True, parents=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.cache_file.parent, suffix='.tmp')
+            with os.fdopen(fd, mode='w', encoding='utf-8') as fh:
+                json.dump(entries, fh)
+            Path(temp_name).replace(self.cache_file)
+            self.dirty = False
+        except OSError:
+            if temp_name is not None:
+                Path(temp_name).unlink(missing_ok=True)
+            self.log.warning(
+                f'feature=file-hash-cache, event=save-failed, filename={self.cache_file}'
+            )
@@ -0,0 +1,145 @@
+"""TcEx Framework Module"""
+
+# standard library
+import hashlib
+import json
+import logging
+import re
+from urllib.parse import urlparse
+
+# third-party
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# first-party
+from tcex_cli.cli.template.template_cache_db import TemplateCacheDb
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class ConditionalCacheAdapter(HTTPAdapter):
+    """HTTP adapter that revalidates cached GET responses with ETag/Last-Modified.
+
+    Responses for the template metadata (the /commits and /contents API endpoints and the
+    template.yaml files) with an ETag or Last-Modified header are stored in the http_cache table
+    of the template cache database. Later requests for the same URL send If-None-Match/
+    If-Modified-Since, and a 304 Not Modified response (which does not count against the GitHub
+    API rate limit and has no body) is answered from the cache. Template file downloads and
+    streamed requests (e.g., zipball downloads) are not cached.
+    """
+
+    # response headers restored from the cached response on a 304 (the content is stored
+    # decoded, so the encoding/length headers are not kept)
+    cached_headers = ('Content-Type',)
+    # the url paths of the metadata responses that are cached
+    cached_paths = re.compile(r'(/commits|/contents(/.*)?|/template\.yaml)$')
+    # responses with a larger body are not cached
+    max_content_size = 1_048_576
+
+    def __init__(self, db: TemplateCacheDb, **kwargs):
+        """Initialize instance properties."""
+        super().__init__(**kwargs)
+        self.db = db
+        self.log = _logger
+
+        self._create_table()
+
+    @staticmethod
+    def _cache_key(request: PreparedRequest) -> str:
+        """Return the cache key, responses can differ per user so the auth is part of the key."""
+        auth = request.headers.get('Authorization', '')
+        auth_hash = hashlib.sha256(auth.encode()).hexdigest()[:16] if auth else ''
+        return f'{request.url}|{auth_hash}'
+
+    def _create_table(self):
+        """Create the http_cache table if it does not exist."""
+        with self.db.lock, self.db.conn:
+            self.db.conn.execute(
+                'CREATE TABLE IF NOT EXISTS http_cache ('
+                'key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, status INTEGER NOT NULL, '
+                'headers TEXT NOT NULL, content BLOB NOT NULL)'
+            )
+
+    def _get(self, key: str) -> dict | None:
+        """Return the cached HTTP response (etag, last_modified, status, headers, content)."""
+        with self.db.lock:
+            row = self.db.conn.execute(
+                'SELECT etag, last_modified, status, headers, content FROM http_cache '
+                'WHERE key = ?',
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'etag': row[0],
+            'last_modified': row[1],
+            'status': row[2],
+            'headers': json.loads(row[3]),
+            'content': row[4],
+        }
+
+    def _store(self, key: str, response: Response):
+        """Store the response if it can be revalidated."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code != 200 or (etag is None and last_modified is None):  # noqa: PLR2004
+            return
+
+        if len(response.content) > self.max_content_size:
+            self.log.debug(
+                f'feature=http-cache, event=skip-store, url={response.url}, '
+                f'size={len(response.content)}'
+            )
+            return
+
+        headers = json.dumps(
+            {h: response.headers[h] for h in self.cached_headers if h in response.headers}
+        )
+        with self.db.lock, self.db.conn:
+            self.db.conn.execute(
+                'INSERT OR REPLACE INTO http_cache '
+                '(key, etag, last_modified, status, headers, content) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, etag, last_modified, response.status_code, headers, response.content),
+            )
+
+    def cacheable(self, request: PreparedRequest, stream: bool | None = False) -> bool:
+        """Return True if the response for the request can be cached."""
+        if request.method != 'GET' or stream is True:
+            return False
+        return self.cached_paths.search(urlparse(request.url or '').path) is not None
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self.db.lock, self.db.conn:
+            self.db.conn.execute('DELETE FROM http_cache')
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # type: ignore
+        """Send the request, revalidating a cached response if one exists."""
+        if not self.cacheable(request, kwargs.get('stream')):
+            return super().send(request, **kwargs)
+
+        key = self._cache_key(request)
+        cached = self._get(key)
+        if cached is not None:
+            if cached['etag']:
+                request.headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                request.headers['If-Modified-Since'] = cached['last_modified']
+
+        response = super().send(request, **kwargs)
+        if cached is not None and response.status_code == 304:  # noqa: PLR2004
+            self.log.debug(f'feature=http-cache, event=not-modified, url={request.url}')
+            response.status_code = cached['status']
+            response.reason = 'OK'
+            response.headers = CaseInsensitiveDict({**response.headers, **cached['headers']})
+            response.encoding = get_encoding_from_headers(response.headers)
+            response._content = cached['content']  # noqa: SLF001
+            response._content_consumed = True  # type: ignore  # noqa: SLF001
+            return response
+
+        self._store(key, response)
+        return response
@@ -48,8 +48,12 @@ def command(
         proxy_pass,
     )
     try:
-        cli.list_(branch, template_type)
-        Render.table_template_list(cli.template_data, branch)
+        # render each template type as soon as its templates are available
+        cli.list_(
+            branch,
+            template_type,
+            on_type=lambda type_, templates: Render.table_template_list({type_: templates}, branch),
+        )
         if cli.errors is True:
             Render.panel.warning(
                 'Errors were encountered during command execution. Please '
@@ -14,6 +14,7 @@ from typing import TypedDict
 from pydantic import BaseModel, Field
 
 # first-party
+from tcex_cli.cli.template.file_hash_cache import FileHashCache
 from tcex_cli.render.render import Render
 
 
@@ -72,9 +73,14 @@ class Plan(BaseModel):
 class Hasher:
     """Stable SHA-256 hashing for files."""
 
-    @staticmethod
-    def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str | None:
+    def __init__(self, cache: FileHashCache | None = None):
+        """Initialize Hasher with an optional stat cache for unchanged files."""
+        self.cache = cache
+
+    def sha256_file(self, path: Path, chunk_size: int = 1024 * 1024) -> str | None:
         """Return the SHA-256 hash of a file, or None if the file does not exist."""
+        if self.cache is not None:
+            return self.cache.hash(path, 'sha256')
         if not path.exists():
             return None
         h = hashlib.sha256()
@@ -86,6 +92,12 @@ class Hasher:
                 h.update(chunk)
         return h.hexdigest()
 
+    def sha256_files(self, paths: list[Path]) -> None:
+        """Hash the files concurrently so that later sha256_file calls are served from cache."""
+        if self.cache is not None:
+            self.cache.hash_many(paths, 'sha256')
+            self.cache.save()
+
 
 class ManifestStore:
     """Load JSON manifest files and compute key sets."""
@@ -256,6 +268,18 @@ class Planner:
             template_meta, local_meta
         )
 
+        # warm the hash cache with every file the plan compares
+        if force is False:
+            self.hasher.sha256_files(
+                [
+                    dest / key
+                    for key in keys_in_template
+                    if key in local_meta
+                    and template_meta[key]['last_commit'] != local_meta[key]['last_commit']
+                ]
+                + [dest / key for key in removed_in_template]
+            )
+
         # Updates / Adds
         for key in keys_in_template:
             template_info = template_meta[key]
@@ -369,7 +393,7 @@ class TCVHelper:
         """Initialize TCVHelper with TemplateCli instance."""
         self.template_cli = template_cli
         self.repo = TemplateRepository(template_cli)
-        self.hasher = Hasher()
+        self.hasher = Hasher(template_cli.hash_cache)
         self.manifest = ManifestStore()
         self.file_ops = SafeFileOps()
         self.planner = Planner(self.manifest, self.hasher, self.file_ops)
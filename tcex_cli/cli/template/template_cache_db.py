@@ -0,0 +1,131 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class TemplateCacheDb:
+    """Indexed sqlite store for the template config cache.
+
+    Configs are keyed by (type, name), so a lookup or upsert only touches a single row instead
+    of scanning and rewriting the whole document. The database uses WAL mode so that concurrent
+    tcex commands can read while another one writes.
+    """
+
+    def __init__(self, db_file: Path, legacy_file: Path | None = None):
+        """Initialize instance properties.
+
+        Args:
+            db_file: The sqlite database file (e.g., ~/.tcex/template_cache.db).
+            legacy_file: The previous TinyDB JSON cache file, migrated on first use.
+        """
+        self.db_file = db_file
+        self.legacy_file = legacy_file
+        self.lock = threading.Lock()
+        self.log = _logger
+
+        self.db_file.parent.mkdir(exist_ok=True, parents=True)
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False, timeout=10)
+        self._create_tables()
+        self._migrate_legacy_file()
+
+    def _create_tables(self):
+        """Create the tables if they do not exist."""
+        with self.lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS template_config ('
+                'type TEXT NOT NULL, name TEXT NOT NULL, data TEXT NOT NULL, '
+                'PRIMARY KEY (type, name))'
+            )
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS repo_sha ('
+                'id INTEGER PRIMARY KEY CHECK (id = 1), sha TEXT NOT NULL)'
+            )
+
+    def _migrate_legacy_file(self):
+        """Import the data from the TinyDB JSON cache file and then remove it."""
+        if self.legacy_file is None or not self.legacy_file.is_file():
+            return
+
+        try:
+            contents = json.loads(self.legacy_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            contents = None
+
+        if not isinstance(contents, dict):
+            # keep the file that could not be parsed so that its data is not lost
+            self.log.warning(
+                f'feature=template-cache, event=migrate-failed, filename={self.legacy_file}'
+            )
+            return
+
+        # TinyDB format: {"<table>": {"<doc_id>": {document}}}
+        documents = [
+            document
+            for table in contents.values()
+            if isinstance(table, dict)
+            for document in table.values()
+            if isinstance(document, dict)
+        ]
+        for document in documents:
+            if 'sha' in document:
+                self.set_sha(document['sha'])
+            elif document.get('type') is not None and document.get('name') is not None:
+                self.upsert_config(document['type'], document['name'], json.dumps(document))
+
+        self.log.info(
+            f'feature=template-cache, event=migrated, filename={self.legacy_file}, '
+            f'documents={len(documents)}'
+        )
+        self.legacy_file.unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove all cached data."""
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM template_config')
+            self.conn.execute('DELETE FROM repo_sha')
+
+    def get_config(self, template_type: str, name: str) -> dict | None:
+        """Return the cached template config."""
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT data FROM template_config WHERE type = ? AND name = ?',
+                (template_type, name),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_sha(self, sha: str) -> str | None:
+        """Return the sha if it matches the stored repo sha."""
+        with self.lock:
+            row = self.conn.execute('SELECT sha FROM repo_sha WHERE sha = ?', (sha,)).fetchone()
+        return row[0] if row else None
+
+    def set_sha(self, sha: str):
+        """Store the repo sha (only a single sha is stored)."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO repo_sha (id, sha) VALUES (1, ?) '
+                'ON CONFLICT (id) DO UPDATE SET sha = excluded.sha',
+                (sha,),
+            )
+
+    def upsert_config(self, template_type: str, name: str, data: str):
+        """Insert or update a template config (data is the JSON config)."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO template_config (type, name, data) VALUES (?, ?, ?) '
+                'ON CONFLICT (type, name) DO UPDATE SET data = excluded.data',
+                (template_type, name, data),
+            )
@@ -1,10 +1,10 @@
 """TcEx Framework Module"""
 
 # standard library
-import hashlib
 import json
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # third-party
@@ -12,12 +12,14 @@ import yaml
 from pydantic import ValidationError
 from requests import Response, Session
 from requests.auth import HTTPBasicAuth
-from tinydb import Query, TinyDB
 
 # first-party
 from tcex_cli.cli.cli_abc import CliABC
 from tcex_cli.cli.model.file_metadata_model import FileMetadataModel
+from tcex_cli.cli.template.file_hash_cache import FileHashCache
+from tcex_cli.cli.template.http_cache import ConditionalCacheAdapter
 from tcex_cli.cli.template.model.template_config_model import TemplateConfigModel
+from tcex_cli.cli.template.template_cache_db import TemplateCacheDb
 from tcex_cli.pleb.cached_property import cached_property
 from tcex_cli.pleb.proxies import proxies
 from tcex_cli.render.render import Render
@@ -45,6 +47,7 @@ class TemplateCli(CliABC):
         self.errors = False
         self.gh_password = os.getenv('GITHUB_PAT', None)
         self.gh_username = os.getenv('GITHUB_USER', None)
+        self.max_workers = 16
         self.template_configs = {}
         self.template_data: dict[str, list[TemplateConfigModel]] = {}
         self.template_manifest = {}
@@ -90,51 +93,60 @@ class TemplateCli(CliABC):
     def clear(self):
         """Clear the stored template cache."""
         Render.panel.info('Clearing template cache.')
-        (self.cli_out_path / 'tcex.json').unlink(missing_ok=True)
+        (self.cli_out_path / 'tcex.json').unlink(missing_ok=True)  # legacy TinyDB cache
+        self.db.clear()
+        self.http_cache.clear()
+        self.hash_cache.cache_file.unlink(missing_ok=True)
 
     @cached_property
-    def db(self) -> TinyDB:
+    def hash_cache(self) -> FileHashCache:
+        """Return the persistent file hash cache."""
+        return FileHashCache(self.cli_out_path / 'file_hash_cache.json')
+
+    @cached_property
+    def http_cache(self) -> ConditionalCacheAdapter:
+        """Return the HTTP response cache adapter for the session."""
+        # the pool size matches the worker threads, which share the session
+        return ConditionalCacheAdapter(self.db, pool_maxsize=self.max_workers)
+
+    @cached_property
+    def db(self) -> TemplateCacheDb:
         """Return db instance."""
-        db_file = self.cli_out_path / 'tcex.json'
+        db_file = self.cli_out_path / 'template_cache.db'
         try:
-            return TinyDB(db_file)
+            # the previous TinyDB cache (tcex.json) is migrated on first use
+            return TemplateCacheDb(db_file, legacy_file=self.cli_out_path / 'tcex.json')
         except Exception:
             self.log.exception(f'action=get-db, file={db_file}')
             Render.panel.failure('Failed to open database.')
 
     def db_add_config(self, config: TemplateConfigModel):
         """Add a config to the DB."""
-        config_query = Query()
         try:
             if config.name == '_app_common':
                 config.type = '_app_common'
-            self.db.upsert(
-                json.loads(config.json()),
-                (config_query.type == config.type) & (config_query.name == config.name),
-            )
+            self.db.upsert_config(config.type, config.name, config.json())
         except Exception:
             self.log.exception('Failed inserting config in db.')
             self.errors = True
 
     def db_add_sha(self, sha: str):
         """Add a config to the DB."""
-        sha_query = Query()
         try:
-            self.db.upsert({'sha': sha}, sha_query.sha.exists())
+            self.db.set_sha(sha)
         except Exception:
             self.log.exception('Failed inserting config in db.')
             self.errors = True
 
     def db_get_config(self, template_type: str, template: str) -> TemplateConfigModel | None:
         """Get a config from the DB."""
-        config = Query()
         try:
             if template == '_app_common':
                 template_type = '_app_common'
-            config = self.db.search((config.type == template_type) & (config.name == template))
+            config = self.db.get_config(template_type, template)
 
             if config:
-                return TemplateConfigModel(**config[0])
+                return TemplateConfigModel(**config)
         except Exception:
             self.log.exception('Failed retrieving config from db.')
             self.errors = True
@@ -144,17 +156,12 @@ class TemplateCli(CliABC):
 
     def db_get_sha(self, sha: str) -> str | None:
         """Get repo SHA from the DB."""
-        sha_query = Query()
         try:
-            data = self.db.search(sha_query.sha == sha)
-            if data:
-                return data[0].get('sha')
+            return self.db.get_sha(sha)
         except Exception:
             self.log.exception(f'action=db-get-sha, sha={sha}')
             self.errors = True
             return None
-        else:
-            return None
 
     def download_template_file(self, item: FileMetadataModel):
         """Download the provided source file to the provided destination."""
@@ -190,17 +197,9 @@ class TemplateCli(CliABC):
         # update manifest, using the path as the key for uniqueness
         self.template_manifest[item.path]['md5'] = self.file_hash(destination)
 
-    @staticmethod
-    def file_hash(fqfn: Path) -> str:
-        """Return the file hash."""
-        with fqfn.open(mode='rb') as fh:
-            md5 = hashlib.md5()  # nosec
-            while True:
-                chunk = fh.read(8192)
-                if not chunk:
-                    break
-                md5.update(chunk)
-        return md5.hexdigest()
+    def file_hash(self, fqfn: Path) -> str:
+        """Return the file hash (from the stat cache if the file is unchanged)."""
+        return self.hash_cache.hash(fqfn, 'md5') or ''
 
     def file_metadata_contents(
         self,
@@ -319,6 +318,18 @@ class TemplateCli(CliABC):
         else:
             return config
 
+    def get_template_configs(
+        self, templates: list[tuple[str, str]], branch: str = 'v2'
+    ) -> list[TemplateConfigModel | None]:
+        """Return the template configs for the (name, type) pairs, fetched concurrently."""
+        # resolve the cache state once, before the worker threads
+        _ = self.cache_valid
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(
+                executor.map(lambda t: self.get_template_config(t[0], t[1], branch), templates)
+            )
+
     def get_template_config_contents(self, branch: str, url: str) -> Response:
         """Return the contents of the template."""
         params = {}
@@ -379,16 +390,37 @@ class TemplateCli(CliABC):
 
         return data
 
+    def get_templates_contents(
+        self, branch: str, template_names: list[str], template_type: str, app_builder: bool
+    ) -> dict[str, FileMetadataModel]:
+        """Get the contents of all templates concurrently, merged in template order."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # template_name is both the name and the path
+            results = list(
+                executor.map(
+                    lambda name: self.get_template_contents(
+                        branch, {}, name, name, template_type, app_builder
+                    ),
+                    template_names,
+                )
+            )
+
+        # templates are hierarchical, later templates overwrite the files of earlier ones
+        data: dict[str, FileMetadataModel] = {}
+        for result in results:
+            data.update(result)
+        return data
+
     def init(
         self, branch: str, template_name: str, template_type: str, app_builder: bool
     ) -> list[FileMetadataModel]:
         """Initialize an App with template files."""
-        data = {}
-        for template_parent_name in self.template_parents(template_name, template_type, branch):
-            # template_parent_name is both the name and the path
-            self.get_template_contents(
-                branch, data, template_parent_name, template_parent_name, template_type, app_builder
-            )
+        data = self.get_templates_contents(
+            branch,
+            self.template_parents(template_name, template_type, branch),
+            template_type,
+            app_builder,
+        )
         return list(data.values())
 
     def item_relative_path(self, item: FileMetadataModel) -> Path:
@@ -410,8 +442,18 @@ class TemplateCli(CliABC):
             return f'{item.template_name}/'
         return f'{item.template_type}/{item.template_name}/'
 
-    def list_(self, branch: str, template_type: str | None = None):
-        """List template types."""
+    def list_(
+        self,
+        branch: str,
+        template_type: str | None = None,
+        on_type: Callable[[str, list[TemplateConfigModel]], None] | None = None,
+    ):
+        """List template types.
+
+        The templates of every type and their configs are fetched concurrently. The on_type
+        callback is called for each type (in order) as soon as its templates are available,
+        so the list can be rendered progressively.
+        """
         template_types = self.template_types
         if template_type is not None:
             if template_type not in self.template_types:
@@ -419,14 +461,36 @@ class TemplateCli(CliABC):
                 raise ValueError(ex_msg)
             template_types = [template_type]
 
-        for selected_type in template_types:
-            for meta in self.file_metadata_contents(branch, selected_type):
-                if meta['type'] == 'dir':
-                    template_config = self.get_template_config(meta['name'], selected_type, branch)
+        # resolve the cache state once, before the worker threads
+        _ = self.cache_valid
+
+        def _template_names(selected_type: str) -> list[str]:
+            return [
+                meta['name']
+                for meta in self.file_metadata_contents(branch, selected_type)
+                if meta['type'] == 'dir'
+            ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            listings = {t: executor.submit(_template_names, t) for t in template_types}
+            config_futures = {
+                t: [
+                    executor.submit(self.get_template_config, name, t, branch)
+                    for name in listings[t].result()
+                ]
+                for t in template_types
+            }
+
+            for selected_type in template_types:
+                for future in config_futures[selected_type]:
+                    template_config = future.result()
                     if template_config is not None:
                         self.template_data.setdefault(selected_type, [])
                         self.template_data[selected_type].append(template_config)
 
+                if on_type is not None and selected_type in self.template_data:
+                    on_type(selected_type, self.template_data[selected_type])
+
     def load_template_manifest(self):
         """Write the template manifest file."""
         if self.template_manifest_fqfn.is_file():
@@ -472,6 +536,10 @@ class TemplateCli(CliABC):
         """Return session object"""
         session = Session()
         session.headers.update({'Cache-Control': 'no-cache'})
+
+        # revalidate cached responses with ETag/Last-Modified, a 304 response does not count
+        # against the GitHub rate limit and is answered from the on-disk cache
+        session.mount('https://', self.http_cache)
         session.proxies = proxies(
             proxy_host=self.proxy_host,
             proxy_port=self.proxy_port,
@@ -526,10 +594,13 @@ class TemplateCli(CliABC):
                 '\n\nTry running "tcex list" to get valid template types and names.'
             )
 
+        # fetch all parent configs concurrently
+        parents = template_config.template_parents or []
+        parent_configs = self.get_template_configs([(p, template_type) for p in parents], branch)
+
         app_templates = []
         # iterate over each parent template
-        for parent in template_config.template_parents or []:
-            parent_config = self.get_template_config(parent, template_type, branch)
+        for parent_config in parent_configs:
             if parent_config is None:
                 continue
 
@@ -590,25 +661,27 @@ class TemplateCli(CliABC):
             self.app.tj.model.template_type = template_type
 
         # retrieve ALL template contents
-        data: dict[str, FileMetadataModel] = {}
-
         # for App builder, both template_name and template_type were made optional in the
         # model, but in reality these fields are required.  This is a temporary fix to
         # allow App Builder to work with older Apps that do not have these fields set.
-        for template_parent_name in self.template_parents(
-            self.app.tj.model.template_name,  # type: ignore
-            self.app.tj.model.template_type,  # type: ignore
-            branch,  # type: ignore
-        ):
-            # template_parent_name is both the name and the path
-            self.get_template_contents(
-                branch,
-                data,
-                template_parent_name,
-                template_parent_name,
+        data = self.get_templates_contents(
+            branch,
+            self.template_parents(
+                self.app.tj.model.template_name,  # type: ignore
                 self.app.tj.model.template_type,  # type: ignore
-                app_builder=False,
+                branch,  # type: ignore
+            ),
+            self.app.tj.model.template_type,  # type: ignore
+            app_builder=False,
+        )
+
+        # hash the existing files up front (concurrently, unchanged files come from the cache)
+        if ignore_hash is False:
+            self.hash_cache.hash_many(
+                [item.relative_path for item in data.values() if item.relative_path.is_file()],
+                'md5',
             )
+            self.hash_cache.save()
 
         # determine which files should be downloaded
         downloads = []
@@ -14,6 +14,7 @@ from pydantic import ValidationError
 # first-party
 from tcex_cli.app.config.job_json import JobJson
 from tcex_cli.cli.cli_abc import CliABC
+from tcex_cli.cli.file_walker import walk_files
 from tcex_cli.cli.model.validation_data_model import ValidationDataModel, ValidationItemModel
 
 with suppress(ModuleNotFoundError):
@@ -274,7 +275,7 @@ class ValidateCli(CliABC):
         """
         fqpn = Path(app_path or Path.cwd())
 
-        for fqfn in sorted(fqpn.iterdir()):
+        for fqfn in walk_files(fqpn, patterns=['*.py', '*.json'], max_depth=0):
             error = None
             status = True
             if fqfn.name.endswith('.py'):
@@ -299,9 +300,6 @@ class ValidateCli(CliABC):
                     self.invalid_json_files.append(fqfn.name)
                     status = False
                     error = e
-            else:
-                # skip unsupported file types
-                continue
 
             if error:
                 # update validation data errors
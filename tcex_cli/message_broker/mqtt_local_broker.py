@@ -0,0 +1,251 @@
+"""TcEx Framework Module"""
+
+# standard library
+import logging
+import socket
+import socketserver
+import struct
+from enum import IntEnum
+from threading import Lock
+from typing import BinaryIO
+
+# third-party
+import paho.mqtt.client as mqtt
+
+# first-party
+from tcex_cli.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class PacketType(IntEnum):
+    """MQTT control packet types (the high nibble of the fixed header)."""
+
+    CONNECT = 0x10
+    CONNACK = 0x20
+    PUBLISH = 0x30
+    PUBACK = 0x40
+    PUBREC = 0x50
+    PUBREL = 0x60
+    PUBCOMP = 0x70
+    SUBSCRIBE = 0x80
+    SUBACK = 0x90
+    UNSUBSCRIBE = 0xA0
+    UNSUBACK = 0xB0
+    PINGREQ = 0xC0
+    PINGRESP = 0xD0
+    DISCONNECT = 0xE0
+
+
+# MQTT 3.1 (3) and 3.1.1 (4) protocol levels
+SUPPORTED_PROTOCOL_LEVELS = (3, 4)
+
+
+def _encode_remaining_length(length: int) -> bytes:
+    """Return the MQTT variable length encoding of the remaining length."""
+    encoded = bytearray()
+    while True:
+        byte, length = length % 128, length // 128
+        if length > 0:
+            byte |= 0x80
+        encoded.append(byte)
+        if length == 0:
+            return bytes(encoded)
+
+
+def _encode_string(value: bytes) -> bytes:
+    """Return a MQTT length-prefixed string."""
+    return struct.pack('!H', len(value)) + value
+
+
+def _read_string(data: bytes, offset: int) -> tuple[bytes, int]:
+    """Return a MQTT length-prefixed string and the offset after it."""
+    (length,) = struct.unpack_from('!H', data, offset)
+    offset += 2
+    return data[offset : offset + length], offset + length
+
+
+class MqttLocalBrokerHandler(socketserver.BaseRequestHandler):
+    """Handle a single MQTT client connection."""
+
+    server: 'MqttLocalBroker'
+
+    def setup(self):
+        """Initialize connection properties."""
+        # MQTT packets are small, don't let Nagle's algorithm delay them
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.subscriptions: set[str] = set()
+        self.write_lock = Lock()
+
+    def _read_packet(self, rfile: BinaryIO) -> tuple[int, int, bytes] | None:
+        """Return the packet type, flags and body of the next packet, or None on EOF."""
+        header = rfile.read(1)
+        if not header:
+            return None
+
+        multiplier = 1
+        remaining_length = 0
+        while True:
+            byte = rfile.read(1)
+            if not byte:
+                return None
+            remaining_length += (byte[0] & 0x7F) * multiplier
+            if not byte[0] & 0x80:
+                break
+            multiplier *= 128
+
+        body = rfile.read(remaining_length)
+        if len(body) != remaining_length:
+            return None
+        return header[0] & 0xF0, header[0] & 0x0F, body
+
+    def handle(self):
+        """Handle MQTT control packets until the client disconnects."""
+        rfile = self.request.makefile('rb')
+        try:
+            while (packet := self._read_packet(rfile)) is not None:
+                packet_type, flags, body = packet
+                if self.handle_packet(packet_type, flags, body) is False:
+                    break
+        except (ConnectionError, OSError, struct.error):
+            self.server.log.debug('feature=local-message-broker, event=client-connection-error')
+        finally:
+            self.server.remove_client(self)
+            rfile.close()
+
+    def handle_packet(self, packet_type: int, flags: int, body: bytes) -> bool:
+        """Handle a MQTT control packet, returning False when the connection should close."""
+        match packet_type:
+            case PacketType.CONNECT:
+                _, offset = _read_string(body, 0)
+                if body[offset] not in SUPPORTED_PROTOCOL_LEVELS:
+                    # return code 1: unacceptable protocol version
+                    self.send(bytes([PacketType.CONNACK, 2, 0, 1]))
+                    return False
+                self.server.add_client(self)
+                self.send(bytes([PacketType.CONNACK, 2, 0, 0]))
+
+            case PacketType.PUBLISH:
+                qos = (flags >> 1) & 0x03
+                topic, offset = _read_string(body, 0)
+                if qos:
+                    packet_id = body[offset : offset + 2]
+                    offset += 2
+                    self.send(
+                        bytes([PacketType.PUBACK if qos == 1 else PacketType.PUBREC, 2]) + packet_id
+                    )
+                self.server.publish(topic.decode('utf-8'), body[offset:])
+
+            case PacketType.PUBREL:
+                self.send(bytes([PacketType.PUBCOMP, 2]) + body[:2])
+
+            case PacketType.SUBSCRIBE:
+                packet_id, offset = body[:2], 2
+                topic_filters = []
+                while offset < len(body):
+                    topic_filter, offset = _read_string(body, offset)
+                    offset += 1  # requested qos, messages are always delivered at qos 0
+                    topic_filters.append(topic_filter.decode('utf-8'))
+                self.server.subscribe(self, topic_filters)
+                granted = bytes(len(topic_filters))
+                self.send(
+                    bytes([PacketType.SUBACK])
+                    + _encode_remaining_length(len(granted) + 2)
+                    + packet_id
+                    + granted
+                )
+
+            case PacketType.UNSUBSCRIBE:
+                packet_id, offset = body[:2], 2
+                topic_filters = []
+                while offset < len(body):
+                    topic_filter, offset = _read_string(body, offset)
+                    topic_filters.append(topic_filter.decode('utf-8'))
+                self.server.unsubscribe(self, topic_filters)
+                self.send(bytes([PacketType.UNSUBACK, 2]) + packet_id)
+
+            case PacketType.PINGREQ:
+                self.send(bytes([PacketType.PINGRESP, 0]))
+
+            case PacketType.DISCONNECT:
+                return False
+
+        return True
+
+    def send(self, data: bytes):
+        """Send data to the client."""
+        with self.write_lock:
+            self.request.sendall(data)
+
+
+class MqttLocalBroker(socketserver.ThreadingTCPServer):
+    """Lightweight in-process MQTT 3.1.1 broker for running service Apps locally.
+
+    Only the features used by the tcex message broker are supported. Messages are routed in
+    memory and always delivered at QoS 0, and retained messages, wills and authentication
+    are not supported.
+    """
+
+    allow_reuse_address = True
+    block_on_close = False
+    daemon_threads = True
+
+    def __init__(self, server_address: tuple[str, int]):
+        """Initialize instance properties."""
+        super().__init__(server_address, MqttLocalBrokerHandler)
+
+        # properties
+        self._clients: list[MqttLocalBrokerHandler] = []
+        self._index: dict[str, list[MqttLocalBrokerHandler]] = {}
+        self._lock = Lock()
+        self.log = _logger
+        self.messages_routed = 0
+
+    def add_client(self, client: MqttLocalBrokerHandler):
+        """Add a connected client."""
+        with self._lock:
+            self._clients.append(client)
+            self._index.clear()
+
+    def publish(self, topic: str, payload: bytes):
+        """Route a message to all clients with a matching subscription."""
+        subscribers = self._index.get(topic)
+        if subscribers is None:
+            with self._lock:
+                subscribers = [
+                    client
+                    for client in self._clients
+                    if any(mqtt.topic_matches_sub(sub, topic) for sub in client.subscriptions)
+                ]
+                self._index[topic] = subscribers
+
+        topic_ = _encode_string(topic.encode('utf-8'))
+        packet = bytes([PacketType.PUBLISH]) + _encode_remaining_length(len(topic_) + len(payload))
+        packet += topic_ + payload
+        for client in subscribers:
+            try:
+                client.send(packet)
+            except OSError:
+                self.log.debug(f'feature=local-message-broker, event=publish-failed, topic={topic}')
+        self.messages_routed += 1
+
+    def remove_client(self, client: MqttLocalBrokerHandler):
+        """Remove a disconnected client."""
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+            self._index.clear()
+
+    def subscribe(self, client: MqttLocalBrokerHandler, topic_filters: list[str]):
+        """Add the topic filters to the client subscriptions."""
+        # publish iterates the subscriptions under the lock from other client threads
+        with self._lock:
+            client.subscriptions.update(topic_filters)
+            self._index.clear()
+
+    def unsubscribe(self, client: MqttLocalBrokerHandler, topic_filters: list[str]):
+        """Remove the topic filters from the client subscriptions."""
+        with self._lock:
+            client.subscriptions.difference_update(topic_filters)
+            self._index.clear()
@@ -5,6 +5,7 @@ import logging
 import ssl
 import time
 from collections.abc import Callable
+from threading import Event, Lock
 
 # third-party
 import paho.mqtt.client as mqtt
@@ -46,11 +47,19 @@ class MqttMessageBroker:
         self.broker_cacert = broker_cacert
 
         # properties
-        self._connected = False
+        self._connect_count = 0
+        self._connect_latency: float | None = None
+        self._connect_started: float | None = None
+        self._connected = Event()
+        self._disconnect_count = 0
+        self._messages_published = 0
+        self._messages_received = 0
         self._on_connect_callbacks: list[Callable] = []
         self._on_disconnect_callbacks: list[Callable] = []
         self._on_log_callbacks: list[Callable] = []
         self._on_message_callbacks: list[dict[str, Callable | list[str]]] = []
+        self._on_message_index: dict[str, list[Callable]] = {}
+        self._on_message_lock = Lock()
         self._on_publish_callbacks: list[Callable] = []
         self._on_subscribe_callbacks: list[Callable] = []
         self._on_unsubscribe_callbacks: list[Callable] = []
@@ -100,7 +109,9 @@ class MqttMessageBroker:
         """
         index = index or len(self._on_message_callbacks)
         topics = topics or []
-        self._on_message_callbacks.insert(index, {'callback': callback, 'topics': topics})
+        with self._on_message_lock:
+            self._on_message_callbacks.insert(index, {'callback': callback, 'topics': topics})
+            self._on_message_index.clear()
 
     def add_on_publish_callback(self, callback: Callable, index: int | None = None):
         """Add a callback for on_publish events.
@@ -153,11 +164,11 @@ class MqttMessageBroker:
                 _client.username_pw_set('', password=self.broker_token.value)
 
             # add logger when logging in TRACE
-            debug_log_level = 5
-            if self.log.getEffectiveLevel() == debug_log_level:
+            if self.trace_enabled:
                 _client.enable_logger(logger=self.log)
 
             # connect after all configuration is complete
+            self._connect_started = time.perf_counter()
             _client.connect(self.broker_host, self.broker_port, self.broker_timeout)
 
         except Exception:
@@ -166,31 +177,80 @@ class MqttMessageBroker:
 
         return _client
 
-    def connect(self):
-        """Listen for message coming from broker."""
+    def close(self):
+        """Disconnect from the broker and stop the network loop thread."""
+        if self._connected.is_set():
+            self.client.disconnect()
+        self.client.loop_stop()
+        self._connected.clear()
+
+    def connect(self, timeout: float | None = None) -> bool:
+        """Start the network loop and wait for the broker connection.
+
+        The paho network loop runs in its own thread. This method blocks only until the
+        on_connect event is signaled or the timeout is reached.
+
+        Args:
+            timeout: The number of seconds to wait for the connection. Defaults to the
+                broker timeout.
+
+        Returns:
+            bool: True if connected to the broker.
+        """
+        if self.shutdown is True:
+            # the client failed to connect during setup
+            return False
+
+        timeout = self.broker_timeout if timeout is None else timeout
         try:
-            # handle connection issues by not using loop_forever. give the service X seconds to
-            # connect to message broker, else timeout and log generic connection error.
             self.client.loop_start()
-            deadline = time.time() + self.broker_timeout
-            while True:
-                if not self._connected and deadline < time.time():
-                    self.client.loop_stop()
-                    ex_msg = (
-                        f'failed to connect to message broker host '
-                        f'{self.broker_host} on port '
-                        f'{self.broker_port}.'
-                    )
-                    raise ConnectionError(ex_msg)  # noqa: TRY301
-                time.sleep(1)
-
+            if not self._connected.wait(timeout):
+                self.client.loop_stop()
+                ex_msg = (
+                    f'failed to connect to message broker host '
+                    f'{self.broker_host} on port '
+                    f'{self.broker_port}.'
+                )
+                raise ConnectionError(ex_msg)  # noqa: TRY301
         except Exception:
             self.log.exception('feature=message-broker, event=connection-error')
+            return False
+        return True
+
+    @property
+    def connected(self) -> bool:
+        """Return True if currently connected to the broker."""
+        return self._connected.is_set()
+
+    @property
+    def metrics(self) -> dict[str, bool | float | int | None]:
+        """Return connection state and latency metrics."""
+        return {
+            'connected': self.connected,
+            'connect_count': self._connect_count,
+            'connect_latency_ms': (
+                round(self._connect_latency * 1000, 3) if self._connect_latency else None
+            ),
+            'disconnect_count': self._disconnect_count,
+            'messages_published': self._messages_published,
+            'messages_received': self._messages_received,
+        }
 
     def on_connect(self, client, userdata, flags, rc, properties):
         """Handle MQTT on_connect events."""
-        self.log.info(f'feature=message-broker, event=broker-connect, status={rc!s}')
-        self._connected = True
+        if self._connect_started is not None:
+            self._connect_latency = time.perf_counter() - self._connect_started
+            self._connect_started = None
+        self._connect_count += 1
+        self.log.info(
+            f'feature=message-broker, event=broker-connect, status={rc!s}, '
+            f'latency={self._connect_latency}'
+        )
+        if rc.is_failure:
+            # leave the event clear so that connect() times out and reports the failure
+            self.log.error(f'feature=message-broker, event=broker-connect-refused, reason={rc!s}')
+        else:
+            self._connected.set()
         for callback in self._on_connect_callbacks:
             callback(client, userdata, flags, rc, properties)
 
@@ -201,6 +261,10 @@ class MqttMessageBroker:
     def on_disconnect(self, client, userdata, flags, rc, properties):
         """Handle MQTT on_disconnect events."""
         self.log.info(f'feature=message-broker, event=broker-disconnect, status={rc!s}')
+        self._connected.clear()
+        self._disconnect_count += 1
+        # reconnects are handled by paho, measure the latency from the disconnect
+        self._connect_started = time.perf_counter()
         for callback in self._on_disconnect_callbacks:
             callback(client, userdata, flags, rc, properties)
 
@@ -209,18 +273,40 @@ class MqttMessageBroker:
         for callback in self._on_log_callbacks:
             callback(client, userdata, level, buf)
 
+    def _on_message_callbacks_for_topic(self, topic: str) -> list[Callable]:
+        """Return the on_message callbacks for the provided topic.
+
+        The callbacks for each topic are resolved once, in registration order, and stored in
+        an index that is cleared whenever a callback is added or removed. Topic restrictions
+        support the MQTT "+" and "#" wildcards.
+        """
+        callbacks = self._on_message_index.get(topic)
+        if callbacks is None:
+            with self._on_message_lock:
+                callbacks = [
+                    cd['callback']
+                    for cd in self._on_message_callbacks
+                    # if there are no topic restrictions, or the current message
+                    # topic matches one of the restrictions, call the callback
+                    if callable(cd['callback'])
+                    and (
+                        not cd.get('topics')
+                        or any(mqtt.topic_matches_sub(t, topic) for t in cd['topics'])  # type: ignore
+                    )
+                ]
+                self._on_message_index[topic] = callbacks
+        return callbacks  # type: ignore
+
     def on_message(self, client, userdata, message):
         """Handle MQTT on_message events."""
-        mp = message.payload.decode().replace('\n', '')
-        self.log.trace(
-            f'feature=message-broker, message-topic={message.topic}, message-payload={mp}'
-        )
-        for cd in self._on_message_callbacks:
-            # if there are no topic restrictions, or the current message
-            # topic is in the list of restrictions, call the callback
-            topics = cd.get('topics')
-            if (topics in ([], None) or message.topic in topics) and callable(cd['callback']):
-                cd['callback'](client, userdata, message)
+        self._messages_received += 1
+        if self.trace_enabled:
+            mp = message.payload.decode().replace('\n', '')
+            self.log.trace(
+                f'feature=message-broker, message-topic={message.topic}, message-payload={mp}'
+            )
+        for callback in self._on_message_callbacks_for_topic(message.topic):
+            callback(client, userdata, message)
 
     def on_publish(self, client, userdata, mid, rc, properties):
         """Handle MQTT on_publish events."""
@@ -246,6 +332,7 @@ class MqttMessageBroker:
             topic: The broker topic.
         """
         r = self.client.publish(topic, message)
+        self._messages_published += 1
         self.log.debug(
             f'feature=service, event=publish-message, topic="{topic}", '
             f'message={message}, response={r}'
@@ -270,6 +357,29 @@ class MqttMessageBroker:
             topics: A optional list of topics to call callback. If value is None then callback
                 will always be called.
         """
-        for cb in self._on_message_callbacks:
-            if cb['callback'] == callback and cb['topics'] == topics:
-                self._on_message_callbacks.remove(cb)
+        with self._on_message_lock:
+            self._on_message_callbacks = [
+                cb
+                for cb in self._on_message_callbacks
+                if not (cb['callback'] == callback and cb['topics'] == (topics or []))
+            ]
+            self._on_message_index.clear()
+
+    @cached_property
+    def trace_enabled(self) -> bool:
+        """Return True if TRACE log records would be emitted by any handler.
+
+        The tcex logger level is always TRACE and the file handler filters at DEBUG, so the
+        logger level alone can not be used. The handlers are only checked once.
+        """
+        if not self.log.isEnabledFor(logging.TRACE):  # type: ignore
+            return False
+
+        logger: logging.Logger | None = self.log
+        while logger:
+            if any(h.level <= logging.TRACE for h in logger.handlers):  # type: ignore
+                return True
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        return False
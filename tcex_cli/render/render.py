@@ -11,6 +11,7 @@ from rich.table import Column, Table
 # first-party
 from tcex_cli.cli.model.app_metadata_model import AppMetadataModel
 from tcex_cli.cli.model.validation_data_model import ValidationItemModel
+from tcex_cli.cli.run.model.playbook_profile_result_model import PlaybookProfileResultModel
 from tcex_cli.cli.template.model.template_config_model import TemplateConfigModel
 from tcex_cli.util.render.render import Render as RenderUtil
 
@@ -63,6 +64,7 @@ class Render(RenderUtil):
         Accepts the following structuresL
         [
             {
+                'app': '',  # optional, for reports of multiple Apps
                 'input': '',
                 'calculated': ''
                 'current': ''
@@ -76,6 +78,9 @@ class Render(RenderUtil):
             show_header=True,
         )
 
+        show_app = any('app' in item for item in data)
+        if show_app:
+            table.add_column('app', justify='left', style=key_style)
         table.add_column(
             'input',
             justify='left',
@@ -99,7 +104,10 @@ class Render(RenderUtil):
         )
 
         for item in data:
-            table.add_row(item['input'], item['calculated'], item['current'])
+            row = [item['input'], item['calculated'], item['current']]
+            if show_app:
+                row.insert(0, item.get('app', ''))
+            table.add_row(*row)
 
         # render panel->table
         if data:
@@ -141,6 +149,32 @@ class Render(RenderUtil):
         if summary_data:
             print_(Panel(table, border_style='', title=title, title_align=cls.title_align))
 
+    @classmethod
+    def table_profile_summary(cls, title: str, summary_data: list[PlaybookProfileResultModel]):
+        """Render playbook profile summary table."""
+        table = Table(expand=True, border_style='dim', show_edge=False)
+
+        table.add_column('Profile', justify='left', style=cls.accent2, no_wrap=True)
+        table.add_column('Exit Code', justify='right')
+        table.add_column('Runtime (s)', justify='right')
+        table.add_column('Outputs', justify='right')
+        table.add_column('Output Diff', justify='left', style='bold')
+        table.add_column('Log', justify='left', style='dim')
+
+        for item in summary_data:
+            table.add_row(
+                item.name,
+                f'[{item.status_color}]{item.exit_code}',
+                f'{item.elapsed:.2f}',
+                str(item.output_count),
+                f'[{item.status_color}]{item.diff_value}',
+                item.log_file,
+            )
+
+        # render panel->table
+        if summary_data:
+            print_(Panel(table, border_style='', title=title, title_align=cls.title_align))
+
     @classmethod
     def table_template_list(
         cls, template_data: dict[str, list[TemplateConfigModel]], branch: str | None
@@ -196,6 +230,27 @@ class Render(RenderUtil):
                 )
             )
 
+    @classmethod
+    def table_trigger_simulation(cls, title: str, summary_data: list[dict[str, str]]):
+        """Render trigger simulation summary table."""
+        table = Table(expand=True, border_style='dim', show_edge=False)
+
+        table.add_column('Trigger ID', justify='left', style=cls.accent2, no_wrap=True)
+        table.add_column('Events Sent', justify='right')
+        table.add_column('Fire Events', justify='right')
+        table.add_column('Min (ms)', justify='right')
+        table.add_column('Avg (ms)', justify='right')
+        table.add_column('P95 (ms)', justify='right')
+        table.add_column('Max (ms)', justify='right')
+        table.add_column('Readback Avg (ms)', justify='right')
+
+        for row in summary_data:
+            table.add_row(*row.values())
+
+        # render panel->table
+        if summary_data:
+            print_(Panel(table, border_style='', title=title, title_align=cls.title_align))
+
     @staticmethod
     def table_validation_summary(title: str, summary_data: list[ValidationItemModel]):
         """Render validation summary table."""
@@ -0,0 +1 @@
+"""TcEx Framework Module"""
@@ -0,0 +1,106 @@
+"""Local Message Broker Testing"""
+
+# standard library
+import queue
+import threading
+from collections.abc import Iterator
+
+# third-party
+import paho.mqtt.client as mqtt
+import pytest
+
+# first-party
+from tcex_cli.message_broker.mqtt_local_broker import MqttLocalBroker
+
+
+@pytest.fixture
+def broker() -> Iterator[MqttLocalBroker]:
+    """Start the local broker on a free port.
+
+    Yields:
+        The running local broker.
+    """
+    local_broker = MqttLocalBroker(('127.0.0.1', 0))
+    thread = threading.Thread(target=local_broker.serve_forever, daemon=True)
+    thread.start()
+    yield local_broker
+    local_broker.shutdown()
+    local_broker.server_close()
+
+
+class TestMqttLocalBroker:
+    """Local Message Broker Testing."""
+
+    @staticmethod
+    def _client(broker: MqttLocalBroker, messages: queue.Queue | None = None) -> mqtt.Client:
+        """Return a connected paho client.
+
+        Args:
+            broker: The running local broker.
+            messages: A queue to receive the messages delivered to the client.
+
+        Returns:
+            The connected client.
+        """
+        connected = threading.Event()
+        subscribed = threading.Event()
+        client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id='', clean_session=True)
+        client.on_connect = lambda *_: connected.set()
+        client.on_subscribe = lambda *_: subscribed.set()
+        if messages is not None:
+            client.on_message = lambda _client, _userdata, message: messages.put(message)
+        client.connect(*broker.server_address)
+        client.loop_start()
+        assert connected.wait(5), 'client did not connect'
+        client.subscribed = subscribed  # type: ignore
+        return client
+
+    @pytest.mark.parametrize('qos', [0, 1, 2])
+    def test_publish_subscribe(self, broker: MqttLocalBroker, qos: int):
+        """Test that a message published at each QoS is delivered to the subscriber.
+
+        Args:
+            broker: Pytest fixture that starts the local broker.
+            qos: The QoS used to subscribe and publish.
+        """
+        messages = queue.Queue()
+        subscriber = self._client(broker, messages)
+        publisher = self._client(broker)
+        try:
+            subscriber.subscribe('svc/+/server', qos=qos)
+            assert subscriber.subscribed.wait(5), 'subscription was not acknowledged'  # type: ignore
+
+            info = publisher.publish('svc/app/server', f'message-qos-{qos}', qos=qos)
+            info.wait_for_publish(5)
+            assert info.is_published()
+
+            message = messages.get(timeout=5)
+            assert message.topic == 'svc/app/server'
+            assert message.payload == f'message-qos-{qos}'.encode()
+        finally:
+            for client in (subscriber, publisher):
+                client.disconnect()
+                client.loop_stop()
+
+    def test_unsubscribe(self, broker: MqttLocalBroker):
+        """Test that a message is not delivered after the client unsubscribes.
+
+        Args:
+            broker: Pytest fixture that starts the local broker.
+        """
+        messages = queue.Queue()
+        subscriber = self._client(broker, messages)
+        unsubscribed = threading.Event()
+        subscriber.on_unsubscribe = lambda *_: unsubscribed.set()
+        try:
+            subscriber.subscribe('svc/client')
+            assert subscriber.subscribed.wait(5)  # type: ignore
+            subscriber.unsubscribe('svc/client')
+            assert unsubscribed.wait(5)
+
+            broker.publish('svc/client', b'not-delivered')
+            with pytest.raises(queue.Empty):
+                messages.get(timeout=0.5)
+        finally:
+            subscriber.disconnect()
+            subscriber.loop_stop()
@@ -0,0 +1,126 @@
+"""MQTT Message Broker Testing"""
+
+# standard library
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex_cli.message_broker.mqtt_message_broker import MqttMessageBroker
+
+
+@pytest.fixture
+def message_broker() -> MqttMessageBroker:
+    """Return a message broker that is not connected."""
+    return MqttMessageBroker('127.0.0.1', 1883, 5)
+
+
+class TestMqttMessageBroker:
+    """MQTT Message Broker Testing."""
+
+    @staticmethod
+    def _logger(name: str, handler_level: int) -> logging.Logger:
+        """Return a TRACE level logger with a single handler at the provided level.
+
+        Args:
+            name: The logger name.
+            handler_level: The level of the logger handler.
+        """
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.setLevel(logging.TRACE)  # type: ignore
+        handler = logging.NullHandler()
+        handler.setLevel(handler_level)
+        logger.addHandler(handler)
+        return logger
+
+    @staticmethod
+    def _message(topic: str) -> SimpleNamespace:
+        """Return a message with a payload that records if it was decoded.
+
+        Args:
+            topic: The message topic.
+        """
+        return SimpleNamespace(topic=topic, payload=MagicMock())
+
+    def test_trace_disabled(self, message_broker: MqttMessageBroker):
+        """Test that the payload is not decoded when no handler emits TRACE records.
+
+        Args:
+            message_broker: Pytest fixture for the message broker.
+        """
+        message_broker.log = self._logger('test-trace-disabled', logging.DEBUG)  # type: ignore
+        message = self._message('topic')
+
+        message_broker.on_message(None, None, message)
+
+        assert message_broker.trace_enabled is False
+        message.payload.decode.assert_not_called()
+
+    def test_trace_enabled(self, message_broker: MqttMessageBroker):
+        """Test that the payload is decoded when a handler emits TRACE records.
+
+        Args:
+            message_broker: Pytest fixture for the message broker.
+        """
+        message_broker.log = self._logger('test-trace-enabled', logging.TRACE)  # type: ignore
+        message = self._message('topic')
+        message.payload.decode.return_value = '{"command": "Ready"}'
+
+        message_broker.on_message(None, None, message)
+
+        assert message_broker.trace_enabled is True
+        message.payload.decode.assert_called_once()
+
+    def test_on_message_wildcards(self, message_broker: MqttMessageBroker):
+        """Test that callbacks are called for the topics matching their restrictions.
+
+        Args:
+            message_broker: Pytest fixture for the message broker.
+        """
+        calls = []
+        message_broker.add_on_message_callback(lambda *_: calls.append('all'))
+        message_broker.add_on_message_callback(
+            lambda *_: calls.append('single'), topics=['svc/+/client']
+        )
+        message_broker.add_on_message_callback(lambda *_: calls.append('multi'), topics=['svc/#'])
+
+        message_broker.on_message(None, None, self._message('svc/app/client'))
+        assert calls == ['all', 'single', 'multi']
+
+        calls.clear()
+        message_broker.on_message(None, None, self._message('svc/app/server/extra'))
+        assert calls == ['all', 'multi']
+
+        calls.clear()
+        message_broker.on_message(None, None, self._message('other'))
+        assert calls == ['all']
+
+    def test_on_message_index(self, message_broker: MqttMessageBroker):
+        """Test that the topic index is reset when a callback is added or removed.
+
+        Args:
+            message_broker: Pytest fixture for the message broker.
+        """
+        calls = []
+
+        def callback(*_):
+            calls.append('callback')
+
+        message_broker.add_on_message_callback(callback, topics=['client'])
+        message_broker.on_message(None, None, self._message('client'))
+        assert message_broker._on_message_index == {'client': [callback]}  # noqa: SLF001
+
+        message_broker.add_on_message_callback(lambda *_: calls.append('added'))
+        assert message_broker._on_message_index == {}  # noqa: SLF001
+        message_broker.on_message(None, None, self._message('client'))
+        assert calls == ['callback', 'callback', 'added']
+
+        message_broker.remove_on_message_callback(callback, topics=['client'])
+        calls.clear()
+        message_broker.on_message(None, None, self._message('client'))
+        assert calls == ['added']
@@ -0,0 +1,148 @@
+"""Migrate Engine Testing"""
+
+# standard library
+from pathlib import Path
+
+# first-party
+from tcex_cli.cli.migrate.migrate_engine import FORWARD_REF_RULE, MigrateEngine
+
+# a subset of the "tcex migrate" code replacements, in the same order
+CODE_REPLACEMENTS = {
+    r'self\.playbook\.read\(self\.args\.(\w+)\)': {
+        'replacement': 'self.in_.\\1',
+        'in_file': ['app.py'],
+    },
+    r'self\.args': {
+        'replacement': 'self.in_',
+    },
+    r'Utils\(': {
+        'replacement': 'Util(',
+    },
+}
+
+APP_CODE = '\n'.join(
+    [
+        '"""App"""',
+        'from pathlib import Path',
+        '',
+        '',
+        'class App:',
+        "    def run(self, path: 'Path'):",
+        '        name = self.playbook.read(self.args.name)',
+        '        level = self.args.level',
+        '        utils = Utils()',
+        '        return name',
+        '',
+    ]
+)
+
+
+class TestMigrateEngine:
+    """Migrate Engine Testing."""
+
+    def test_scan_file(self, tmp_path: Path):
+        """Test that only the lines matched by a rule are replacement candidates.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        app_file = tmp_path / 'app.py'
+        app_file.write_text(APP_CODE, encoding='utf-8')
+
+        result = MigrateEngine(CODE_REPLACEMENTS).scan_file(app_file)
+
+        assert result.error is None
+        assert result.candidates == [6, 7, 8]
+        assert result.forward_refs == [("'Path'", 'Path')]
+        assert result.new_text is None
+
+    def test_scan_file_batch(self, tmp_path: Path):
+        """Test that batch mode applies every replacement and counts the hits per rule.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        app_file = tmp_path / 'app.py'
+        app_file.write_text(APP_CODE, encoding='utf-8')
+
+        result = MigrateEngine(CODE_REPLACEMENTS).scan_file(app_file, batch=True)
+
+        assert result.is_modified
+        assert result.new_text is not None
+        new_lines = result.new_text.splitlines()
+        assert new_lines[5] == '    def run(self, path: Path):'
+        assert new_lines[6] == '        name = self.in_.name'
+        assert new_lines[7] == '        level = self.in_.level'
+        assert new_lines[8] == '        utils = Util()'
+        assert result.hits == {
+            r'self\.playbook\.read\(self\.args\.(\w+)\)': 1,
+            r'self\.args': 1,
+            r'Utils\(': 1,
+            FORWARD_REF_RULE: 1,
+        }
+
+    def test_scan_file_in_file(self, tmp_path: Path):
+        """Test that a rule limited to app.py is not applied to other files.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        other_file = tmp_path / 'other.py'
+        other_file.write_text('name = self.playbook.read(self.args.name)\n', encoding='utf-8')
+
+        result = MigrateEngine(CODE_REPLACEMENTS).scan_file(other_file, batch=True)
+
+        assert result.new_text == 'name = self.playbook.read(self.in_.name)\n'
+        assert result.hits == {r'self\.args': 1}
+
+    def test_scan_file_syntax_error(self, tmp_path: Path):
+        """Test that a file that can not be parsed is reported with an error.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        app_file = tmp_path / 'app.py'
+        app_file.write_text('def run(self:\n', encoding='utf-8')
+
+        result = MigrateEngine(CODE_REPLACEMENTS).scan_file(app_file)
+
+        assert result.error is not None
+        assert not result.is_modified
+
+    def test_scan_file_syntax_error_batch(self, tmp_path: Path):
+        """Test that the code rules are applied to a file that can not be parsed in batch mode.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        app_file = tmp_path / 'app.py'
+        app_file.write_text(
+            "def run(self, path: 'Path':\n    level = self.args.level\n", encoding='utf-8'
+        )
+
+        result = MigrateEngine(CODE_REPLACEMENTS).scan_file(app_file, batch=True)
+
+        assert result.error is not None
+        assert result.forward_refs == []
+        assert result.is_modified
+        assert result.new_text == "def run(self, path: 'Path':\n    level = self.in_.level\n"
+        assert result.hits == {r'self\.args': 1}
+
+    def test_scan_pool(self, tmp_path: Path):
+        """Test that scanning in the process pool returns the same results in the same order.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        files = []
+        for index in range(8):
+            app_file = tmp_path / f'module_{index}.py'
+            app_file.write_text(APP_CODE if index % 2 else '"""Module"""\n', encoding='utf-8')
+            files.append(app_file)
+
+        serial = MigrateEngine(CODE_REPLACEMENTS, jobs=1).scan(files, batch=True)
+        engine = MigrateEngine(CODE_REPLACEMENTS, jobs=2)
+        engine.pool_threshold = 1
+
+        assert engine.scan(files, batch=True) == serial
+        assert [r.is_modified for r in serial] == [bool(i % 2) for i in range(8)]
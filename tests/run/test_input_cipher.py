@@ -0,0 +1,48 @@
+"""Input Cipher Testing"""
+
+# third-party
+import pyaes
+import pytest
+
+# first-party
+from tcex_cli.cli.run import input_cipher
+from tcex_cli.cli.run.input_cipher import (
+    encrypt_aes_cbc,
+    encrypt_aes_cbc_cryptography,
+    encrypt_aes_cbc_pyaes,
+    generate_key,
+)
+
+
+class TestInputCipher:
+    """Input Cipher Testing."""
+
+    @pytest.mark.parametrize('size', [0, 1, 15, 16, 17, 1_000, 65_536])
+    def test_backends_match(self, size: int):
+        """Test that the cryptography and pyaes backends produce the same ciphertext.
+
+        Args:
+            size: The plaintext size, covering the PKCS7 padding block boundaries.
+        """
+        key = generate_key()
+        plaintext = ('{"tc_token": "é"}' * size)[:size]
+
+        ciphertext = encrypt_aes_cbc_cryptography(key, plaintext)
+
+        assert ciphertext == encrypt_aes_cbc_pyaes(key, plaintext)
+        decrypter = pyaes.Decrypter(pyaes.AESModeOfOperationCBC(key.encode(), iv=b'\0' * 16))
+        assert (decrypter.feed(ciphertext) + decrypter.feed()).decode() == plaintext
+
+    def test_pyaes_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that pyaes is used when cryptography is not installed.
+
+        Args:
+            monkeypatch: Pytest fixture for patching the cryptography import.
+        """
+        key = generate_key()
+        expected = encrypt_aes_cbc(key, 'inputs')
+        monkeypatch.setattr(input_cipher, 'Cipher', None)
+
+        assert encrypt_aes_cbc(key, 'inputs') == expected
+        with pytest.raises(RuntimeError, match='cryptography'):
+            encrypt_aes_cbc_cryptography(key, 'inputs')
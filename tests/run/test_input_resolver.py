@@ -0,0 +1,115 @@
+"""Input Resolver Testing"""
+
+# standard library
+import json
+from pathlib import Path
+
+# third-party
+import pytest
+
+# first-party
+from tcex_cli.cli.run.input_resolver import InputResolver
+from tcex_cli.cli.run.launch_abc import LaunchABC
+
+
+class LaunchTest(LaunchABC):
+    """Launch class without a redis server, for testing the input substitution."""
+
+    def __init__(self, config_json: Path):
+        """Initialize instance properties."""
+        self.config_json = config_json
+
+    @property
+    def model(self):
+        """Return the App inputs."""
+
+
+class TestInputResolver:
+    """Input Resolver Testing."""
+
+    def test_substitute(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        """Test that env, file and registered references are substituted.
+
+        Args:
+            monkeypatch: Pytest fixture for modifying environment variables.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        monkeypatch.setenv('TCEX_TEST_API_KEY', 'secret-key')
+        pem_file = tmp_path / 'key.pem'
+        pem_file.write_text('-----BEGIN KEY-----\n"abc"\n-----END KEY-----\n', encoding='utf-8')
+
+        resolver = InputResolver()
+        resolver.register('trigger', lambda name: f'trigger-{name}')
+        data = json.dumps(
+            {
+                'api_key': '${env.TCEX_TEST_API_KEY}',
+                'pem': f'${{file.{pem_file}}}',
+                'trigger': 'id-${trigger.id}',
+            }
+        )
+
+        assert json.loads(resolver.substitute(data)) == {
+            'api_key': 'secret-key',
+            'pem': '-----BEGIN KEY-----\n"abc"\n-----END KEY-----',
+            'trigger': 'id-trigger-id',
+        }
+        assert resolver.cacheable is True
+        assert pem_file in resolver.files
+
+    def test_substitute_unresolved(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        """Test that unknown namespaces and references that do not resolve are unchanged.
+
+        Args:
+            monkeypatch: Pytest fixture for modifying environment variables.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        monkeypatch.delenv('TCEX_TEST_MISSING', raising=False)
+        data = f'${{env.TCEX_TEST_MISSING}} ${{file.{tmp_path}/missing}} ${{unknown.name}}'
+
+        assert InputResolver().substitute(data) == data
+
+    def test_substitute_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        """Test that the substituted inputs are cached until a dependency changes.
+
+        Args:
+            monkeypatch: Pytest fixture for modifying environment variables.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        monkeypatch.setattr(LaunchABC, '_inputs_cache', {})
+        monkeypatch.setenv('TCEX_TEST_API_KEY', 'one')
+        secret_file = tmp_path / 'secret.txt'
+        secret_file.write_text('first', encoding='utf-8')
+        config_json = tmp_path / 'app_inputs.json'
+        config_json.write_text(
+            json.dumps(
+                {'api_key': '${env.TCEX_TEST_API_KEY}', 'secret': f'${{file.{secret_file}}}'}
+            ),
+            encoding='utf-8',
+        )
+
+        calls = []
+        substitute = InputResolver.substitute
+
+        def _substitute(resolver: InputResolver, data: str) -> str:
+            calls.append(data)
+            return substitute(resolver, data)
+
+        monkeypatch.setattr(InputResolver, 'substitute', _substitute)
+
+        # the second launch uses the substitution cached by the first
+        first = LaunchTest(config_json)._substitute_variables()  # noqa: SLF001
+        assert LaunchTest(config_json)._substitute_variables() == first  # noqa: SLF001
+        assert json.loads(first) == {'api_key': 'one', 'secret': 'first'}
+        assert len(calls) == 1
+
+        # a change to a file dependency invalidates the cache
+        secret_file.write_text('second value', encoding='utf-8')
+        data = json.loads(LaunchTest(config_json)._substitute_variables())  # noqa: SLF001
+        assert data == {'api_key': 'one', 'secret': 'second value'}
+        assert len(calls) == 2  # noqa: PLR2004
+
+        # a change to the environment invalidates the cache
+        monkeypatch.setenv('TCEX_TEST_API_KEY', 'two')
+        data = json.loads(LaunchTest(config_json)._substitute_variables())  # noqa: SLF001
+        assert data == {'api_key': 'two', 'secret': 'second value'}
+        assert len(calls) == 3  # noqa: PLR2004
@@ -0,0 +1,143 @@
+"""Launch Service Live Data Testing"""
+
+# standard library
+import os
+from collections import deque
+from threading import Event, Lock
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex_cli.cli.run import launch_service_common_abc
+from tcex_cli.cli.run.launch_service_custom_trigger import LaunchServiceCustomTrigger
+
+
+class StopRender(Exception):
+    """Raised to stop the live data render loop."""
+
+
+class TestLaunchServiceLiveData:
+    """Launch Service Live Data Testing."""
+
+    layout: dict[str, MagicMock]
+    sections: dict[str, MagicMock]
+    sleeps: list[float]
+
+    @pytest.fixture
+    def launcher(self) -> LaunchServiceCustomTrigger:
+        """Return a trigger launcher with the live data properties."""
+        # the message broker and App are not required, so __init__ is not called
+        launcher = LaunchServiceCustomTrigger.__new__(LaunchServiceCustomTrigger)
+        launcher.event = Event()
+        launcher.live_data_dirty = set()
+        launcher.live_data_lock = Lock()
+        launcher.log = MagicMock()
+
+        self.layout = {name: MagicMock() for name in ['commands', 'main']}
+        self.sections = {name: MagicMock(return_value=name) for name in ['commands', 'main']}
+        self.sleeps = []
+        return launcher
+
+    def _render(self, launcher: LaunchServiceCustomTrigger, monkeypatch: pytest.MonkeyPatch, frame):
+        """Run the render loop until the frame callback stops it.
+
+        Args:
+            launcher: The launcher to render the live data for.
+            monkeypatch: Pytest fixture for patching.
+            frame: Called (instead of sleeping) after each frame with the frame number.
+        """
+
+        def sleep(seconds: float):
+            self.sleeps.append(seconds)
+            frame(len(self.sleeps))
+
+        monkeypatch.setattr(launch_service_common_abc.time, 'sleep', sleep)
+        with pytest.raises(StopRender):
+            launcher.live_data_render(self.layout, self.sections)  # type: ignore
+
+    def test_live_data_changed(self, launcher: LaunchServiceCustomTrigger):
+        """Test that changed sections are tracked and the display thread is woken.
+
+        Args:
+            launcher: Pytest fixture for the launcher.
+        """
+        launcher.live_data_changed('commands')
+        launcher.live_data_changed('commands', 'main')
+
+        assert launcher.live_data_dirty == {'commands', 'main'}
+        assert launcher.event.is_set()
+
+    def test_render_dirty_sections(
+        self, launcher: LaunchServiceCustomTrigger, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that only the changed sections are rendered and the changes are cleared.
+
+        Args:
+            launcher: Pytest fixture for the launcher.
+            monkeypatch: Pytest fixture for patching.
+        """
+        # unknown sections are ignored
+        launcher.live_data_changed('commands', 'unknown')
+
+        def frame(_: int):
+            raise StopRender
+
+        self._render(launcher, monkeypatch, frame)
+
+        self.sections['commands'].assert_called_once_with()
+        self.layout['commands'].update.assert_called_once_with('commands')
+        self.sections['main'].assert_not_called()
+        self.layout['main'].update.assert_not_called()
+        assert launcher.live_data_dirty == set()
+        assert not launcher.event.is_set()
+
+    def test_render_throttle(
+        self, launcher: LaunchServiceCustomTrigger, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that events during a frame interval are coalesced into a single frame.
+
+        Args:
+            launcher: Pytest fixture for the launcher.
+            monkeypatch: Pytest fixture for patching.
+        """
+        launcher.live_data_changed('commands')
+
+        def frame(number: int):
+            if number == 1:
+                # a burst of events received while sleeping after the first frame
+                for _ in range(10):
+                    launcher.live_data_changed('commands')
+                launcher.live_data_changed('main')
+                return
+            raise StopRender
+
+        self._render(launcher, monkeypatch, frame)
+
+        assert self.sleeps == [1 / launcher.live_data_max_fps] * 2
+        assert self.sleeps[0] == 0.25  # noqa: PLR2004
+        assert self.sections['commands'].call_count == 2  # noqa: PLR2004
+        self.sections['main'].assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        ('lines', 'expected'), [(3, [9, 8, 7]), (0, [9]), (50, list(range(9, -1, -1)))]
+    )
+    def test_live_data_rows(self, lines: int, expected: list[int], monkeypatch: pytest.MonkeyPatch):
+        """Test that the rows are capped to the terminal height, newest first.
+
+        Args:
+            lines: The terminal height.
+            expected: The expected rows.
+            monkeypatch: Pytest fixture for patching.
+        """
+        monkeypatch.setattr(
+            launch_service_common_abc.shutil,
+            'get_terminal_size',
+            lambda: os.terminal_size((80, lines)),
+        )
+        data = deque(range(10), maxlen=LaunchServiceCustomTrigger.live_data_history)
+
+        assert LaunchServiceCustomTrigger.live_data_rows(data) == expected
+        # the data is not modified
+        assert list(data) == list(range(10))
@@ -0,0 +1,101 @@
+"""Playbook Create Testing"""
+
+# standard library
+import base64
+import json
+from pathlib import Path
+
+# third-party
+import fakeredis
+import pytest
+
+# first-party
+from tcex_cli.cli.run.playbook_create import PlaybookCreate
+
+
+class TestPlaybookCreate:
+    """Playbook Create Testing."""
+
+    context = 'test-context'
+
+    @pytest.fixture
+    def playbook(self) -> PlaybookCreate:
+        """Return a playbook create instance backed by a fake redis server."""
+        return PlaybookCreate(fakeredis.FakeRedis(), self.context)
+
+    def _staged(self, playbook: PlaybookCreate) -> dict[str, object]:
+        """Return the deserialized values staged in the context.
+
+        Args:
+            playbook: The playbook create instance.
+        """
+        data = playbook.key_value_store.hgetall(self.context)
+        return {k.decode(): json.loads(v) for k, v in data.items()}  # type: ignore
+
+    def test_bulk(self, playbook: PlaybookCreate):
+        """Test that all values are staged with their transformed value.
+
+        Args:
+            playbook: Pytest fixture for the playbook create instance.
+        """
+        data = {
+            '#App:1:binary!Binary': base64.b64encode(b'binary').decode(),
+            '#App:1:kv!KeyValue': {'key': 'one', 'value': '1'},
+            '#App:1:string!String': True,
+            '#App:1:string_array!StringArray': ['one', 2, False],
+            '#App:1:tc_entity!TCEntity': {'id': '1', 'type': 'Address', 'value': '1.1.1.1'},
+        }
+
+        assert playbook.bulk(data) == len(data)
+        assert self._staged(playbook) == {
+            **data,
+            '#App:1:string!String': 'true',
+            '#App:1:string_array!StringArray': ['one', '2', 'false'],
+        }
+
+    def test_bulk_empty_value(self, playbook: PlaybookCreate):
+        """Test that empty values are not staged.
+
+        Args:
+            playbook: Pytest fixture for the playbook create instance.
+        """
+        assert playbook.bulk({'#App:1:empty!String': '', '#App:1:string!String': 'one'}) == 1
+        assert self._staged(playbook) == {'#App:1:string!String': 'one'}
+
+    def test_bulk_invalid_value(self, playbook: PlaybookCreate):
+        """Test that an invalid value fails the stage without writing any value.
+
+        Args:
+            playbook: Pytest fixture for the playbook create instance.
+        """
+        data = {
+            '#App:1:string!String': 'one',
+            '#App:1:tc_entity!TCEntity': {'type': 'Address'},
+        }
+
+        with pytest.raises(RuntimeError, match='TCEntity'):
+            playbook.bulk(data)
+        assert self._staged(playbook) == {}
+
+    def test_binary_file(self, playbook: PlaybookCreate, tmp_path: Path):
+        """Test that a Binary value is read from a file and base64 encoded.
+
+        Args:
+            playbook: Pytest fixture for the playbook create instance.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        binary_file = tmp_path / 'data.bin'
+        binary_file.write_bytes(bytes(range(256)) * 1_000)
+
+        value = playbook.stagger('#App:1:binary!Binary', f'file:{binary_file}').dump()
+
+        assert value == json.dumps(base64.b64encode(binary_file.read_bytes()).decode())
+
+    def test_stagger_invalid_type(self, playbook: PlaybookCreate):
+        """Test that an unknown variable type is rejected.
+
+        Args:
+            playbook: Pytest fixture for the playbook create instance.
+        """
+        with pytest.raises(RuntimeError, match='Invalid variable type'):
+            playbook.stagger('#App:1:unknown!Unknown', 'one')
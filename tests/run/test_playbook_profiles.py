@@ -0,0 +1,173 @@
+"""Playbook Profiles Testing"""
+
+# standard library
+import json
+import subprocess  # nosec
+import threading
+from pathlib import Path
+
+# third-party
+import fakeredis
+import pytest
+
+# first-party
+from tcex_cli.cli.run.model.playbook_profile_result_model import PlaybookProfileResultModel
+from tcex_cli.cli.run.playbook_profiles import PlaybookProfiles
+
+STAGED_KEY = '#App:1:staged!String'
+
+
+class TestPlaybookProfiles:
+    """Playbook Profiles Testing."""
+
+    barrier: threading.Barrier | None
+    configs: list[dict]
+    redis_client: fakeredis.FakeRedis
+
+    @pytest.fixture(autouse=True)
+    def runner(self, monkeypatch: pytest.MonkeyPatch):
+        """Replace the "tcex run" subprocess with a runner that writes the App outputs.
+
+        The runner writes a "name" output (and the staged variables) to the run context, exiting
+        with the "exit_code" input of the profile. If a barrier is set each run waits on it.
+
+        Args:
+            monkeypatch: Pytest fixture for patching.
+        """
+        self.barrier = None
+        self.configs = []
+        self.redis_client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+        lock = threading.Lock()
+
+        def run(args: list, stdout, **_) -> subprocess.CompletedProcess:
+            if self.barrier is not None:
+                self.barrier.wait()
+
+            config = json.loads(Path(args[-1]).read_text(encoding='utf-8'))
+            with lock:
+                self.configs.append(config)
+
+            inputs = config['inputs']
+            context = inputs['tc_playbook_kvstore_context']
+            for key, value in config.get('stage', {}).get('kvstore', {}).items():
+                self.redis_client.hset(context, key, json.dumps(value))
+            self.redis_client.hset(context, '#App:1:name!String', json.dumps(inputs['name']))
+
+            stdout.write(f'run {inputs["name"]}\n'.encode())
+            return subprocess.CompletedProcess(args, inputs.get('exit_code', 0))
+
+        monkeypatch.setattr('tcex_cli.cli.run.playbook_profiles.subprocess.run', run)
+
+    def _profiles_dir(self, tmp_path: Path, profiles: dict[str, dict]) -> Path:
+        """Write the profiles (and baselines) to a profiles directory.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+            profiles: A mapping of profile file name to the profile contents.
+        """
+        profiles_dir = tmp_path / 'profiles'
+        profiles_dir.mkdir()
+        for name, data in profiles.items():
+            (profiles_dir / name).write_text(json.dumps(data), encoding='utf-8')
+        return profiles_dir
+
+    def test_fan_out(self, tmp_path: Path):
+        """Test that every profile (but not the baselines) is run concurrently.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        profiles_dir = self._profiles_dir(
+            tmp_path,
+            {
+                'one.json': {'inputs': {'name': 'one'}},
+                'one.outputs.json': {'#App:1:name!String': 'one'},
+                'three.json': {'inputs': {'name': 'three'}},
+                'two.json': {'inputs': {'name': 'two'}},
+            },
+        )
+        playbook_profiles = PlaybookProfiles(
+            profiles_dir, self.redis_client, jobs=3, out_path=tmp_path / 'out'
+        )
+        profiles = [p.name for p in playbook_profiles.profiles]
+        assert profiles == ['one.json', 'three.json', 'two.json']
+
+        # each run waits for the others, so the profiles must run concurrently
+        self.barrier = threading.Barrier(3, timeout=10)
+        results = playbook_profiles.run()
+
+        # the results are returned in profile order
+        assert [r.name for r in results] == ['one', 'three', 'two']
+        assert len(self.configs) == 3  # noqa: PLR2004
+        for result in results:
+            assert Path(result.log_file).read_text() == f'run {result.name}\n'
+
+    def test_context_isolation(self, tmp_path: Path):
+        """Test that each run has its own context and paths, removed after the outputs are read.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        profiles_dir = self._profiles_dir(
+            tmp_path,
+            {
+                'one.json': {'inputs': {'name': 'one'}, 'stage': {'kvstore': {STAGED_KEY: 'a'}}},
+                'two.json': {'inputs': {'name': 'two'}, 'stage': {'kvstore': {STAGED_KEY: 'b'}}},
+            },
+        )
+        out_path = tmp_path / 'out'
+        results = PlaybookProfiles(profiles_dir, self.redis_client, jobs=2, out_path=out_path).run()
+
+        contexts = {c['inputs']['tc_playbook_kvstore_context'] for c in self.configs}
+        assert len(contexts) == 2  # noqa: PLR2004
+        assert {c['inputs']['tc_out_path'] for c in self.configs} == {
+            str((out_path / 'one').resolve()),
+            str((out_path / 'two').resolve()),
+        }
+        # the run contexts are removed from the shared redis server
+        assert self.redis_client.keys() == []
+
+        # the staged variables are not part of the outputs
+        for result in results:
+            outputs = json.loads((out_path / result.name / 'outputs.json').read_text())
+            assert outputs == {'#App:1:name!String': result.name}
+            assert result.output_count == 1
+
+    def test_result_aggregation(self, tmp_path: Path):
+        """Test that the results are compared to the baselines and the status is aggregated.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        profiles_dir = self._profiles_dir(
+            tmp_path,
+            {
+                'changed.json': {'inputs': {'name': 'changed'}},
+                'changed.outputs.json': {
+                    '#App:1:name!String': 'other',
+                    '#App:1:missing!String': 'missing',
+                },
+                'failed.json': {'inputs': {'exit_code': 1, 'name': 'failed'}},
+                'match.json': {'inputs': {'name': 'match'}},
+                'match.outputs.json': {'#App:1:name!String': 'match'},
+                'no_baseline.json': {'inputs': {'name': 'no_baseline'}},
+            },
+        )
+        results: dict[str, PlaybookProfileResultModel] = {
+            r.name: r
+            for r in PlaybookProfiles(
+                profiles_dir, self.redis_client, jobs=2, out_path=tmp_path / 'out'
+            ).run()
+        }
+
+        assert results['changed'].changed == ['#App:1:name!String']
+        assert results['changed'].missing == ['#App:1:missing!String']
+        assert results['changed'].diff_value == '+0 -1 ~1'
+        assert results['changed'].status is False
+        assert results['failed'].exit_code == 1
+        assert results['failed'].diff_value == 'no baseline'
+        assert results['failed'].status is False
+        assert results['match'].diff_value == 'match'
+        assert results['match'].status is True
+        assert results['no_baseline'].has_baseline is False
+        assert results['no_baseline'].status is True
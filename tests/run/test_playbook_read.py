@@ -0,0 +1,131 @@
+"""Playbook Read Testing"""
+
+# standard library
+import json
+from unittest.mock import MagicMock
+
+# third-party
+import fakeredis
+import pytest
+
+# first-party
+from tcex_cli.cli.run.playbook_read import OutputData, PlaybookRead
+
+
+class TestOutputData:
+    """Output Data Testing."""
+
+    def test_lazy_decode(self):
+        """Test that values are decoded on first access and cached."""
+        raw_value = MagicMock(spec=bytes)
+        output_data = OutputData({'#App:1:string!String': b'"one"', '#App:1:raw!String': raw_value})
+
+        # iterating the keys does not decode any values
+        assert list(output_data) == ['#App:1:string!String', '#App:1:raw!String']
+        assert output_data._cache == {}  # noqa: SLF001
+
+        assert output_data['#App:1:string!String'] == 'one'
+        assert output_data._cache == {'#App:1:string!String': 'one'}  # noqa: SLF001
+        raw_value.decode.assert_not_called()
+
+    def test_non_json_value(self):
+        """Test that a value that is not JSON is returned as a string."""
+        output_data = OutputData({'#App:1:string!String': b'not json \xff'})
+
+        assert output_data['#App:1:string!String'] == 'not json �'
+
+    def test_nbytes(self):
+        """Test that nbytes is the size of the raw values and does not decode them."""
+        output_data = OutputData({'#App:1:one!String': b'"one"', '#App:1:two!String': b'"two!"'})
+
+        assert output_data.nbytes == 11  # noqa: PLR2004
+        assert len(output_data) == 2  # noqa: PLR2004
+        assert output_data._cache == {}  # noqa: SLF001
+
+
+class TestPlaybookRead:
+    """Playbook Read Testing."""
+
+    context = 'test-context'
+
+    @pytest.fixture
+    def redis_client(self) -> fakeredis.FakeRedis:
+        """Return a fake redis client with string and binary outputs in the context."""
+        client = fakeredis.FakeRedis()
+        client.hset(
+            self.context,
+            mapping={
+                '#App:1:one!String': json.dumps('one'),
+                '#App:1:two!String': json.dumps('two'),
+                '#App:1:binary!Binary': json.dumps('YmluYXJ5'),
+                '#App:1:staged!String': json.dumps('staged'),
+            },
+        )
+        return client
+
+    def test_output_data_hgetall(self, redis_client: fakeredis.FakeRedis):
+        """Test that a context below the scan threshold is read with a single HGETALL.
+
+        Args:
+            redis_client: Pytest fixture for the fake redis client.
+        """
+        playbook = PlaybookRead(redis_client, self.context)
+        spy = MagicMock(wraps=redis_client)
+        playbook.key_value_store = spy
+
+        output_data = playbook.output_data(exclude={'#App:1:staged!String'})
+
+        assert dict(output_data) == {
+            '#App:1:one!String': 'one',
+            '#App:1:two!String': 'two',
+            '#App:1:binary!Binary': 'YmluYXJ5',
+        }
+        spy.hgetall.assert_called_once_with(self.context)
+        spy.hscan_iter.assert_not_called()
+
+    def test_output_data_hscan(self, redis_client: fakeredis.FakeRedis):
+        """Test that a context above the scan threshold is read with HSCAN.
+
+        Args:
+            redis_client: Pytest fixture for the fake redis client.
+        """
+        playbook = PlaybookRead(redis_client, self.context)
+        playbook.scan_threshold = 2
+        spy = MagicMock(wraps=redis_client)
+        playbook.key_value_store = spy
+
+        output_data = playbook.output_data()
+
+        assert len(output_data) == 4  # noqa: PLR2004
+        spy.hgetall.assert_not_called()
+        spy.hscan_iter.assert_called_once_with(
+            self.context, match=None, count=PlaybookRead.scan_count
+        )
+
+    def test_output_data_pattern(self, redis_client: fakeredis.FakeRedis):
+        """Test that an output pattern (--output-pattern) is matched with HSCAN MATCH.
+
+        Args:
+            redis_client: Pytest fixture for the fake redis client.
+        """
+        playbook = PlaybookRead(redis_client, self.context)
+        spy = MagicMock(wraps=redis_client)
+        playbook.key_value_store = spy
+
+        output_data = playbook.output_data(
+            pattern='#App:*:*!String', exclude={'#App:1:staged!String'}
+        )
+
+        assert dict(output_data) == {'#App:1:one!String': 'one', '#App:1:two!String': 'two'}
+        spy.hlen.assert_not_called()
+        spy.hgetall.assert_not_called()
+        spy.hscan_iter.assert_called_once_with(
+            self.context, match='#App:*:*!String', count=PlaybookRead.scan_count
+        )
+
+    def test_output_data_empty_context(self):
+        """Test that a context without outputs returns empty output data."""
+        output_data = PlaybookRead(fakeredis.FakeRedis(), self.context).output_data()
+
+        assert len(output_data) == 0
+        assert output_data.nbytes == 0
@@ -0,0 +1,101 @@
+"""Service Metrics Testing"""
+
+# standard library
+import json
+from pathlib import Path
+
+# first-party
+from tcex_cli.cli.run.service_metrics import ServiceMetrics
+
+
+class TestServiceMetrics:
+    """Service Metrics Testing."""
+
+    def test_jsonl_output(self, tmp_path: Path):
+        """Test that a request and a trigger event are appended to the JSONL file.
+
+        Args:
+            tmp_path: Pytest temporary directory.
+        """
+        metrics_file = tmp_path / 'metrics' / 'metrics.jsonl'
+        metrics = ServiceMetrics(metrics_file=metrics_file)
+        metrics.request_start('key-1', 'RunService', body_size=10, timestamp=1.0, method='GET')
+        metrics.request_end('key-1', 200, body_size=25, timestamp=1.25)
+        # a response without a matching request is not recorded
+        metrics.request_end('key-2', 200, timestamp=2.0)
+        metrics.trigger_event('1', 'session-1', output_bytes=5)
+        metrics.close()
+
+        records = [json.loads(line) for line in metrics_file.read_text().splitlines()]
+        assert len(records) == 2  # noqa: PLR2004
+
+        request, trigger_event = records
+        assert request['type'] == 'request'
+        assert request['command'] == 'RunService'
+        assert request['method'] == 'GET'
+        assert request['latency_ms'] == 250  # noqa: PLR2004
+        assert request['request_bytes'] == 10  # noqa: PLR2004
+        assert request['response_bytes'] == 25  # noqa: PLR2004
+        assert request['status_code'] == 200  # noqa: PLR2004
+        assert '_started' not in request
+        assert 'timestamp' in request
+
+        assert trigger_event['type'] == 'trigger_event'
+        assert trigger_event['trigger_id'] == '1'
+        assert trigger_event['output_bytes'] == 5  # noqa: PLR2004
+
+    def test_prometheus_output(self, tmp_path: Path):
+        """Test that the aggregates are written to a .prom file on close.
+
+        Args:
+            tmp_path: Pytest temporary directory.
+        """
+        metrics_file = tmp_path / 'metrics' / 'metrics.prom'
+        metrics = ServiceMetrics(metrics_file=metrics_file)
+        metrics.record_message('server', 'RunService', 100)
+        metrics.request_start('key-1', 'RunService', body_size=10, timestamp=1.0)
+        metrics.request_start('key-2', 'RunService', timestamp=1.0)
+        metrics.request_end('key-1', 200, body_size=25, timestamp=1.5)
+        metrics.close()
+
+        lines = metrics_file.read_text().splitlines()
+        assert not metrics_file.with_suffix('.prom.tmp').exists()
+        assert '# TYPE tcex_run_messages_total counter' in lines
+        assert 'tcex_run_messages_total{channel="server",command="RunService"} 1' in lines
+        assert 'tcex_run_message_bytes_total{channel="server"} 100' in lines
+        assert 'tcex_run_requests_total{command="RunService",status_code="200"} 1' in lines
+        assert 'tcex_run_request_bytes_total{direction="request"} 10' in lines
+        assert 'tcex_run_request_bytes_total{direction="response"} 25' in lines
+        assert 'tcex_run_requests_in_flight 1' in lines
+
+    def test_prometheus_summary_quantiles(self):
+        """Test that the latency summary has the quantile, sum and count samples in one family."""
+        metrics = ServiceMetrics()
+        for i in range(1, 101):
+            metrics.request_start(f'key-{i}', 'RunService', timestamp=0.0)
+            metrics.request_end(f'key-{i}', 200, timestamp=i / 100)
+
+        lines = metrics.prometheus_text().splitlines()
+        family = [line for line in lines if 'tcex_run_request_latency_seconds' in line]
+        assert family == [
+            '# HELP tcex_run_request_latency_seconds Request latency in seconds by command.',
+            '# TYPE tcex_run_request_latency_seconds summary',
+            'tcex_run_request_latency_seconds{command="RunService",quantile="0.5"} 0.505',
+            'tcex_run_request_latency_seconds{command="RunService",quantile="0.9"} 0.901',
+            'tcex_run_request_latency_seconds{command="RunService",quantile="0.99"} 0.9901',
+            'tcex_run_request_latency_seconds_count{command="RunService"} 100',
+            'tcex_run_request_latency_seconds_sum{command="RunService"} 50.5',
+        ]
+
+    def test_prometheus_summary_single_request(self):
+        """Test that every quantile of a single request is its latency."""
+        metrics = ServiceMetrics()
+        metrics.request_start('key-1', 'WebhookEvent', timestamp=1.0)
+        metrics.request_end('key-1', 200, timestamp=1.5)
+
+        lines = metrics.prometheus_text().splitlines()
+        for quantile in ('0.5', '0.9', '0.99'):
+            assert (
+                f'tcex_run_request_latency_seconds{{command="WebhookEvent",quantile="{quantile}"}} '
+                '0.5'
+            ) in lines
@@ -0,0 +1,168 @@
+"""Service Traffic Testing"""
+
+# standard library
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from threading import Event, Lock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# third-party
+import fakeredis
+import pytest
+
+# first-party
+from tcex_cli.cli.run.launch_service_custom_trigger import LaunchServiceCustomTrigger
+from tcex_cli.cli.run.service_traffic import TrafficRecorder, TrafficReplay
+
+
+class TestServiceTraffic:
+    """Service Traffic Testing."""
+
+    client_topic = 'client-topic'
+    server_topic = 'server-topic'
+
+    @pytest.fixture
+    def launcher(self) -> LaunchServiceCustomTrigger:
+        """Return a trigger launcher with a fake redis server and a mocked publish."""
+        # the message broker and App are not required, so __init__ is not called
+        launcher = LaunchServiceCustomTrigger.__new__(LaunchServiceCustomTrigger)
+        launcher.__dict__['model'] = SimpleNamespace(
+            inputs=SimpleNamespace(
+                tc_svc_client_topic=self.client_topic, tc_svc_server_topic=self.server_topic
+            )
+        )
+        launcher.__dict__['redis_client'] = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+        launcher.event = Event()
+        launcher.live_data_dirty = set()
+        launcher.live_data_lock = Lock()
+        launcher.log = logging.getLogger('tcex')  # type: ignore
+        launcher.message_data = deque()
+        launcher.metrics = None
+        launcher.publish = MagicMock()  # type: ignore
+        launcher.publish_create_config = MagicMock()  # type: ignore
+        launcher.recorder = None
+        launcher.replay = None
+        launcher.replay_thread = None
+        launcher.simulation = None
+        launcher.tc_token = MagicMock(return_value='new-token')  # type: ignore
+        launcher.traffic_replay_register = MagicMock()  # type: ignore
+        return launcher
+
+    def _message(self, channel: str, **msg) -> SimpleNamespace:
+        """Return a message broker message for the channel.
+
+        Args:
+            channel: The channel ("client" or "server") of the message.
+            **msg: The message payload.
+        """
+        topic = self.client_topic if channel == 'client' else self.server_topic
+        return SimpleNamespace(topic=topic, payload=json.dumps(msg).encode())
+
+    def _record(self, launcher: LaunchServiceCustomTrigger, record_file: Path):
+        """Record the traffic of a trigger App session.
+
+        Args:
+            launcher: The launcher to record the traffic with.
+            record_file: The traffic log file.
+        """
+        redis_client = launcher.redis_client
+        redis_client.hset('key-1', 'request.custom', b'{"name": "one"}')
+        redis_client.hset('key-1', 'response.body', b'ok')
+
+        launcher.recorder = TrafficRecorder(record_file)
+        for message in [
+            self._message('client', command='Heartbeat'),
+            self._message('client', command='Ready'),
+            self._message(
+                'server', apiToken='old-token', command='CreateConfig', config={}, triggerId=0
+            ),
+            self._message(
+                'server',
+                apiToken='old-token',
+                bodyVariable='request.custom',
+                command='WebhookEvent',
+                requestKey='key-1',
+                triggerId=0,
+            ),
+            self._message('client', command='Acknowledged', requestKey='key-1'),
+        ]:
+            launcher.traffic_on_message(None, None, message)
+        launcher.recorder.close()
+
+    def test_record(self, launcher: LaunchServiceCustomTrigger, tmp_path: Path):
+        """Test that the messages and their request/response bodies are recorded.
+
+        Args:
+            launcher: Pytest fixture for the launcher.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        record_file = tmp_path / 'traffic' / 'traffic.jsonl.gz'
+        self._record(launcher, record_file)
+
+        assert launcher.recorder is not None
+        assert launcher.recorder.count == 5  # noqa: PLR2004
+
+        # the timeline starts after the Ready message
+        records = TrafficReplay(record_file, speed=0).records
+        assert [r['c'] for r in records] == ['server', 'server', 'client']
+        assert records[1]['b'] == {'request.custom': b'{"name": "one"}'}
+        assert records[2]['b'] == {'response.body': b'ok'}
+
+    def test_replay(self, launcher: LaunchServiceCustomTrigger, tmp_path: Path):
+        """Test that the recorded server messages are replayed once the App is ready.
+
+        Args:
+            launcher: Pytest fixture for the launcher.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        record_file = tmp_path / 'traffic.jsonl.gz'
+        self._record(launcher, record_file)
+
+        # replay against an empty redis server
+        launcher.__dict__['redis_client'] = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+        launcher.recorder = None
+        launcher.replay = TrafficReplay(record_file, speed=0)
+
+        launcher.traffic_on_message(None, None, self._message('client', command='Ready'))
+        assert launcher.replay_thread is not None
+        launcher.replay_thread.join(timeout=10)
+
+        calls = launcher.publish.call_args_list  # type: ignore
+        published = [json.loads(c.args[0]) for c in calls]
+        assert [m['command'] for m in published] == ['CreateConfig', 'WebhookEvent']
+        # the recorded token is replaced with a new token
+        assert {m['apiToken'] for m in published} == {'new-token'}
+        assert {c.args[1] for c in calls} == {self.server_topic}
+        assert launcher.redis_client.hget('key-1', 'request.custom') == b'{"name": "one"}'
+        # the response body is written by the App during the replay
+        assert launcher.redis_client.hget('key-1', 'response.body') is None
+        launcher.traffic_replay_register.assert_called_once_with('key-1')  # type: ignore
+
+        # a second Ready message (e.g., the App restarted) does not start another replay
+        replay_thread = launcher.replay_thread
+        launcher.traffic_on_message(None, None, self._message('client', command='Ready'))
+        assert launcher.replay_thread is replay_thread
+
+    @pytest.mark.parametrize('replay', [False, True])
+    def test_ready_publish_create_config(
+        self, launcher: LaunchServiceCustomTrigger, replay: bool, tmp_path: Path
+    ):
+        """Test that the trigger configs are only created on Ready when not replaying.
+
+        Args:
+            launcher: Pytest fixture for the launcher.
+            replay: If True, a traffic log is replayed.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        if replay:
+            record_file = tmp_path / 'traffic.jsonl.gz'
+            self._record(launcher, record_file)
+            launcher.replay = TrafficReplay(record_file, speed=0)
+
+        launcher.process_client_channel(None, None, self._message('client', command='Ready'))
+
+        assert launcher.publish_create_config.called is not replay  # type: ignore
+        assert launcher.live_data_dirty == {'commands'}
@@ -0,0 +1,76 @@
+"""Trigger Simulation Testing"""
+
+# first-party
+from tcex_cli.cli.run.trigger_simulation import TriggerSimulation
+
+
+class TestTriggerSimulation:
+    """Trigger Simulation Testing."""
+
+    def test_configs(self):
+        """Test that a config is generated for each trigger id from the template."""
+        simulation = TriggerSimulation(3)
+        template = {'name': 'trigger-${trigger.id}', 'tags': ['${trigger.id}', 'static']}
+
+        assert simulation.configs(template) == [
+            {'name': 'trigger-0', 'tags': ['0', 'static']},
+            {'name': 'trigger-1', 'tags': ['1', 'static']},
+            {'name': 'trigger-2', 'tags': ['2', 'static']},
+        ]
+
+    def test_config_acknowledged(self):
+        """Test that the last CreateConfig acknowledgement is reported once."""
+        simulation = TriggerSimulation(2, event_count=1)
+
+        assert [simulation.config_acknowledged() for _ in range(3)] == [False, True, False]
+
+    def test_fire_event(self):
+        """Test that fire events are matched to the events sent, in order, per trigger."""
+        simulation = TriggerSimulation(2, event_count=2)
+        simulation.event_sent('0')
+        simulation.event_sent('0')
+
+        first = simulation.fire_event('0', 0.001)
+        second = simulation.fire_event('0', 0.002)
+
+        assert first is not None
+        assert first >= 0
+        assert second is not None
+        assert second >= 0
+        # a fire event without a matching webhook event has no latency
+        assert simulation.fire_event('0', 0.003) is None
+        assert simulation.fire_event('1', 0.004) is None
+        assert simulation.events_sent == {'0': 2}
+        assert len(simulation.fire_latency['0']) == 2  # noqa: PLR2004
+        assert simulation.readback_latency == {'0': [0.001, 0.002, 0.003], '1': [0.004]}
+
+    def test_summary(self):
+        """Test the per-trigger summary rows, sorted by the numeric trigger id."""
+        simulation = TriggerSimulation(11, event_count=1)
+        simulation.fire_latency['10'] = [0.001, 0.002, 0.003]
+        simulation.readback_latency['10'] = [0.001, 0.003, 0.002]
+        simulation.events_sent['10'] = 3
+        simulation.events_sent['2'] = 1
+
+        assert simulation.summary() == [
+            {
+                'trigger_id': '2',
+                'events_sent': '1',
+                'fire_events': '0',
+                'latency_min': '-',
+                'latency_avg': '-',
+                'latency_p95': '-',
+                'latency_max': '-',
+                'readback_avg': '-',
+            },
+            {
+                'trigger_id': '10',
+                'events_sent': '3',
+                'fire_events': '3',
+                'latency_min': '1.0',
+                'latency_avg': '2.0',
+                'latency_p95': '2.9',
+                'latency_max': '3.0',
+                'readback_avg': '2.0',
+            },
+        ]
@@ -0,0 +1,111 @@
+"""Web Server Testing"""
+
+# standard library
+import json
+import threading
+from collections.abc import Iterator
+from http import HTTPStatus
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+import requests
+
+# first-party
+from tcex_cli.cli.run.request_handler_api import RequestHandlerApi
+from tcex_cli.cli.run.web_server import WebServer
+
+
+class TestWebServer:
+    """Web Server Testing."""
+
+    published: threading.Event
+    server: WebServer
+
+    @pytest.fixture
+    def web_server(self) -> Iterator[WebServer]:
+        """Start a web server that allows a single request in flight.
+
+        Yields:
+            The running web server.
+        """
+        self.published = threading.Event()
+        inputs = SimpleNamespace(
+            api_service_host='127.0.0.1',
+            api_service_max_in_flight=1,
+            api_service_port=0,
+            api_service_request_timeout=10,
+            api_service_retry_after=7,
+            server_url='http://127.0.0.1',
+            tc_svc_client_topic='client-topic',
+            tc_svc_server_topic='server-topic',
+        )
+        redis_client = MagicMock()
+        redis_client.hget.return_value = None
+
+        self.server = WebServer(
+            inputs=inputs,  # type: ignore
+            message_broker=MagicMock(),
+            publish=lambda **_: self.published.set(),
+            redis_client=redis_client,
+            request_handler=RequestHandlerApi,
+            tc_token=lambda: 'token',
+        )
+        yield self.server
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _acknowledge(self, request_key: str):
+        """Send the App acknowledgement for the request.
+
+        Args:
+            request_key: The request key of the request to acknowledge.
+        """
+        message = {
+            'command': 'Acknowledged',
+            'headers': [],
+            'requestKey': request_key,
+            'statusCode': 200,
+            'type': 'RunService',
+        }
+        self.server.on_message(None, None, SimpleNamespace(payload=json.dumps(message)))  # type: ignore
+
+    def test_max_in_flight(self, web_server: WebServer):
+        """Test that a 503 response is sent once the max in-flight limit is reached.
+
+        Args:
+            web_server: Pytest fixture that starts the web server.
+        """
+        url = f'http://127.0.0.1:{web_server.server_address[1]}/data'
+        responses = {}
+
+        # the first request holds the only in-flight slot until it is acknowledged
+        first = threading.Thread(
+            target=lambda: responses.update(first=requests.get(url, timeout=10))
+        )
+        first.start()
+        assert self.published.wait(5), 'the first request was not published'
+
+        busy = requests.get(url, timeout=5)
+        assert busy.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert busy.headers['Retry-After'] == '7'
+
+        # acknowledge the first request, releasing the slot for the next request
+        with web_server.active_lock:
+            request_key = next(iter(web_server.active_requests))
+        self._acknowledge(request_key)
+        first.join(5)
+        assert responses['first'].status_code == HTTPStatus.OK
+
+        self.published.clear()
+        second = threading.Thread(
+            target=lambda: responses.update(second=requests.get(url, timeout=10))
+        )
+        second.start()
+        assert self.published.wait(5), 'the request was rejected after the slot was released'
+        with web_server.active_lock:
+            request_key = next(iter(web_server.active_requests))
+        self._acknowledge(request_key)
+        second.join(5)
+        assert responses['second'].status_code == HTTPStatus.OK
@@ -0,0 +1,106 @@
+"""Code Format Cache Testing"""
+
+# standard library
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# third-party
+import pytest
+
+# first-party
+from tcex_cli.cli.spec_tool.code_format_cache import CodeFormatCache
+
+CANONICAL_CODE = '"""App Inputs"""\n\nfrom pydantic import validator\nimport json\n'
+LONG_CODE = f'x = {"1" * 120}\n'
+
+
+class TestCodeFormatCache:
+    """Code Format Cache Testing."""
+
+    calls: list[str]
+
+    @pytest.fixture
+    def format_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> CodeFormatCache:
+        """Return a format cache with a fake CodeOperation that records the formatted code.
+
+        Args:
+            monkeypatch: Pytest fixture for patching the CodeOperation module.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        # an App directory without isort settings
+        monkeypatch.chdir(tmp_path)
+
+        self.calls = []
+
+        def format_code(code: str) -> str:
+            self.calls.append(code)
+            return f'# formatted\n{code}'
+
+        monkeypatch.setitem(
+            sys.modules,
+            'tcex_cli.util.code_operation',
+            SimpleNamespace(CodeOperation=SimpleNamespace(format_code=format_code)),
+        )
+        return CodeFormatCache(tmp_path / 'format_cache', max_entries=2)
+
+    def test_canonical(self, format_cache: CodeFormatCache):
+        """Test that canonical code is only sorted by isort, without running black.
+
+        Args:
+            format_cache: Pytest fixture for the format cache.
+        """
+        assert format_cache.is_canonical(CANONICAL_CODE)
+        assert format_cache.format_code(CANONICAL_CODE) == (
+            '"""App Inputs"""\n\nimport json\n\nfrom pydantic import validator\n'
+        )
+        assert self.calls == []
+
+    def test_not_canonical(self, format_cache: CodeFormatCache):
+        """Test that code with long lines or trailing whitespace is formatted with black.
+
+        Args:
+            format_cache: Pytest fixture for the format cache.
+        """
+        assert not format_cache.is_canonical('x = 1 \n')
+        assert not format_cache.is_canonical(LONG_CODE)
+        assert format_cache.format_code(LONG_CODE) == f'# formatted\n{LONG_CODE}'
+        assert self.calls == [LONG_CODE]
+
+    def test_hit(self, format_cache: CodeFormatCache):
+        """Test that formatted code is read from the cache for the same unformatted code.
+
+        Args:
+            format_cache: Pytest fixture for the format cache.
+        """
+        formatted = format_cache.format_code(LONG_CODE)
+
+        assert format_cache.format_code(LONG_CODE) == formatted
+        assert self.calls == [LONG_CODE]
+        assert len(list(format_cache.cache_path.glob('*.py'))) == 1
+
+    def test_miss_settings_changed(self, format_cache: CodeFormatCache, tmp_path: Path):
+        """Test that a change to the App isort settings formats the code again.
+
+        Args:
+            format_cache: Pytest fixture for the format cache.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        format_cache.format_code(LONG_CODE)
+        (tmp_path / 'pyproject.toml').write_text('[tool.isort]\nline_length = 100\n')
+        new_cache = CodeFormatCache(format_cache.cache_path)
+
+        new_cache.format_code(LONG_CODE)
+
+        assert self.calls == [LONG_CODE, LONG_CODE]
+
+    def test_prune(self, format_cache: CodeFormatCache):
+        """Test that only the max entries are kept in the cache.
+
+        Args:
+            format_cache: Pytest fixture for the format cache.
+        """
+        for index in range(4):
+            format_cache.format_code(f'{LONG_CODE}y = {index}\n')
+
+        assert len(list(format_cache.cache_path.glob('*.py'))) == 2  # noqa: PLR2004
@@ -0,0 +1,105 @@
+"""Spec Tool Bulk Testing"""
+
+# standard library
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+import typer
+from typer.testing import CliRunner
+
+# first-party
+from tcex_cli.cli.spec_tool import spec_tool
+from tcex_cli.cli.spec_tool.spec_tool_bulk import SpecToolBulk
+
+# get instance of typer CliRunner for test case
+runner = CliRunner()
+
+
+class TestSpecToolBulk:
+    """Spec Tool Bulk Testing."""
+
+    @pytest.fixture
+    def bulk(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Return a mock for the bulk runner used by the spec-tool command.
+
+        Args:
+            monkeypatch: Pytest fixture for patching.
+        """
+        bulk = MagicMock()
+        bulk.return_value.run.return_value = [MagicMock()]
+        monkeypatch.setattr(spec_tool, 'SpecToolBulk', bulk)
+        return bulk
+
+    @staticmethod
+    def _invoke(args: list[str]):
+        """Invoke the spec-tool command.
+
+        Args:
+            args: CLI arguments to pass to the spec-tool command.
+        """
+        app = typer.Typer()
+        app.command()(spec_tool.command)
+        return runner.invoke(app, args)
+
+    def test_apps_no_generators(self, bulk: MagicMock):
+        """Test that --apps without a file option fails instead of generating nothing.
+
+        Args:
+            bulk: Pytest fixture for the bulk runner.
+        """
+        result = self._invoke(['--apps', 'apps/*'])
+
+        assert result.exit_code == 1
+        assert '--all' in result.stdout
+        bulk.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ('args', 'generators'),
+        [
+            (
+                ['--all'],
+                [
+                    'install.json',
+                    'layout.json',
+                    'job.json',
+                    'tcex.json',
+                    'app_inputs.py',
+                    'README.md',
+                ],
+            ),
+            (['--install-json', '--readme-md'], ['install.json', 'README.md']),
+        ],
+    )
+    def test_apps_generators(self, args: list[str], bulk: MagicMock, generators: list[str]):
+        """Test that the selected generators are run for the Apps.
+
+        Args:
+            args: The file options.
+            bulk: Pytest fixture for the bulk runner.
+            generators: The expected generators.
+        """
+        result = self._invoke(['--apps', 'apps/*', '--jobs', '2', *args])
+
+        assert result.exit_code == 0, result.stdout
+        bulk.assert_called_once_with('apps/*', generators, incremental=False, jobs=2)
+        bulk.return_value.render.assert_called_once_with(bulk.return_value.run.return_value)
+
+    def test_app_paths(self, tmp_path: Path):
+        """Test that the App directories with an app_spec.yml are matched by the pattern.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        for app in ['apps/one', 'apps/two', 'apps/no_spec']:
+            (tmp_path / app).mkdir(parents=True)
+        (tmp_path / 'apps' / 'one' / 'app_spec.yml').touch()
+        (tmp_path / 'apps' / 'two' / 'app_spec.yml').touch()
+
+        for pattern in ['apps/*', 'apps/*/app_spec.yml']:
+            bulk = SpecToolBulk(pattern, ['install.json'], base_path=tmp_path)
+            assert bulk.app_paths == [
+                (tmp_path / 'apps' / 'one').resolve(),
+                (tmp_path / 'apps' / 'two').resolve(),
+            ]
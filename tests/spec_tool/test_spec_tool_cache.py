@@ -0,0 +1,207 @@
+"""Spec Tool Cache Testing"""
+
+# standard library
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+from pydantic import BaseModel
+
+# first-party
+from tcex_cli.cli.spec_tool.spec_tool_cache import GENERATOR_INPUTS, SpecToolCache
+from tcex_cli.cli.spec_tool.spec_tool_cli import SpecToolCli
+from tcex_cli.render.render import Render
+
+# the (generator, spec field) and (generator, file) inputs listed for every generator
+SPEC_INPUTS = [(g, f) for g, i in GENERATOR_INPUTS.items() for f in i['spec'] or []]
+FILE_INPUTS = [(g, f) for g, i in GENERATOR_INPUTS.items() for f in i['files'] or []]
+
+
+class SpecModel(BaseModel):
+    """App spec model with the fields used by the generators."""
+
+    inputs: Any = None
+    is_feed_app: Any = None
+    organization: Any = None
+    outputs: Any = None
+    package_name: Any = None
+    program_version: Any = None
+    release_notes: Any = None
+    requires_layout: Any = None
+
+
+class TestSpecToolCache:
+    """Spec Tool Cache Testing."""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> SpecToolCache:
+        """Return a cache for an App with an app_spec.yml and the generated files.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        for filename in ['app_spec.yml', 'app_inputs.py', 'install.json', 'layout.json']:
+            (tmp_path / filename).write_text(f'{filename}\n', encoding='utf-8')
+        (tmp_path / 'tcex.json').write_text('tcex.json\n', encoding='utf-8')
+        return SpecToolCache(tmp_path / 'app_spec.yml', tmp_path)
+
+    @pytest.mark.parametrize(('generator', 'field'), SPEC_INPUTS)
+    def test_input_digest_spec_field(self, cache: SpecToolCache, generator: str, field: str):
+        """Test that a change to any listed app_spec.yml field invalidates the generator.
+
+        Args:
+            cache: Pytest fixture for the spec tool cache.
+            generator: The generator name.
+            field: The app_spec.yml field the generator depends on.
+        """
+        model = SpecModel()
+        digest = cache.input_digest(generator, model)
+
+        assert cache.input_digest(generator, model.copy(update={field: 'changed'})) != digest
+        # fields that are not listed do not invalidate the generator
+        assert cache.input_digest(generator, model.copy(update={'release_notes': ['1']})) == digest
+
+    @pytest.mark.parametrize(
+        'generator', [g for g, i in GENERATOR_INPUTS.items() if i['spec'] is None]
+    )
+    def test_input_digest_spec_file(self, cache: SpecToolCache, generator: str):
+        """Test that generators using the entire app_spec.yml are invalidated by any change.
+
+        Args:
+            cache: Pytest fixture for the spec tool cache.
+            generator: The generator name.
+        """
+        digest = cache.input_digest(generator, SpecModel())
+
+        cache.app_spec_file.write_text('app_spec.yml changed\n', encoding='utf-8')
+        assert cache.input_digest(generator, SpecModel()) != digest
+
+    @pytest.mark.parametrize(('generator', 'filename'), FILE_INPUTS)
+    def test_input_digest_file(self, cache: SpecToolCache, generator: str, filename: str):
+        """Test that a change to, or the removal of, any listed file invalidates the generator.
+
+        Args:
+            cache: Pytest fixture for the spec tool cache.
+            generator: The generator name.
+            filename: The App file the generator depends on.
+        """
+        model = SpecModel()
+        digest = cache.input_digest(generator, model)
+
+        (cache.app_path / filename).write_text(f'{filename} changed\n', encoding='utf-8')
+        changed = cache.input_digest(generator, model)
+        assert changed != digest
+
+        (cache.app_path / filename).unlink()
+        assert cache.input_digest(generator, model) not in (digest, changed)
+
+    def test_is_current(self, cache: SpecToolCache):
+        """Test that a recorded generator is current until its inputs or outputs change.
+
+        Args:
+            cache: Pytest fixture for the spec tool cache.
+        """
+        model = SpecModel(package_name='tcpb_app')
+        digest = cache.input_digest('tcex.json', model)
+        assert cache.is_current('tcex.json', digest) is False
+
+        cache.record('tcex.json', digest, ['tcex.json'])
+        cache.save()
+
+        # the state is loaded from the state file
+        cache = SpecToolCache(cache.app_spec_file, cache.app_path)
+        assert cache.is_current('tcex.json', digest) is True
+        assert cache.is_current('tcex.json', cache.input_digest('layout.json', model)) is False
+
+        # a modified output is regenerated
+        (cache.app_path / 'tcex.json').write_text('edited\n', encoding='utf-8')
+        assert cache.is_current('tcex.json', digest) is False
+
+    def test_load_version_mismatch(self, cache: SpecToolCache):
+        """Test that a state file written by another version (or not JSON) is discarded.
+
+        Args:
+            cache: Pytest fixture for the spec tool cache.
+        """
+        cache.state_file.parent.mkdir()
+        cache.state_file.write_text(
+            '{"version": "0.0.0", "generators": {"tcex.json": {}}}', encoding='utf-8'
+        )
+        assert SpecToolCache(cache.app_spec_file, cache.app_path).state == {}
+
+        cache.state_file.write_text('not json', encoding='utf-8')
+        assert SpecToolCache(cache.app_spec_file, cache.app_path).state == {}
+
+
+class TestWriteAppFile:
+    """Spec Tool write_app_file Testing."""
+
+    @pytest.fixture
+    def prompt(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Return a mock for the overwrite prompt.
+
+        Args:
+            monkeypatch: Pytest fixture for patching.
+        """
+        prompt = MagicMock()
+        monkeypatch.setattr(Render, 'prompt', prompt, raising=False)
+        return prompt
+
+    @pytest.fixture
+    def spec_tool(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> SpecToolCli:
+        """Return a spec tool that does not overwrite files without a prompt.
+
+        Args:
+            monkeypatch: Pytest fixture for patching.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        monkeypatch.chdir(tmp_path)
+
+        # the App spec is not required, so __init__ is not called
+        spec_tool = SpecToolCli.__new__(SpecToolCli)
+        spec_tool.accent = 'dark_orange'
+        spec_tool.overwrite = False
+        spec_tool.summary_data = {}
+        return spec_tool
+
+    def test_identical_contents(self, prompt: MagicMock, spec_tool: SpecToolCli):
+        """Test that a file with identical contents is not written or prompted for.
+
+        Args:
+            prompt: Pytest fixture for the overwrite prompt.
+            spec_tool: Pytest fixture for the spec tool.
+        """
+        app_file = Path('tcex.json')
+        app_file.write_text('{}\n', encoding='utf-8')
+        os.utime(app_file, ns=(0, 0))
+
+        assert spec_tool.write_app_file('tcex.json', '{}\n') is True
+        assert app_file.stat().st_mtime_ns == 0
+        assert spec_tool.summary_data == {'tcex.json': '[green]Unchanged[/green]'}
+        prompt.input.assert_not_called()
+
+    @pytest.mark.parametrize(('response', 'expected'), [('yes', '{"a": 1}\n'), ('no', '{}\n')])
+    def test_changed_contents(
+        self,
+        prompt: MagicMock,
+        spec_tool: SpecToolCli,
+        response: str,
+        expected: str,
+    ):
+        """Test that a file with changed contents is only written if the overwrite is confirmed.
+
+        Args:
+            prompt: Pytest fixture for the overwrite prompt.
+            spec_tool: Pytest fixture for the spec tool.
+            response: The response to the overwrite prompt.
+            expected: The expected file contents.
+        """
+        app_file = Path('tcex.json')
+        app_file.write_text('{}\n', encoding='utf-8')
+        prompt.input.return_value = response
+
+        assert spec_tool.write_app_file('tcex.json', '{"a": 1}\n') is (response == 'yes')
+        assert app_file.read_text(encoding='utf-8') == expected
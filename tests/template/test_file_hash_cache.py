@@ -0,0 +1,202 @@
+"""File Hash Cache Testing"""
+
+# standard library
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# third-party
+import pytest
+
+# first-party
+from tcex_cli.cli.template.file_hash_cache import FileHashCache
+
+
+class TestFileHashCache:
+    """File Hash Cache Testing."""
+
+    hashed: list[Path]
+
+    @pytest.fixture
+    def app_file(self, tmp_path: Path) -> Path:
+        """Return a file modified outside of the racy window.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        app_file = tmp_path / 'app.py'
+        app_file.write_text('print("one")\n', encoding='utf-8')
+        mtime = time.time() - 60
+        os.utime(app_file, (mtime, mtime))
+        return app_file
+
+    @pytest.fixture
+    def cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FileHashCache:
+        """Return a hash cache that records the files that are hashed.
+
+        Args:
+            monkeypatch: Pytest fixture for patching.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        self.hashed = []
+        hash_ = FileHashCache._hash  # noqa: SLF001
+
+        def _hash(path: Path, algorithm: str) -> str:
+            self.hashed.append(path)
+            return hash_(path, algorithm)
+
+        monkeypatch.setattr(FileHashCache, '_hash', staticmethod(_hash))
+        return FileHashCache(tmp_path / 'cache' / 'file_hash_cache.json')
+
+    def test_hash_cached(self, app_file: Path, cache: FileHashCache):
+        """Test that an unchanged file is only hashed once, including after a reload.
+
+        Args:
+            app_file: Pytest fixture for the file to hash.
+            cache: Pytest fixture for the hash cache.
+        """
+        expected = hashlib.sha256(b'print("one")\n').hexdigest()
+
+        assert cache.hash(app_file) == expected
+        assert cache.hash(app_file) == expected
+        cache.save()
+        assert FileHashCache(cache.cache_file).hash(app_file) == expected
+
+        assert self.hashed == [app_file]
+
+    def test_hash_mtime_changed(self, app_file: Path, cache: FileHashCache):
+        """Test that a file is hashed again when its modified time changes.
+
+        Args:
+            app_file: Pytest fixture for the file to hash.
+            cache: Pytest fixture for the hash cache.
+        """
+        cache.hash(app_file)
+
+        # same size, different contents and modified time
+        app_file.write_text('print("two")\n', encoding='utf-8')
+        mtime = time.time() - 30
+        os.utime(app_file, (mtime, mtime))
+
+        assert cache.hash(app_file) == hashlib.sha256(b'print("two")\n').hexdigest()
+        assert self.hashed == [app_file, app_file]
+
+    def test_hash_size_changed(self, app_file: Path, cache: FileHashCache):
+        """Test that a file is hashed again when its size changes with the same modified time.
+
+        Args:
+            app_file: Pytest fixture for the file to hash.
+            cache: Pytest fixture for the hash cache.
+        """
+        cache.hash(app_file)
+        stat = app_file.stat()
+
+        app_file.write_text('print("three")\n', encoding='utf-8')
+        os.utime(app_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache.hash(app_file) == hashlib.sha256(b'print("three")\n').hexdigest()
+        assert self.hashed == [app_file, app_file]
+
+    def test_hash_racy_window(self, cache: FileHashCache, tmp_path: Path):
+        """Test that a recently modified file is hashed, but not cached.
+
+        Args:
+            cache: Pytest fixture for the hash cache.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        app_file = tmp_path / 'recent.py'
+        app_file.write_text('print("recent")\n', encoding='utf-8')
+
+        assert cache.hash(app_file) == cache.hash(app_file)
+        assert self.hashed == [app_file, app_file]
+        assert cache.dirty is False
+
+    def test_hash_missing_file(self, cache: FileHashCache, tmp_path: Path):
+        """Test that a file that does not exist has no hash.
+
+        Args:
+            cache: Pytest fixture for the hash cache.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        assert cache.hash(tmp_path / 'missing.py') is None
+
+    @pytest.mark.parametrize(
+        'contents',
+        [
+            '{"sha256:/app.py": ',
+            '["sha256:/app.py"]',
+            '{"sha256:/app.py": {"hash": "abc"}, "sha256:/lib.py": "abc"}',
+            b'\xff\xfe',
+        ],
+    )
+    def test_load_unreadable(self, app_file: Path, contents: str | bytes, tmp_path: Path):
+        """Test that an unreadable or malformed cache file is treated as empty.
+
+        Args:
+            app_file: Pytest fixture for the file to hash.
+            contents: The contents of the cache file.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        cache_file = tmp_path / 'file_hash_cache.json'
+        if isinstance(contents, bytes):
+            cache_file.write_bytes(contents)
+        else:
+            cache_file.write_text(contents, encoding='utf-8')
+
+        cache = FileHashCache(cache_file)
+
+        assert cache.entries == {}
+        assert cache.hash(app_file) is not None
+
+    def test_load_directory(self, tmp_path: Path):
+        """Test that a cache file that can not be read (a directory) is treated as empty.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        assert FileHashCache(tmp_path).entries == {}
+
+    def test_save(self, app_file: Path, cache: FileHashCache, tmp_path: Path):
+        """Test that the cache file is replaced, dropping the entries of removed files.
+
+        Args:
+            app_file: Pytest fixture for the file to hash.
+            cache: Pytest fixture for the hash cache.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        removed_file = tmp_path / 'removed.py'
+        removed_file.write_text('print("removed")\n', encoding='utf-8')
+        os.utime(removed_file, (0, 0))
+        cache.hash_many([app_file, removed_file])
+        removed_file.unlink()
+
+        cache.save()
+
+        entries = json.loads(cache.cache_file.read_text(encoding='utf-8'))
+        assert list(entries) == [f'sha256:{app_file.resolve()}']
+        assert list(cache.cache_file.parent.glob('*.tmp')) == []
+        assert cache.dirty is False
+
+    def test_save_failed(
+        self, app_file: Path, cache: FileHashCache, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a failed save keeps the previous cache file and removes the temp file.
+
+        Args:
+            app_file: Pytest fixture for the file to hash.
+            cache: Pytest fixture for the hash cache.
+            monkeypatch: Pytest fixture for patching.
+        """
+        cache.cache_file.parent.mkdir(parents=True)
+        cache.cache_file.write_text('{}', encoding='utf-8')
+        cache.hash(app_file)
+        monkeypatch.setattr(Path, 'replace', MagicMock(side_effect=OSError('read-only')))
+
+        cache.save()
+
+        assert cache.cache_file.read_text(encoding='utf-8') == '{}'
+        assert list(cache.cache_file.parent.glob('*.tmp')) == []
+        assert cache.dirty is True
@@ -0,0 +1,116 @@
+"""HTTP Cache Testing"""
+
+# standard library
+import http.server
+import threading
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+from typing import ClassVar
+
+# third-party
+import pytest
+from requests import Session
+
+# first-party
+from tcex_cli.cli.template.http_cache import ConditionalCacheAdapter
+from tcex_cli.cli.template.template_cache_db import TemplateCacheDb
+
+
+class MetadataRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve a JSON body with an ETag, answering a matching If-None-Match with a 304."""
+
+    etag = '"v1"'
+    requests: ClassVar[list[tuple[str, str | None]]] = []
+
+    def do_GET(self):  # noqa: N802
+        """Handle GET method."""
+        if_none_match = self.headers.get('If-None-Match')
+        self.requests.append((self.path, if_none_match))
+        if if_none_match == self.etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', self.etag)
+            self.end_headers()
+            return
+
+        body = b'[{"name": "template.yaml"}]'
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Do not write access logs to stderr."""
+
+
+@pytest.fixture
+def server() -> Iterator[http.server.HTTPServer]:
+    """Start the metadata server on a free port.
+
+    Yields:
+        The running HTTP server.
+    """
+    MetadataRequestHandler.requests = []
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), MetadataRequestHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHttpCache:
+    """HTTP Cache Testing."""
+
+    @staticmethod
+    def _session(tmp_path: Path) -> Session:
+        """Return a session with the conditional cache adapter mounted.
+
+        Args:
+            tmp_path: The directory for the cache database.
+        """
+        session = Session()
+        db = TemplateCacheDb(tmp_path / 'template_cache.db')
+        session.mount('http://', ConditionalCacheAdapter(db))
+        return session
+
+    def test_not_modified(self, server: http.server.HTTPServer, tmp_path: Path):
+        """Test that a 304 response is answered with the cached body.
+
+        Args:
+            server: Pytest fixture that starts the metadata server.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        url = f'http://127.0.0.1:{server.server_address[1]}/repos/user/templates/contents/playbook'
+        session = self._session(tmp_path)
+
+        first = session.get(url, timeout=5)
+        second = session.get(url, timeout=5)
+
+        assert first.status_code == second.status_code == HTTPStatus.OK
+        assert second.json() == first.json() == [{'name': 'template.yaml'}]
+        assert second.headers['Content-Type'] == 'application/json'
+        assert [if_none_match for _, if_none_match in MetadataRequestHandler.requests] == [
+            None,
+            '"v1"',
+        ]
+
+    def test_not_metadata(self, server: http.server.HTTPServer, tmp_path: Path):
+        """Test that responses for template files are not cached.
+
+        Args:
+            server: Pytest fixture that starts the metadata server.
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        url = f'http://127.0.0.1:{server.server_address[1]}/user/templates/main/playbook/app.py'
+        session = self._session(tmp_path)
+
+        session.get(url, timeout=5)
+        session.get(url, timeout=5)
+
+        assert [if_none_match for _, if_none_match in MetadataRequestHandler.requests] == [
+            None,
+            None,
+        ]
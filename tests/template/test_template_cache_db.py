@@ -0,0 +1,45 @@
+"""Template Cache DB Testing"""
+
+# standard library
+import json
+from pathlib import Path
+
+# first-party
+from tcex_cli.cli.template.template_cache_db import TemplateCacheDb
+
+
+class TestTemplateCacheDb:
+    """Template Cache DB Testing."""
+
+    def test_migrate_legacy_file(self, tmp_path: Path):
+        """Test that the TinyDB cache file is imported and then removed.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        config = {'name': 'basic', 'type': 'playbook', 'version': '1.0.0'}
+        legacy_file = tmp_path / 'tcex.json'
+        # TinyDB stores all documents in the "_default" table keyed by the document id
+        legacy_file.write_text(
+            json.dumps({'_default': {'1': {'sha': 'abc123'}, '2': config}}), encoding='utf-8'
+        )
+
+        db = TemplateCacheDb(tmp_path / 'template_cache.db', legacy_file=legacy_file)
+
+        assert db.get_sha('abc123') == 'abc123'
+        assert db.get_config('playbook', 'basic') == config
+        assert not legacy_file.exists()
+
+    def test_migrate_legacy_file_invalid(self, tmp_path: Path):
+        """Test that a TinyDB cache file that can not be parsed is kept.
+
+        Args:
+            tmp_path: Pytest fixture for a temporary directory.
+        """
+        legacy_file = tmp_path / 'tcex.json'
+        legacy_file.write_text('{"_default": {', encoding='utf-8')
+
+        db = TemplateCacheDb(tmp_path / 'template_cache.db', legacy_file=legacy_file)
+
+        assert db.get_config('playbook', 'basic') is None
+        assert legacy_file.read_text(encoding='utf-8') == '{"_default": {'